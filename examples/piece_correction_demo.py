@@ -71,21 +71,23 @@ def main():
         },
     ]
     
-    for i, corr in enumerate(corrections, 1):
-        print(f"\nCorrection {i}:")
-        print(f"  Square: {corr['square'].upper()}")
-        print(f"  Original prediction: {corr['original'].name}")
-        print(f"  Confidence: {corr['confidence']:.1%}")
-        print(f"  User correction: {corr['corrected'].name}")
-        print(f"  Note: {corr['description']}")
-        
-        manager.add_feedback(
-            square_name=corr['square'],
-            original_prediction=corr['original'],
-            original_confidence=corr['confidence'],
-            user_correction=corr['corrected']
-        )
-        print(f"  ✓ Feedback saved")
+    # Label the whole batch with a single write to the feedback file
+    with manager.batch():
+        for i, corr in enumerate(corrections, 1):
+            print(f"\nCorrection {i}:")
+            print(f"  Square: {corr['square'].upper()}")
+            print(f"  Original prediction: {corr['original'].name}")
+            print(f"  Confidence: {corr['confidence']:.1%}")
+            print(f"  User correction: {corr['corrected'].name}")
+            print(f"  Note: {corr['description']}")
+            
+            manager.add_feedback(
+                square_name=corr['square'],
+                original_prediction=corr['original'],
+                original_confidence=corr['confidence'],
+                user_correction=corr['corrected']
+            )
+            print(f"  ✓ Feedback saved")
     
     print()
     print("-" * 60)
@@ -148,6 +150,8 @@ def main():
     print(f"Feedback saved to: {feedback_file}")
     print("This data can be used to train or fine-tune recognition models.")
     print("=" * 60)
+    
+    manager.close()
 
 
 if __name__ == '__main__':
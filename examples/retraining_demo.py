@@ -145,24 +145,26 @@ def demo_feedback_collection():
         },
     ]
     
-    for i, corr in enumerate(corrections, 1):
-        print(f"\nCorrection {i}:")
-        print(f"  Square: {corr['square'].upper()}")
-        print(f"  Original: {corr['original'].name}")
-        print(f"  Confidence: {corr['confidence']:.1%}")
-        print(f"  Corrected: {corr['corrected'].name}")
-        print(f"  Orientation: {corr['orientation']}")
-        print(f"  Note: {corr['note']}")
-        
-        manager.add_feedback(
-            square_name=corr['square'],
-            original_prediction=corr['original'],
-            original_confidence=corr['confidence'],
-            user_correction=corr['corrected'],
-            square_image=corr['image'],
-            board_orientation=corr['orientation']
-        )
-        print(f"  ✓ Feedback saved with image data")
+    # Label the whole batch with a single write to the feedback file
+    with manager.batch():
+        for i, corr in enumerate(corrections, 1):
+            print(f"\nCorrection {i}:")
+            print(f"  Square: {corr['square'].upper()}")
+            print(f"  Original: {corr['original'].name}")
+            print(f"  Confidence: {corr['confidence']:.1%}")
+            print(f"  Corrected: {corr['corrected'].name}")
+            print(f"  Orientation: {corr['orientation']}")
+            print(f"  Note: {corr['note']}")
+            
+            manager.add_feedback(
+                square_name=corr['square'],
+                original_prediction=corr['original'],
+                original_confidence=corr['confidence'],
+                user_correction=corr['corrected'],
+                square_image=corr['image'],
+                board_orientation=corr['orientation']
+            )
+            print(f"  ✓ Feedback saved with image data")
     
     print()
     print("-" * 70)
@@ -279,6 +281,8 @@ def main():
     print()
     print(f"Feedback data saved to: {manager.feedback_file}")
     print()
+    
+    manager.close()
 
 
 if __name__ == '__main__':
@@ -10,6 +10,10 @@ from typing import List, Optional, Tuple, Dict
 import logging
 
 
+# Reference board for is_starting_position; compared, never modified
+_STARTING_BOARD = chess.Board()
+
+
 class BoardManager:
     """
     Manages the chess board state and provides methods for move validation,
@@ -62,6 +66,19 @@ class BoardManager:
         """
         return self.board.fen()
 
+    def is_starting_position(self) -> bool:
+        """
+        Check whether the board is in the standard starting position.
+        
+        Equivalent to comparing get_fen() with chess.STARTING_FEN, but
+        compares the board bitboards instead of building the FEN string.
+        
+        Returns:
+            bool: True if the position (including side to move, castling
+                rights and move counters) is the starting position.
+        """
+        return self.board == _STARTING_BOARD
+
     def set_position_from_fen(self, fen: str) -> bool:
         """
         Set the board position from a FEN string.
@@ -81,6 +98,37 @@ class BoardManager:
             self.logger.error(f"Invalid FEN string: {fen}. Error: {e}")
             return False
 
+    def set_piece_map(self, piece_map: Dict[chess.Square, chess.Piece]) -> None:
+        """
+        Set the board position directly from a piece placement.
+        
+        The rest of the game state is the same as for a FEN ending in
+        "w KQkq - 0 1": white to move, all castling rights, no en passant.
+        
+        Args:
+            piece_map (Dict[chess.Square, chess.Piece]): Dictionary of
+                square -> piece.
+        """
+        self.board = chess.Board()
+        self.board.set_piece_map(piece_map)
+        self.move_history.clear()
+        self.logger.info(f"Board position set from piece map: {self.board.board_fen()}")
+
+    def set_piece_at(self, square: chess.Square, piece: Optional[chess.Piece]) -> None:
+        """
+        Place a piece on a single square, leaving the rest of the position as is.
+        
+        Args:
+            square (chess.Square): The square to change (0-63).
+            piece (Optional[chess.Piece]): The piece to place, or None to empty
+                the square.
+        """
+        if piece is None:
+            self.board.remove_piece_at(square)
+        else:
+            self.board.set_piece_at(square, piece)
+        self.move_history.clear()
+
     def get_piece_at(self, square: chess.Square) -> Optional[chess.Piece]:
         """
         Get the piece at a specific square.
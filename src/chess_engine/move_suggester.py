@@ -6,7 +6,7 @@ suggesting best moves, and explaining why moves are good.
 """
 
 import chess
-from typing import List, Tuple, Optional, Dict
+from typing import Callable, List, Tuple, Optional, Dict
 import logging
 from src.chess_engine.board_manager import BoardManager
 
@@ -247,12 +247,19 @@ class MoveSuggester:
             tactical_themes=tactical_themes
         )
 
-    def get_best_moves(self, num_moves: int = 3) -> List[MoveEvaluation]:
+    def get_best_moves(
+        self,
+        num_moves: int = 3,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> List[MoveEvaluation]:
         """
         Get the best moves in the current position with explanations.
         
         Args:
             num_moves (int): Number of best moves to return.
+            should_stop (Optional[Callable[[], bool]]): Checked before each move
+                is analyzed; when it returns True the search stops early and
+                the best of the moves analyzed so far are returned.
             
         Returns:
             List[MoveEvaluation]: List of best moves with evaluations.
@@ -267,6 +274,9 @@ class MoveSuggester:
         # Analyze all legal moves
         move_evaluations = []
         for move in legal_moves:
+            if should_stop is not None and should_stop():
+                self.logger.info("Move search stopped early")
+                break
             evaluation = self.analyze_move(move)
             move_evaluations.append(evaluation)
         
@@ -7,9 +7,18 @@ chess boards from screenshots.
 
 import cv2
 import numpy as np
+from PIL import Image
 from typing import Tuple, Optional, List
 import logging
-from PIL import Image
+import threading
+
+
+# Decode-time downscale factors and their imread flags, largest first
+_REDUCED_READ_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
 
 
 class BoardDetector:
@@ -36,19 +45,73 @@ class BoardDetector:
         self.logger = logging.getLogger(__name__)
         self.min_board_size = min_board_size
         self.max_board_size = max_board_size
+        
+        # Grayscale and blurred images reused by preprocess_image, allocated
+        # on first use and reallocated when the image size changes; one set
+        # per thread since detection may run off the UI thread
+        self._buffers = threading.local()
+
+    @staticmethod
+    def image_size(image_path: str) -> Optional[Tuple[int, int]]:
+        """
+        Read the image dimensions from the file header without decoding.
+        
+        Args:
+            image_path (str): Path to the image file.
+            
+        Returns:
+            Optional[Tuple[int, int]]: Tuple of (width, height), or None if
+                the header cannot be read.
+        """
+        try:
+            with Image.open(image_path) as image:
+                return image.size
+        except (OSError, ValueError):
+            return None
 
-    def load_image(self, image_path: str) -> Optional[np.ndarray]:
+    @staticmethod
+    def reduced_read_flag(image_size: Optional[Tuple[int, int]],
+                          target_max_side: int) -> int:
+        """
+        Choose the imread flag that decodes an image closest to a target size.
+        
+        The largest downscale factor that keeps the long side at or above
+        target_max_side is used; JPEG decodes straight to that size.
+        
+        Args:
+            image_size (Optional[Tuple[int, int]]): Width and height of the file.
+            target_max_side (int): Smallest acceptable long side after decoding.
+            
+        Returns:
+            int: Flag for cv2.imread or cv2.imdecode.
+        """
+        if image_size is not None:
+            max_side = max(image_size)
+            for factor, flag in _REDUCED_READ_FLAGS:
+                if max_side // factor >= target_max_side:
+                    return flag
+        return cv2.IMREAD_COLOR
+
+    def load_image(self, image_path: str,
+                   target_max_side: Optional[int] = None) -> Optional[np.ndarray]:
         """
         Load an image from file.
         
         Args:
             image_path (str): Path to the image file.
+            target_max_side (Optional[int]): Working size of the caller. If
+                given, images of at least twice this size are decoded at
+                1/2, 1/4 or 1/8 resolution, never below the target.
             
         Returns:
             Optional[np.ndarray]: Loaded image as numpy array, or None if failed.
         """
+        flag = cv2.IMREAD_COLOR
+        if target_max_side is not None:
+            flag = self.reduced_read_flag(self.image_size(image_path), target_max_side)
+        
         try:
-            image = cv2.imread(image_path)
+            image = cv2.imread(image_path, flag)
             if image is None:
                 self.logger.error(f"Failed to load image: {image_path}")
                 return None
@@ -59,28 +122,53 @@ class BoardDetector:
             self.logger.error(f"Error loading image: {e}")
             return None
 
-    def preprocess_image(self, image: np.ndarray) -> np.ndarray:
+    def _preprocess_buffers(self, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the scratch images used by preprocess_image.
+        
+        Args:
+            shape (Tuple[int, int]): Height and width of the image.
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (gray, blurred) buffers of the given shape.
+        """
+        buffers = self._buffers
+        gray_buf = getattr(buffers, 'gray', None)
+        if gray_buf is None or gray_buf.shape != shape:
+            buffers.gray = np.empty(shape, dtype=np.uint8)
+            buffers.blurred = np.empty(shape, dtype=np.uint8)
+        return buffers.gray, buffers.blurred
+
+    def preprocess_image(self, image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Preprocess the image for board detection.
         
+        The intermediate grayscale and blurred images are written into
+        buffers reused across calls; only the result is newly allocated.
+        
         Args:
             image (np.ndarray): Input image.
+            out (Optional[np.ndarray]): uint8 array of the image's height and
+                width to write the result into.
             
         Returns:
             np.ndarray: Preprocessed image.
         """
+        gray, blurred = self._preprocess_buffers(image.shape[:2])
+        
         # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
         
         # Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=blurred)
         
         # Apply adaptive thresholding
         thresh = cv2.adaptiveThreshold(
             blurred, 255,
             cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
             cv2.THRESH_BINARY,
-            11, 2
+            11, 2,
+            dst=out
         )
         
         return thresh
@@ -149,18 +237,20 @@ class BoardDetector:
         
         return image[y:y2, x:x2]
 
-    def divide_into_squares(
-        self,
-        board_image: np.ndarray
-    ) -> List[List[np.ndarray]]:
+    def square_grid(self, board_image: np.ndarray) -> np.ndarray:
         """
-        Divide a board image into 8x8 squares.
+        View a board image as an 8x8 grid of squares.
+        
+        The grid is a single strided view of the board image, without
+        copying any pixels. Pixels beyond a multiple of 8 on either side
+        are left out.
         
         Args:
             board_image (np.ndarray): Image of the chess board.
             
         Returns:
-            List[List[np.ndarray]]: 8x8 grid of square images (row, col).
+            np.ndarray: Array of shape (8, 8, square_height, square_width, ...)
+                indexed by (row, col), row 0 being rank 8.
         """
         h, w = board_image.shape[:2]
         
@@ -168,23 +258,28 @@ class BoardDetector:
         square_height = h // 8
         square_width = w // 8
         
-        squares = []
+        # Splitting the two image axes never needs a copy
+        board = board_image[:square_height * 8, :square_width * 8]
+        return board.reshape(
+            8, square_height, 8, square_width, *board_image.shape[2:]
+        ).swapaxes(1, 2)
+
+    def divide_into_squares(
+        self,
+        board_image: np.ndarray
+    ) -> List[List[np.ndarray]]:
+        """
+        Divide a board image into 8x8 squares.
         
-        # Extract each square (row by row, from rank 8 to rank 1)
-        for row in range(8):
-            row_squares = []
-            for col in range(8):
-                # Calculate coordinates
-                y1 = row * square_height
-                y2 = (row + 1) * square_height
-                x1 = col * square_width
-                x2 = (col + 1) * square_width
-                
-                # Extract square
-                square = board_image[y1:y2, x1:x2]
-                row_squares.append(square)
+        Args:
+            board_image (np.ndarray): Image of the chess board.
             
-            squares.append(row_squares)
+        Returns:
+            List[List[np.ndarray]]: 8x8 grid of square images (row, col),
+                views into square_grid(board_image).
+        """
+        # Rows from rank 8 to rank 1
+        squares = [list(row) for row in self.square_grid(board_image)]
         
         self.logger.info("Board divided into 8x8 squares")
         return squares
@@ -192,7 +287,9 @@ class BoardDetector:
     def detect_board(
         self,
         image: np.ndarray,
-        manual_region: Optional[Tuple[int, int, int, int]] = None
+        manual_region: Optional[Tuple[int, int, int, int]] = None,
+        contours: Optional[List[np.ndarray]] = None,
+        fallback_full_image: bool = False
     ) -> Optional[Tuple[np.ndarray, List[List[np.ndarray]]]]:
         """
         Detect chess board in image and extract squares.
@@ -201,6 +298,10 @@ class BoardDetector:
             image (np.ndarray): Input image.
             manual_region (Optional[Tuple[int, int, int, int]]): 
                 Manual board region (x, y, width, height) if automatic detection fails.
+            contours (Optional[List[np.ndarray]]): Board contours already found
+                by detect_board_contours for this image, to skip recomputing them.
+            fallback_full_image (bool): Treat the whole image as the board when
+                no board contour is found, instead of returning None.
                 
         Returns:
             Optional[Tuple[np.ndarray, List[List[np.ndarray]]]]: 
@@ -214,12 +315,20 @@ class BoardDetector:
             return (board_image, squares)
         
         # Automatic detection
-        preprocessed = self.preprocess_image(image)
-        contours = self.detect_board_contours(preprocessed)
+        if contours is None:
+            preprocessed = self.preprocess_image(image)
+            contours = self.detect_board_contours(preprocessed)
         
         if not contours:
-            self.logger.warning("No board contours detected")
-            return None
+            if not fallback_full_image:
+                self.logger.warning("No board contours detected")
+                return None
+            
+            self.logger.info("No board contours detected, using the full image")
+            height, width = image.shape[:2]
+            board_image = self.extract_board_region(image, 0, 0, width, height)
+            squares = self.divide_into_squares(board_image)
+            return (board_image, squares)
         
         # Use the largest valid contour
         largest_contour = max(contours, key=cv2.contourArea)
@@ -318,7 +427,7 @@ class BoardDetector:
             float: Average brightness (0-255).
         """
         gray = cv2.cvtColor(square_image, cv2.COLOR_BGR2GRAY)
-        return np.mean(gray)
+        return cv2.mean(gray)[0]
     
     def _detect_orientation_from_pieces(self, recognition_results: List[List[any]]) -> Optional[str]:
         """
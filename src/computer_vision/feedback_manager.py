@@ -2,63 +2,198 @@
 Feedback Manager for Piece Recognition.
 
 This module manages user feedback on piece recognition for future model training.
+Feedback is stored as an append-only JSON Lines log (one record per line) and
+transparently gzip-compressed when the feedback file name ends in ``.gz``.
+Besides feedback entries the log holds ``{"op": "supersede", ...}`` records
+marking an earlier correction of the same square image as replaced; the log
+is compacted once superseded entries dominate it.
 """
 
+import atexit
+import gzip
+import hashlib
 import json
 import logging
+import os
+import queue
+import shutil
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict
-import numpy as np
-import cv2
-import base64
+from typing import Optional, List, Dict, Tuple, Union, TYPE_CHECKING
 
-from src.computer_vision.piece_recognizer import PieceType
+import chess
 
+from src.computer_vision.piece_type import PieceType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    def _dumps_pretty(obj) -> str:
+        """Encode an object as JSON text indented by two spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    def _dumps_pretty(obj) -> str:
+        """Encode an object as JSON text indented by two spaces."""
+        return json.dumps(obj, indent=2)
+    
+    _loads = json.loads
+
+if xxhash is not None:
+    def _digest64(data) -> int:
+        """Compute a fast non-cryptographic 64-bit digest of a buffer."""
+        return xxhash.xxh3_64_intdigest(data)
+else:
+    def _digest64(data) -> int:
+        """Compute a fast non-cryptographic 64-bit digest of a buffer."""
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+# Pre-bound name <-> member maps so bulk (de)serialization avoids the enum
+# __getitem__ / .name descriptor chain on every field. Both include the
+# missing value (None) so a field converts with a single lookup.
+_NAME2PT: Dict[Optional[str], Optional[PieceType]] = {None: None, '': None, **PieceType.__members__}
+_PT2NAME: Dict[Optional[PieceType], Optional[str]] = {None: None, **{p: p.name for p in PieceType}}
+
+# Small integer codes for statistics and training labels; 0 stands for no correction
+_PT2CODE: Dict[Optional[PieceType], int] = {None: 0, **{p: i for i, p in enumerate(PieceType, 1)}}
+_CODE2NAME: List[str] = ['UNKNOWN'] + [p.name for p in PieceType]
+
+# Directory of the default feedback store
+_OUTPUT_DIR = Path(__file__).parent.parent.parent / 'output'
+
+# Identity of a corrected square image: (64-bit image hash, square index)
+UniqueKey = Tuple[int, int]
+
+
+def _pack_key(key: UniqueKey) -> int:
+    """
+    Pack a unique key into one int for use as a dictionary key.
+    
+    Args:
+        key: Unique key to pack.
+        
+    Returns:
+        int: Image hash and square index in a single integer.
+    """
+    return key[0] << 6 | key[1]
+
+
+def _encode_key(key: UniqueKey) -> list:
+    """
+    Convert a unique key to its JSON form.
+    
+    Args:
+        key: Unique key to serialize.
+        
+    Returns:
+        list: ``[hash as 16 hex digits, square index]``.
+    """
+    return [f"{key[0]:016x}", key[1]]
+
+
+def _decode_key(value: Union[list, str]) -> UniqueKey:
+    """
+    Convert the JSON form of a unique key back to a key.
+    
+    Args:
+        value: ``[hex hash, square index]``, or an older ``"<hex hash>_<square name>"`` string.
+        
+    Returns:
+        UniqueKey: Decoded key.
+    """
+    if isinstance(value, str):
+        image_hash, _, square_name = value.rpartition('_')
+        return int(image_hash[:16], 16), chess.parse_square(square_name)
+    return int(value[0], 16), value[1]
+
+
+def _close_at_exit(manager_ref: 'weakref.ref[FeedbackManager]'):
+    """
+    Close a feedback manager at interpreter exit if it still exists.
+    
+    Args:
+        manager_ref: Weak reference to the manager.
+    """
+    manager = manager_ref()
+    if manager is not None:
+        manager.close()
+
+
+@dataclass(slots=True, eq=False)
 class PieceFeedback:
     """
     Data class representing user feedback on a piece recognition.
     
+    Instances use slots rather than a per-object ``__dict__`` since large
+    feedback histories keep thousands of them in memory. Equality is identity,
+    as two corrections with the same content are still distinct entries.
+    
     Attributes:
         square_name (str): Chess square name (e.g., 'e4').
         original_prediction (Optional[PieceType]): Original AI prediction.
         original_confidence (float): Original confidence score.
         user_correction (PieceType): User's correction.
-        timestamp (str): ISO format timestamp of feedback.
+        timestamp (Optional[str]): ISO format timestamp of feedback (defaults to now).
         square_image_path (Optional[str]): Path to saved square image for retraining.
         board_orientation (Optional[str]): Board orientation ('white' or 'black' facing user).
+        unique_key (Optional[UniqueKey]): Identity of the corrected square image; a newer
+            correction with the same key supersedes this one.
+        is_active (bool): False once the entry has been superseded.
     """
     
-    def __init__(
-        self,
-        square_name: str,
-        original_prediction: Optional[PieceType],
-        original_confidence: float,
-        user_correction: PieceType,
-        timestamp: Optional[str] = None,
-        square_image_path: Optional[str] = None,
-        board_orientation: Optional[str] = None
-    ):
-        """
-        Initialize a PieceFeedback instance.
-        
-        Args:
-            square_name: Chess square name.
-            original_prediction: What the model predicted.
-            original_confidence: Confidence of original prediction.
-            user_correction: What the user said it should be.
-            timestamp: Optional timestamp (defaults to now).
-            square_image_path: Optional path to square image file.
-            board_orientation: Optional board orientation ('white' or 'black').
-        """
-        self.square_name = square_name
-        self.original_prediction = original_prediction
-        self.original_confidence = original_confidence
-        self.user_correction = user_correction
-        self.timestamp = timestamp or datetime.now().isoformat()
-        self.square_image_path = square_image_path
-        self.board_orientation = board_orientation
+    square_name: str
+    original_prediction: Optional[PieceType]
+    original_confidence: float
+    user_correction: PieceType
+    timestamp: Optional[str] = None
+    square_image_path: Optional[str] = None
+    board_orientation: Optional[str] = None
+    unique_key: Optional[UniqueKey] = None
+    is_active: bool = True
+    # unique_key packed once at construction for the supersede indexes
+    _key_id: Optional[int] = field(default=None, init=False, repr=False)
+    # Compact JSON encoding of to_dict(); the serialized fields never change
+    # after construction (is_active is not part of the record)
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Fill in the timestamp for new feedback and pack the unique key."""
+        if not self.timestamp:
+            self.timestamp = datetime.now().isoformat()
+        if self.unique_key:
+            self._key_id = _pack_key(self.unique_key)
     
     def to_dict(self) -> Dict:
         """
@@ -69,14 +204,26 @@ class PieceFeedback:
         """
         return {
             'square_name': self.square_name,
-            'original_prediction': self.original_prediction.name if self.original_prediction else None,
+            'original_prediction': _PT2NAME[self.original_prediction],
             'original_confidence': self.original_confidence,
-            'user_correction': self.user_correction.name if self.user_correction else None,
+            'user_correction': _PT2NAME[self.user_correction],
             'timestamp': self.timestamp,
             'square_image_path': self.square_image_path,
-            'board_orientation': self.board_orientation
+            'board_orientation': self.board_orientation,
+            'unique_key': _encode_key(self.unique_key) if self.unique_key else None
         }
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Get the compact JSON encoding of the feedback, cached after first use.
+        
+        Returns:
+            bytes: UTF-8 encoded JSON object without trailing newline.
+        """
+        if self._json_cache is None:
+            self._json_cache = _dumps(self.to_dict())
+        return self._json_cache
+    
     @staticmethod
     def from_dict(data: Dict) -> 'PieceFeedback':
         """
@@ -88,22 +235,15 @@ class PieceFeedback:
         Returns:
             PieceFeedback: Reconstructed feedback object.
         """
-        original_pred = None
-        if data.get('original_prediction'):
-            original_pred = PieceType[data['original_prediction']]
-        
-        user_corr = None
-        if data.get('user_correction'):
-            user_corr = PieceType[data['user_correction']]
-        
         return PieceFeedback(
             square_name=data['square_name'],
-            original_prediction=original_pred,
+            original_prediction=_NAME2PT[data.get('original_prediction')],
             original_confidence=data['original_confidence'],
-            user_correction=user_corr,
+            user_correction=_NAME2PT[data.get('user_correction')],
             timestamp=data.get('timestamp'),
             square_image_path=data.get('square_image_path'),
-            board_orientation=data.get('board_orientation')
+            board_orientation=data.get('board_orientation'),
+            unique_key=_decode_key(data['unique_key']) if data.get('unique_key') else None
         )
 
 
@@ -112,7 +252,10 @@ class FeedbackManager:
     Manages collection and storage of piece recognition feedback.
     
     This class stores user corrections to piece recognition, which can
-    be used to fine-tune or retrain the recognition model.
+    be used to fine-tune or retrain the recognition model. New records are
+    appended to the feedback file by a background writer thread; call
+    ``flush()`` to wait for pending writes or ``close()`` (or use the manager
+    as a context manager) to stop the writer.
     
     Attributes:
         feedback_file (Path): Path to feedback storage file.
@@ -120,69 +263,622 @@ class FeedbackManager:
         feedback_data (List[PieceFeedback]): Current session feedback.
     """
     
-    def __init__(self, feedback_file: Optional[Path] = None):
+    # gzip level 1 encodes far faster than the disk can absorb while still
+    # shrinking the highly redundant JSON text roughly tenfold
+    COMPRESS_LEVEL = 1
+    
+    # How long the writer waits for further records before writing a batch,
+    # and the most records it will coalesce into a single write
+    WRITE_COALESCE_SECONDS = 0.05
+    MAX_WRITE_BATCH = 256
+    
+    # Legacy JSON array files above this size are parsed incrementally with
+    # ijson (when installed) instead of being read into memory as a whole
+    STREAM_LOAD_BYTES = 50 * 1024 * 1024
+    
+    # File names of the default store in the output directory, and of the
+    # plain JSON store earlier versions kept there
+    DEFAULT_FEEDBACK_NAME = 'piece_recognition_feedback.jsonl.gz'
+    LEGACY_FEEDBACK_NAME = 'piece_recognition_feedback.json'
+    
+    # Rewrite the log once more than this fraction of its entries is superseded
+    COMPACT_RATIO = 0.5
+    
+    # Formats square images can be stored in, and the quality used for the
+    # lossy ones. PNG stays the default so stored tiles are exact; WebP
+    # encodes several times faster and produces much smaller files.
+    IMAGE_FORMATS = ('png', 'webp', 'jpg')
+    IMAGE_QUALITY = 90
+    
+    # How square images are identified: 'exact' only matches identical images
+    # (compared on a fixed grid of about 32x32 sampled pixels); 'phash' also
+    # supersedes near-duplicate re-captures of the same square, but every
+    # flat square hashes alike, so it is opt-in
+    IMAGE_HASHES = ('exact', 'phash')
+    
+    # Square images whose perceptual hashes differ in at most this many bits
+    # are treated as captures of the same square
+    HAMMING_THRESHOLD = 2
+    
+    def __init__(
+        self,
+        feedback_file: Optional[Path] = None,
+        image_format: str = 'png',
+        image_hash: str = 'exact'
+    ):
         """
         Initialize the FeedbackManager.
         
         Args:
-            feedback_file: Path to feedback JSON file. If None, uses default.
+            feedback_file: Path to feedback JSON Lines file. If None, uses default.
+                A ``.gz`` suffix enables gzip compression.
+            image_format: Format for saved square images, one of IMAGE_FORMATS.
+            image_hash: How square images are identified, one of IMAGE_HASHES.
         """
         self.logger = logging.getLogger(__name__)
         
-        # Set default feedback file location
+        if image_format not in self.IMAGE_FORMATS:
+            self.logger.warning(f"Unsupported image format '{image_format}', using png")
+            image_format = 'png'
+        self.image_format = image_format
+        
+        if image_hash not in self.IMAGE_HASHES:
+            self.logger.warning(f"Unsupported image hash '{image_hash}', using exact")
+            image_hash = 'exact'
+        self.image_hash = image_hash
+        self._hasher = self._compute_image_hash if image_hash == 'phash' else self._compute_exact_hash
+        
+        # Set default feedback file location; a store left at the old default
+        # location by an earlier version is carried over on first use
+        migrate_from = None
         if feedback_file is None:
-            output_dir = Path(__file__).parent.parent.parent / 'output'
+            output_dir = _OUTPUT_DIR
             output_dir.mkdir(exist_ok=True)
-            feedback_file = output_dir / 'piece_recognition_feedback.json'
+            feedback_file = output_dir / self.DEFAULT_FEEDBACK_NAME
+            legacy_file = output_dir / self.LEGACY_FEEDBACK_NAME
+            if not feedback_file.exists() and legacy_file.exists():
+                migrate_from = legacy_file
         
         self.feedback_file = Path(feedback_file)
         self.feedback_data: List[PieceFeedback] = []
         
+        # The storage directory cannot disappear mid-run, so create it once
+        # here and keep a plain string path for the save hot path
+        self.feedback_file.parent.mkdir(parents=True, exist_ok=True)
+        self._feedback_file_str = str(self.feedback_file)
+        self._compressed = self.feedback_file.suffix == '.gz'
+        
+        # Records buffered by batch() until the outermost block exits
+        self._batch_depth = 0
+        self._batch_records: List[bytes] = []
+        self._batch_rewrite = False
+        
+        # Near-duplicate index over the active entries that have an image:
+        # packed pHashes and square codes, parallel to _hash_entries. Built
+        # lazily so that numpy is only imported once images are involved.
+        self._hash_array: Optional['np.ndarray'] = None
+        self._square_idx: Optional['np.ndarray'] = None
+        self._hash_entries: List[PieceFeedback] = []
+        
+        # Reused intermediate buffers of _compute_image_hash; add_feedback is
+        # only called from one thread at a time
+        self._hash_scratch: Optional[Dict[str, 'np.ndarray']] = None
+        
+        # Lookup indexes over the active entries; the piece type index and
+        # the confidence sum also serve get_correction_statistics. Each piece
+        # type bucket maps id(entry) to the entry, in insertion order, so a
+        # superseded entry is removed in O(1)
+        self._active_by_key: Dict[int, PieceFeedback] = {}
+        self._by_piece_type: Dict[PieceType, Dict[int, PieceFeedback]] = {}
+        self._active_confidence_sum = 0.0
+        self._superseded_count = 0
+        
+        # Appends are handed to a background writer so callers (typically the
+        # UI thread) never block on disk I/O
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = threading.Thread(
+            target=self._writer_loop,
+            name='FeedbackWriter',
+            daemon=True
+        )
+        self._writer.start()
+        
+        # Flush at interpreter exit if the manager was never closed; the hook
+        # holds the manager weakly so it does not keep it alive
+        self._atexit_hook = partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit_hook)
+        
         # Load existing feedback if file exists
-        self._load_feedback()
+        self._load_feedback(migrate_from)
         
         self.logger.info(f"FeedbackManager initialized with file: {self.feedback_file}")
     
-    def _load_feedback(self):
-        """Load existing feedback from file."""
-        if not self.feedback_file.exists():
+    def __enter__(self) -> 'FeedbackManager':
+        """Return the manager for use in a ``with`` block."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write pending feedback and stop the writer thread."""
+        self.close()
+    
+    def _open_feedback(self, mode: str, path: Optional[Path] = None):
+        """
+        Open the feedback file, compressing when it has a ``.gz`` suffix.
+        
+        Args:
+            mode: Binary file mode ('rb', 'wb' or 'ab').
+            path: File to open instead of the feedback file.
+            
+        Returns:
+            File object for the feedback file.
+        """
+        if path is not None:
+            if path.suffix == '.gz':
+                return gzip.open(path, mode, compresslevel=self.COMPRESS_LEVEL)
+            return open(path, mode)
+        if self._compressed:
+            return gzip.open(self._feedback_file_str, mode, compresslevel=self.COMPRESS_LEVEL)
+        return open(self._feedback_file_str, mode)
+    
+    @staticmethod
+    def _encode_line(feedback: PieceFeedback) -> bytes:
+        """
+        Encode a feedback entry as a single JSON Lines record.
+        
+        Args:
+            feedback: Feedback entry to encode.
+            
+        Returns:
+            bytes: UTF-8 encoded JSON record terminated by a newline.
+        """
+        # The store is only read back by the loader, so skip all optional
+        # whitespace; human-readable indentation is reserved for exports
+        return feedback.to_json_bytes() + b'\n'
+    
+    def _load_feedback(self, source: Optional[Path] = None):
+        """
+        Load existing feedback from file.
+        
+        Args:
+            source: File to load instead of the feedback file, such as a store
+                at the old default location. Its entries are written to the
+                feedback file; the source itself is left untouched.
+        """
+        path = self.feedback_file if source is None else source
+        if not path.exists():
             self.logger.info("No existing feedback file found")
             return
         
         # Check if file is empty
-        if self.feedback_file.stat().st_size == 0:
+        if path.stat().st_size == 0:
             self.logger.info("Feedback file is empty")
             return
         
+        legacy_format = False
         try:
-            with open(self.feedback_file, 'r') as f:
-                data = json.load(f)
-                self.feedback_data = [PieceFeedback.from_dict(item) for item in data]
+            with self._open_feedback('rb', source) as f:
+                if f.peek(1)[:1] == b'[':
+                    # Older versions stored a single JSON array
+                    legacy_format = True
+                    if ijson is not None and path.stat().st_size > self.STREAM_LOAD_BYTES:
+                        data = ijson.items(f, 'item', use_float=True)
+                    else:
+                        data = _loads(f.read())
+                    self.feedback_data = [PieceFeedback.from_dict(item) for item in data]
+                else:
+                    self.feedback_data = self._replay_log(f)
                 self.logger.info(f"Loaded {len(self.feedback_data)} feedback entries")
         except Exception as e:
             self.logger.error(f"Error loading feedback: {e}", exc_info=True)
             self.feedback_data = []
+            return
+        
+        self._rebuild_indexes()
+        
+        if source is not None:
+            self.logger.info(f"Migrating feedback from {source} to {self.feedback_file}")
+            self._save_feedback()
+        elif legacy_format:
+            # Migrate so that later records can simply be appended
+            self.logger.info("Converting legacy JSON feedback file to JSON Lines")
+            self._save_feedback()
+        else:
+            self.compact()
+    
+    def _rebuild_indexes(self):
+        """Rebuild the key and piece type indexes and the superseded count."""
+        self._active_by_key = {}
+        self._by_piece_type = {}
+        self._active_confidence_sum = 0.0
+        superseded = 0
+        for fb in self.feedback_data:
+            if fb.is_active:
+                self._index_feedback(fb)
+            else:
+                superseded += 1
+        self._superseded_count = superseded
+    
+    def _index_feedback(self, feedback: PieceFeedback):
+        """
+        Add an active entry to the lookup indexes.
+        
+        Args:
+            feedback: Entry to index.
+        """
+        if feedback.unique_key:
+            self._active_by_key[feedback._key_id] = feedback
+        self._by_piece_type.setdefault(feedback.user_correction, {})[id(feedback)] = feedback
+        self._active_confidence_sum += feedback.original_confidence
+    
+    def _unindex_feedback(self, feedback: PieceFeedback):
+        """
+        Remove a superseded entry from the lookup indexes.
+        
+        Args:
+            feedback: Entry to remove.
+        """
+        self._active_by_key.pop(feedback._key_id, None)
+        del self._by_piece_type[feedback.user_correction][id(feedback)]
+        self._active_confidence_sum -= feedback.original_confidence
+    
+    @staticmethod
+    def _replay_log(lines) -> List[PieceFeedback]:
+        """
+        Rebuild feedback entries by replaying the JSON Lines log.
+        
+        Args:
+            lines: Iterable of encoded log records.
+            
+        Returns:
+            List[PieceFeedback]: All entries, with superseded ones marked inactive.
+        """
+        entries = []
+        active_by_key = {}
+        for line in lines:
+            if not line.strip():
+                continue
+            record = _loads(line)
+            if record.get('op') == 'supersede':
+                superseded = active_by_key.pop(_pack_key(_decode_key(record['unique_key'])), None)
+                if superseded is not None:
+                    superseded.is_active = False
+                continue
+            
+            feedback = PieceFeedback.from_dict(record)
+            # Rewrites can reuse the stored encoding as is
+            feedback._json_cache = line.rstrip()
+            if feedback.unique_key:
+                active_by_key[feedback._key_id] = feedback
+            entries.append(feedback)
+        return entries
     
     def _save_feedback(self):
-        """Save feedback to file."""
+        """
+        Rewrite the whole feedback file from the active in-memory entries.
+        
+        The entries are written to a temporary file next to the feedback file,
+        synced to disk and then moved over it with ``os.replace``, so a crash
+        mid-rewrite leaves the previous log intact.
+        """
+        if self._batch_depth:
+            # The rewrite covers every buffered record, so defer it to the end
+            # of the batch and drop the buffered appends
+            self._batch_rewrite = True
+            self._batch_records.clear()
+            return
+        
+        # Queued appends must land first or they would follow the rewrite
+        self.flush()
+        tmp_path = self._feedback_file_str + '.tmp'
         try:
-            # Ensure directory exists
-            self.feedback_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Convert to dict list and save
-            data = [fb.to_dict() for fb in self.feedback_data]
+            # Entries keep their encoding, so a rewrite only joins cached bytes;
+            # the empty last item terminates the final record
+            records = [fb.to_json_bytes() for fb in self.feedback_data if fb.is_active]
+            records.append(b'')
+            payload = b'\n'.join(records)
             
-            with open(self.feedback_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_path, 'wb') as raw:
+                if self._compressed:
+                    with gzip.GzipFile(filename='', mode='wb', fileobj=raw,
+                                       compresslevel=self.COMPRESS_LEVEL) as f:
+                        f.write(payload)
+                else:
+                    raw.write(payload)
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(tmp_path, self._feedback_file_str)
             
             self.logger.info(f"Saved {len(self.feedback_data)} feedback entries")
         except Exception as e:
             self.logger.error(f"Error saving feedback: {e}", exc_info=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _append_feedback(self, feedback: PieceFeedback):
+        """
+        Queue a single feedback entry to be appended to the file.
+        
+        Args:
+            feedback: Feedback entry to persist.
+        """
+        self._append_record(self._encode_line(feedback))
+    
+    def _append_record(self, record: bytes):
+        """
+        Queue an encoded log record to be appended to the file.
+        
+        Args:
+            record: JSON Lines record including the trailing newline.
+        """
+        if self._batch_depth:
+            if not self._batch_rewrite:
+                self._batch_records.append(record)
+        elif self._writer is None:
+            # Writer already stopped: fall back to a synchronous append
+            self._write_records(record)
+        else:
+            self._write_queue.put(record)
+    
+    def _write_records(self, payload: bytes):
+        """
+        Append encoded records to the feedback file in a single write.
+        
+        Args:
+            payload: Concatenated JSON Lines records.
+        """
+        try:
+            with self._open_feedback('ab') as f:
+                f.write(payload)
+        except Exception as e:
+            self.logger.error(f"Error saving feedback: {e}", exc_info=True)
+    
+    def _write_image(self, image_path: Path, square_image: 'np.ndarray'):
+        """
+        Encode and write a square image.
+        
+        Args:
+            image_path: Destination file; the suffix selects the format.
+            square_image: Image to write.
+        """
+        import cv2
+        
+        suffix = image_path.suffix
+        if suffix == '.webp':
+            params = [cv2.IMWRITE_WEBP_QUALITY, self.IMAGE_QUALITY]
+        elif suffix == '.jpg':
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.IMAGE_QUALITY]
+        else:
+            params = []
+        
+        try:
+            ok, encoded = cv2.imencode(suffix, square_image, params)
+            if not ok:
+                self.logger.error(f"Error saving square image: could not encode {image_path}")
+                return
+            image_path.write_bytes(encoded.tobytes())
+        except Exception as e:
+            self.logger.error(f"Error saving square image: {e}", exc_info=True)
+    
+    def _writer_loop(self):
+        """
+        Drain the write queue, coalescing bursts into one write each.
+        
+        Queue items are encoded log records (bytes), ``(path, image)`` tuples
+        for square images, or the ``None`` stop sentinel. Images are written
+        before the records of the same burst, so a stored record never refers
+        to an image that is not on disk yet.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            try:
+                while batch[-1] is not None and len(batch) < self.MAX_WRITE_BATCH:
+                    batch.append(self._write_queue.get(timeout=self.WRITE_COALESCE_SECONDS))
+            except queue.Empty:
+                pass
+            
+            records = []
+            for item in batch:
+                if isinstance(item, tuple):
+                    self._write_image(*item)
+                elif item is not None:
+                    records.append(item)
+            if records:
+                self._write_records(b''.join(records))
+            for _ in batch:
+                self._write_queue.task_done()
+            
+            # None is the stop sentinel sent by close()
+            if batch[-1] is None:
+                return
+    
+    def compact(self, force: bool = False) -> bool:
+        """
+        Rewrite the log without superseded entries and supersede records.
+        
+        Args:
+            force: Compact even if the superseded ratio is below COMPACT_RATIO.
+            
+        Returns:
+            bool: True if the log was rewritten.
+        """
+        superseded = self._superseded_count
+        if not superseded or (not force and superseded / len(self.feedback_data) <= self.COMPACT_RATIO):
+            return False
+        
+        self.feedback_data = [fb for fb in self.feedback_data if fb.is_active]
+        self._superseded_count = 0
+        self._save_feedback()
+        self.logger.info(f"Compacted feedback log, dropped {superseded} superseded entries")
+        return True
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer feedback writes until the end of a ``with`` block.
+        
+        Use this when labeling many squares at once; all records added inside
+        the block are written with a single append (or a single rewrite if the
+        log was compacted meanwhile). Blocks may be nested.
+        
+        Yields:
+            FeedbackManager: This manager.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                records, self._batch_records = self._batch_records, []
+                if self._batch_rewrite:
+                    self._batch_rewrite = False
+                    self._save_feedback()
+                elif records:
+                    self._append_record(b''.join(records))
+    
+    def flush(self):
+        """Block until all queued feedback has been written to disk."""
+        if self._writer is not None:
+            self._write_queue.join()
+    
+    def close(self):
+        """Write any pending feedback and stop the background writer."""
+        if self._writer is None:
+            return
+        self._write_queue.put(None)
+        self._writer.join()
+        self._writer = None
+        atexit.unregister(self._atexit_hook)
+    
+    def _compute_image_hash(self, square_image: 'np.ndarray') -> int:
+        """
+        Compute a 64-bit perceptual hash (pHash) of a square image.
+        
+        The low-frequency DCT coefficients of a downscaled grayscale copy are
+        thresholded against their median, so recompression, rescaling or small
+        lighting changes of the same square map to the same or a nearby hash.
+        The image is downscaled before the grayscale conversion and every
+        intermediate goes into a reused scratch buffer, so hashing does not
+        allocate per call.
+        
+        Args:
+            square_image: Image of the square (BGR or grayscale).
+            
+        Returns:
+            int: 64-bit hash.
+        """
+        import cv2
+        import numpy as np
+        
+        scratch = self._hash_scratch
+        if scratch is None:
+            scratch = self._hash_scratch = {
+                'color': np.empty((32, 32, 3), dtype=np.uint8),
+                'gray': np.empty((32, 32), dtype=np.uint8),
+                'float': np.empty((32, 32), dtype=np.float32),
+                'dct': np.empty((32, 32), dtype=np.float32)
+            }
+        
+        # OpenCV only writes into dst when it already has the right shape and
+        # type, so always continue with the returned array
+        if square_image.ndim == 2:
+            gray = cv2.resize(square_image, (32, 32), dst=scratch['gray'], interpolation=cv2.INTER_AREA)
+        else:
+            small = cv2.resize(square_image, (32, 32), dst=scratch['color'], interpolation=cv2.INTER_AREA)
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=scratch['gray'])
+        np.copyto(scratch['float'], gray)
+        dct = cv2.dct(scratch['float'], dst=scratch['dct'])[:8, :8]
+        bits = np.packbits(dct > np.median(dct))
+        return int.from_bytes(bits.tobytes(), 'big')
+    
+    @staticmethod
+    def _compute_exact_hash(square_image: 'np.ndarray') -> int:
+        """
+        Compute a 64-bit digest of a strided subsample of the image pixels.
+        
+        Only every n-th row and column is hashed (about 32x32 pixels), which
+        skips any resize and most of the bytes while still telling apart
+        different captures. Uses xxh3 when the xxhash package is installed and
+        BLAKE2b otherwise; 64 bits make collisions negligible at the scale of
+        a feedback log.
+        
+        Args:
+            square_image: Image of the square.
+            
+        Returns:
+            int: 64-bit digest.
+        """
+        import numpy as np
+        
+        step_y = max(1, square_image.shape[0] // 32)
+        step_x = max(1, square_image.shape[1] // 32)
+        return _digest64(np.ascontiguousarray(square_image[::step_y, ::step_x]))
+    
+    def _build_hash_index(self):
+        """Rebuild the near-duplicate index from the active entries."""
+        import numpy as np
+        
+        self._hash_entries = [fb for fb in self.feedback_data if fb.is_active and fb.unique_key]
+        self._hash_array = np.array([fb.unique_key[0] for fb in self._hash_entries], dtype=np.uint64)
+        self._square_idx = np.array([fb.unique_key[1] for fb in self._hash_entries], dtype=np.int8)
+    
+    def _pop_near_duplicates(self, feedback: PieceFeedback) -> List[PieceFeedback]:
+        """
+        Remove entries matching a new entry's image from the index and add the new one.
+        
+        Args:
+            feedback: New feedback entry with a unique key.
+            
+        Returns:
+            List[PieceFeedback]: Indexed entries of the same square whose image
+                hash is within HAMMING_THRESHOLD bits of the new one.
+        """
+        import numpy as np
+        
+        if self._hash_array is None:
+            self._build_hash_index()
+        
+        image_hash = np.uint64(feedback.unique_key[0])
+        square_code = feedback.unique_key[1]
+        
+        candidates = np.flatnonzero(self._square_idx == square_code)
+        xors = self._hash_array[candidates] ^ image_hash
+        distances = np.unpackbits(xors.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+        matches = candidates[distances <= self.HAMMING_THRESHOLD]
+        
+        duplicates = [self._hash_entries[i] for i in matches]
+        if len(matches):
+            keep = np.ones(len(self._hash_entries), dtype=bool)
+            keep[matches] = False
+            self._hash_array = self._hash_array[keep]
+            self._square_idx = self._square_idx[keep]
+            self._hash_entries = [fb for fb, kept in zip(self._hash_entries, keep) if kept]
+        
+        self._hash_array = np.append(self._hash_array, image_hash)
+        self._square_idx = np.append(self._square_idx, np.int8(square_code))
+        self._hash_entries.append(feedback)
+        return duplicates
     
-    def _save_square_image(self, square_image: np.ndarray, square_name: str) -> Optional[str]:
+    def _compute_unique_key(self, square_image: 'np.ndarray', square_name: str) -> UniqueKey:
+        """
+        Build the key identifying a correction target.
+        
+        Args:
+            square_image: Image of the square.
+            square_name: Chess square name.
+            
+        Returns:
+            UniqueKey: Hash of the image and index of the square.
+        """
+        return self._hasher(square_image), chess.parse_square(square_name)
+    
+    def _save_square_image(self, square_image: 'np.ndarray', square_name: str) -> Optional[str]:
         """
         Save a square image for training data.
         
+        The image is encoded and written by the background writer; a copy is
+        queued so the caller may reuse its buffer.
+        
         Args:
             square_image: Image of the square.
             square_name: Chess square name for filename.
@@ -197,11 +893,14 @@ class FeedbackManager:
             
             # Generate unique filename
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-            filename = f"{square_name}_{timestamp}.png"
+            filename = f"{square_name}_{timestamp}.{self.image_format}"
             image_path = images_dir / filename
             
             # Save image
-            cv2.imwrite(str(image_path), square_image)
+            if self._writer is None:
+                self._write_image(image_path, square_image)
+            else:
+                self._write_queue.put((image_path, square_image.copy()))
             
             # Return relative path
             return f"training_images/{filename}"
@@ -215,12 +914,16 @@ class FeedbackManager:
         original_prediction: Optional[PieceType],
         original_confidence: float,
         user_correction: PieceType,
-        square_image: Optional[np.ndarray] = None,
+        square_image: Optional['np.ndarray'] = None,
         board_orientation: Optional[str] = None
     ):
         """
         Add a new piece of feedback.
         
+        When a square image is given, an earlier active correction of the same
+        square with an identical image is superseded by this one; with the
+        'phash' image hash, near-duplicates (see HAMMING_THRESHOLD) are too.
+        
         Args:
             square_name: Chess square name (e.g., 'e4').
             original_prediction: Original model prediction.
@@ -231,7 +934,9 @@ class FeedbackManager:
         """
         # Save square image if provided
         square_image_path = None
+        unique_key = None
         if square_image is not None:
+            unique_key = self._compute_unique_key(square_image, square_name)
             square_image_path = self._save_square_image(square_image, square_name)
         
         feedback = PieceFeedback(
@@ -240,60 +945,93 @@ class FeedbackManager:
             original_confidence=original_confidence,
             user_correction=user_correction,
             square_image_path=square_image_path,
-            board_orientation=board_orientation
+            board_orientation=board_orientation,
+            unique_key=unique_key
         )
         
+        superseded = []
+        if unique_key is not None:
+            if self.HAMMING_THRESHOLD and self.image_hash == 'phash':
+                superseded = self._pop_near_duplicates(feedback)
+            elif feedback._key_id in self._active_by_key:
+                # Exact matching only needs the key index
+                superseded = [self._active_by_key[feedback._key_id]]
+            for fb in superseded:
+                fb.is_active = False
+                self._unindex_feedback(fb)
+                self._superseded_count += 1
+                record = {'op': 'supersede', 'unique_key': _encode_key(fb.unique_key)}
+                self._append_record(_dumps(record) + b'\n')
+        
         self.feedback_data.append(feedback)
-        self._save_feedback()
+        self._index_feedback(feedback)
+        self._append_feedback(feedback)
+        
+        if superseded:
+            self.compact()
         
         self.logger.info(
             f"Added feedback for {square_name}: "
             f"{original_prediction} -> {user_correction}"
         )
     
+    def _active_feedback(self) -> List[PieceFeedback]:
+        """
+        Get the feedback entries that have not been superseded.
+        
+        Returns:
+            List[PieceFeedback]: Active feedback entries.
+        """
+        return [fb for fb in self.feedback_data if fb.is_active]
+    
     def get_feedback_count(self) -> int:
         """
         Get the total number of feedback entries.
         
         Returns:
-            int: Number of feedback entries.
+            int: Number of active feedback entries.
         """
-        return len(self.feedback_data)
+        return len(self.feedback_data) - self._superseded_count
     
     def get_correction_statistics(self) -> Dict:
         """
         Get statistics about corrections.
         
+        The statistics are read from aggregates kept up to date as entries
+        are added and superseded, so the cost does not grow with the amount
+        of feedback.
+        
         Returns:
             Dict: Statistics including total corrections, by piece type, etc.
         """
-        if not self.feedback_data:
+        total = self.get_feedback_count()
+        if not total:
             return {
                 'total_corrections': 0,
                 'by_piece_type': {},
                 'avg_original_confidence': 0.0
             }
         
-        stats = {
-            'total_corrections': len(self.feedback_data),
-            'by_piece_type': {},
-            'avg_original_confidence': 0.0
+        return {
+            'total_corrections': total,
+            'by_piece_type': {
+                _CODE2NAME[_PT2CODE[piece_type]]: len(entries)
+                for piece_type, entries in sorted(
+                    self._by_piece_type.items(), key=lambda item: _PT2CODE[item[0]]
+                )
+                if entries
+            },
+            'avg_original_confidence': self._active_confidence_sum / total
         }
-        
-        # Count by piece type
-        for fb in self.feedback_data:
-            piece_name = fb.user_correction.name if fb.user_correction else 'UNKNOWN'
-            stats['by_piece_type'][piece_name] = stats['by_piece_type'].get(piece_name, 0) + 1
-        
-        # Average confidence of corrected predictions
-        confidences = [fb.original_confidence for fb in self.feedback_data]
-        stats['avg_original_confidence'] = sum(confidences) / len(confidences)
-        
-        return stats
     
     def clear_feedback(self):
         """Clear all feedback data."""
+        self.flush()
         self.feedback_data = []
+        self._hash_array = None
+        self._rebuild_indexes()
+        self._batch_records.clear()
+        self._batch_rewrite = False
         if self.feedback_file.exists():
             self.feedback_file.unlink()
         self.logger.info("Feedback data cleared")
@@ -302,42 +1040,177 @@ class FeedbackManager:
         """
         Export feedback to a different file.
         
+        Exports to a ``.jsonl`` path copy the stored log verbatim without
+        re-encoding it; any other path receives a pretty-printed JSON array
+        of the active entries.
+        
         Args:
-            export_path: Path to export file.
+            export_path: Path to export file. A ``.gz`` suffix compresses the export.
         """
+        export_path = Path(export_path)
+        compress = export_path.suffix == '.gz'
+        export_format = Path(export_path.stem).suffix if compress else export_path.suffix
+        opener = gzip.open if compress else open
+        
+        self.flush()
         try:
-            data = [fb.to_dict() for fb in self.feedback_data]
-            with open(export_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if export_format == '.jsonl':
+                if not self.feedback_file.exists():
+                    # Nothing stored yet: produce an empty export
+                    with opener(export_path, 'wb'):
+                        pass
+                elif compress == self._compressed:
+                    # Same encoding on both sides: let the OS copy the bytes
+                    shutil.copyfile(self._feedback_file_str, export_path)
+                else:
+                    with self._open_feedback('rb') as src, opener(export_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+            else:
+                with opener(export_path, 'wt') as f:
+                    self._write_json_array(f)
             self.logger.info(f"Exported feedback to {export_path}")
         except Exception as e:
             self.logger.error(f"Error exporting feedback: {e}", exc_info=True)
     
+    def _write_json_array(self, out):
+        """
+        Stream the active entries into a pretty-printed JSON array.
+        
+        Entries are encoded one at a time so the whole document is never
+        built up in memory.
+        
+        Args:
+            out: Text file object to write the array to.
+        """
+        separator = '\n'
+        out.write('[')
+        for fb in self.feedback_data:
+            if not fb.is_active:
+                continue
+            record = _dumps_pretty(fb.to_dict())
+            out.write(separator + '  ' + record.replace('\n', '\n  '))
+            separator = ',\n'
+        out.write(']' if separator == '\n' else '\n]')
+    
+    def _load_training_image(self, image_path: Path) -> Optional['np.ndarray']:
+        """
+        Read and decode one stored square image.
+        
+        Args:
+            image_path: Path of the image file.
+            
+        Returns:
+            Optional[np.ndarray]: Decoded BGR image, or None if it could not be loaded.
+        """
+        import cv2
+        import numpy as np
+        
+        try:
+            return cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Failed to load image {image_path}: {e}")
+            return None
+    
     def get_training_data(self) -> List[tuple]:
         """
         Get training data from feedback for model retraining.
         
+        Images are read and decoded on a thread pool; OpenCV releases the GIL
+        while decoding, so loading scales with the number of cores.
+        
         Returns:
             List[tuple]: List of (image, label) tuples where image is np.ndarray
                         and label is PieceType. Only includes feedback with images.
         """
-        training_data = []
+        # Images may still be queued for the background writer
+        self.flush()
+        
         base_dir = self.feedback_file.parent
+        samples = [fb for fb in self._active_feedback() if fb.square_image_path]
+        paths = [base_dir / fb.square_image_path for fb in samples]
         
-        for fb in self.feedback_data:
-            if fb.square_image_path:
-                image_path = base_dir / fb.square_image_path
-                if image_path.exists():
-                    try:
-                        image = cv2.imread(str(image_path))
-                        if image is not None:
-                            training_data.append((image, fb.user_correction))
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load image {image_path}: {e}")
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            images = list(executor.map(self._load_training_image, paths))
+        
+        training_data = [
+            (image, fb.user_correction)
+            for image, fb in zip(images, samples)
+            if image is not None
+        ]
         
         self.logger.info(f"Retrieved {len(training_data)} training samples from feedback")
         return training_data
     
+    def get_training_batch(
+        self,
+        square_size: int,
+        native_max_size: int = 0
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', Dict[int, 'np.ndarray']]:
+        """
+        Get training data from feedback stacked into arrays for batched retraining.
+        
+        Every stored square is decoded on the thread pool and resized straight
+        into its slot of one preallocated (N, square_size, square_size, 3)
+        stack; samples that fail to load are dropped with a single boolean
+        mask copy at the end.
+        
+        Args:
+            square_size: Side length every square is resized to.
+            native_max_size: Squares up to this height are also returned
+                unresized, for recognizers that analyze small squares at
+                their own size.
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[int, np.ndarray]]:
+                (squares, labels, source heights, native squares). Labels are
+                int8 codes, 1 + the index of the corrected PieceType; source
+                heights are the square heights before resizing; native squares
+                maps the index of each small sample to its original image.
+        """
+        import cv2
+        import numpy as np
+        
+        # Images may still be queued for the background writer
+        self.flush()
+        
+        base_dir = self.feedback_file.parent
+        samples = [
+            fb for fb in self._active_feedback()
+            if fb.square_image_path and fb.user_correction is not None
+        ]
+        count = len(samples)
+        squares = np.empty((count, square_size, square_size, 3), dtype=np.uint8)
+        heights = np.zeros(count, dtype=np.int32)  # 0 marks a sample that failed to load
+        natives = {}
+        
+        def load(index: int):
+            image = self._load_training_image(base_dir / samples[index].square_image_path)
+            if image is None:
+                return
+            interpolation = cv2.INTER_AREA if image.shape[0] > square_size else cv2.INTER_LINEAR
+            cv2.resize(image, (square_size, square_size), dst=squares[index],
+                       interpolation=interpolation)
+            heights[index] = image.shape[0]
+            if image.shape[0] <= native_max_size:
+                natives[index] = image
+        
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            list(executor.map(load, range(count)))
+        
+        labels = np.fromiter(
+            (_PT2CODE[fb.user_correction] for fb in samples), dtype=np.int8, count=count
+        )
+        loaded = heights > 0
+        if not loaded.all():
+            squares, labels, heights = squares[loaded], labels[loaded], heights[loaded]
+            positions = np.cumsum(loaded) - 1
+            natives = {int(positions[index]): image for index, image in natives.items()}
+        
+        self.logger.info(f"Retrieved {len(labels)} training samples from feedback")
+        return squares, labels, heights, natives
+    
     def get_feedback_by_piece_type(self, piece_type: PieceType) -> List[PieceFeedback]:
         """
         Get all feedback for a specific piece type.
@@ -348,7 +1221,7 @@ class FeedbackManager:
         Returns:
             List[PieceFeedback]: Feedback entries for the specified piece type.
         """
-        return [fb for fb in self.feedback_data if fb.user_correction == piece_type]
+        return list(self._by_piece_type.get(piece_type, {}).values())
     
     def get_misclassified_feedback(self) -> List[PieceFeedback]:
         """
@@ -358,6 +1231,6 @@ class FeedbackManager:
             List[PieceFeedback]: Feedback entries where prediction != correction.
         """
         return [
-            fb for fb in self.feedback_data 
+            fb for fb in self._active_feedback()
             if fb.original_prediction != fb.user_correction
         ]
@@ -9,29 +9,344 @@ import cv2
 import numpy as np
 from typing import Optional, Dict, List, Tuple
 import logging
+import struct
+import threading
 import chess
-from enum import Enum
 
+from src.computer_vision.piece_type import PieceType
 
-class PieceType(Enum):
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# (color, confidence) indexed by how many of the brightness thresholds
+# 100, 125 and 150 the center of a square reaches
+_COLOR_TABLE = (
+    (chess.BLACK, 0.7),
+    (chess.BLACK, 0.5),
+    (chess.WHITE, 0.5),
+    (chess.WHITE, 0.7)
+)
+
+# Square names indexed by [row][col] of the 8x8 grid, row 0 being rank 8
+_SQUARE_NAMES = [
+    [chess.square_name(chess.square(col, 7 - row)) for col in range(8)]
+    for row in range(8)
+]
+
+
+def _count_edge_pixels(gray: np.ndarray, edges: Optional[np.ndarray] = None) -> int:
+    """
+    Count the Canny edge pixels of a grayscale image.
+    
+    Args:
+        gray (np.ndarray): Grayscale image.
+        edges (Optional[np.ndarray]): uint8 buffer of the same shape to
+            hold the edge map.
+        
+    Returns:
+        int: Number of edge pixels.
+    """
+    return cv2.countNonZero(cv2.Canny(gray, 50, 150, edges=edges))
+
+
+def _opencv_layout(image: np.ndarray) -> np.ndarray:
+    """
+    Return an image in a memory layout OpenCV can use without copying.
+    
+    OpenCV wraps arrays whose rows are strided, such as squares sliced out
+    of a board image, but copies arrays with gaps or reversed order within
+    a row on every call. Such images are copied once here instead.
+    
+    Args:
+        image (np.ndarray): Image to check.
+        
+    Returns:
+        np.ndarray: The image itself, or a C-contiguous copy.
+    """
+    if image.flags['C_CONTIGUOUS']:
+        return image
+    
+    packed = image.itemsize
+    for axis in range(image.ndim - 1, 0, -1):
+        if image.strides[axis] != packed:
+            return np.ascontiguousarray(image)
+        packed *= image.shape[axis]
+    if image.strides[0] < 0:
+        return np.ascontiguousarray(image)
+    return image
+
+
+def _board_stats_loop(gray: np.ndarray) -> np.ndarray:
+    """
+    Compute the brightness statistics of analyze_board_features in one pass.
+    
+    For each square: mean and variance of the brightness and the mean
+    brightness of the center region. Squares are processed in parallel
+    when compiled with numba.
+    
+    Args:
+        gray (np.ndarray): Grayscale squares of shape (N, H, W), uint8.
+        
+    Returns:
+        np.ndarray: Array of shape (3, N) with the rows (mean, variance,
+            center mean).
+    """
+    n, h, w = gray.shape
+    stats = np.empty((3, n))
+    
+    for i in prange(n):
+        total = 0
+        total_sq = 0
+        center_total = 0
+        
+        for y in range(h):
+            for x in range(w):
+                value = np.int64(gray[i, y, x])
+                total += value
+                total_sq += value * value
+                if h // 4 <= y < 3 * h // 4 and w // 4 <= x < 3 * w // 4:
+                    center_total += value
+                
+        size = h * w
+        mean = total / size
+        stats[0, i] = mean
+        stats[1, i] = total_sq / size - mean * mean
+        stats[2, i] = center_total / ((3 * h // 4 - h // 4) * (3 * w // 4 - w // 4))
+    
+    return stats
+
+
+def _board_stats_opencv(gray: np.ndarray) -> np.ndarray:
+    """
+    OpenCV version of _board_stats_loop, used when numba is not installed.
+    """
+    n, h, w = gray.shape
+    center = (slice(h//4, 3*h//4), slice(w//4, 3*w//4))
+    stats = np.empty((3, n))
+    for i, square in enumerate(gray):
+        mean, stddev = cv2.meanStdDev(square)
+        stats[0, i] = mean[0, 0]
+        stats[1, i] = stddev[0, 0] ** 2
+        stats[2, i] = cv2.mean(square[center])[0]
+    return stats
+
+
+# Compiled, the loop fuses all statistics into one parallel pass over the
+# pixels; interpreted it is far slower than one OpenCV call per statistic
+if njit is not None:
+    _board_stats = njit(parallel=True, cache=True)(_board_stats_loop)
+else:
+    _board_stats = _board_stats_opencv
+
+
+# Columns of the feature matrix scored by _score_board
+_BOARD_FEATURES = (
+    'edge_density',
+    'brightness_variance',
+    'center_darkness',
+    'center_mean_brightness'
+)
+
+# Piece codes returned by _score_board: 0 is an empty square, -1 an unknown
+# piece and 1 + 6 * color + (piece_type - 1) a piece
+_BOARD_CODES = (PieceType.EMPTY,) + tuple(
+    next(pt for pt in PieceType if pt.value[1:] == (piece_type, color))
+    for color in (chess.BLACK, chess.WHITE)
+    for piece_type in range(chess.PAWN, chess.KING + 1)
+)
+
+# PieceType -> piece code of _BOARD_CODES; None (unknown) maps to -1
+_PIECE_CODES = {piece_enum: code for code, piece_enum in enumerate(_BOARD_CODES)}
+_PIECE_CODES[None] = -1
+
+# Flat board record of one square: piece code (see results_to_codes) and
+# confidence; a board is a (64,) array of these in row-major order
+RESULT_DTYPE = np.dtype([('piece', 'i1'), ('conf', 'f8')])
+
+# bytes.translate tables over the bytes of an int8 code grid: _EMPTY_FLAGS
+# maps empty (0) and unknown (-1) squares to 1 and pieces to 0, and
+# _PIECE_LETTERS maps piece codes to their FEN letter once _EMPTY_BYTES
+# are deleted
+_EMPTY_BYTES = bytes((0, 0xFF))
+_EMPTY_FLAGS = bytes(1 if byte in _EMPTY_BYTES else 0 for byte in range(256))
+_PIECE_LETTERS = bytes(
+    ord(_BOARD_CODES[byte].value[0]) if 0 < byte < len(_BOARD_CODES) else 0
+    for byte in range(256)
+)
+
+# Multiplier gathering the low bit of each byte of a big-endian 64-bit word
+# into its top byte, first byte to bit 7 (SWAR bit gather)
+_GATHER_BITS = 0x0102040810204080
+
+
+def _row_template(pattern: int) -> str:
+    """
+    Build the FEN of an 8-square row from its empty-square bit pattern.
+    
+    Args:
+        pattern (int): Bit 7 set if the first square is empty, bit 0 if the last is.
+        
+    Returns:
+        str: Row FEN with each run of empty squares as its count and each
+            piece as a %c placeholder.
+    """
+    template = ''
+    run = 0
+    for bit in range(7, -1, -1):
+        if pattern >> bit & 1:
+            run += 1
+            continue
+        if run:
+            template += str(run)
+            run = 0
+        template += '%c'
+    return template + (str(run) if run else '')
+
+
+# Row FEN template for each of the 256 empty-square patterns of a row, in
+# the bit order _GATHER_BITS produces
+_EMPTY_PATTERNS = tuple(_row_template(pattern) for pattern in range(256))
+
+
+def _codes_row_to_fen(row: np.ndarray) -> str:
+    """
+    Build the FEN of a row of piece codes of any length, square by square.
+    
+    Args:
+        row (np.ndarray): Piece codes of the row, see _PIECE_CODES.
+        
+    Returns:
+        str: Row FEN with each run of empty or unknown squares as its count.
+    """
+    fen_row = ''
+    empty_count = 0
+    for code in row.tolist():
+        if code <= 0:
+            empty_count += 1
+            continue
+        if empty_count:
+            fen_row += str(empty_count)
+            empty_count = 0
+        fen_row += _BOARD_CODES[code].value[0]
+    return fen_row + (str(empty_count) if empty_count else '')
+
+
+def _score_board_loop(
+    features: np.ndarray,
+    min_confidence: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run the recognition heuristics over many squares in one fused pass.
+    
+    Combines is_square_empty, estimate_piece_color and estimate_piece_type
+    for each row of the feature matrix.
+    
+    Args:
+        features (np.ndarray): Array of shape (N, 4) with the columns listed
+            in _BOARD_FEATURES.
+        min_confidence (float): Minimum confidence to accept a recognition.
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (piece codes, confidences) arrays.
     """
-    Enumeration of chess piece types with their symbols.
+    n = features.shape[0]
+    codes = np.empty(n, dtype=np.int32)
+    confidence = np.empty(n, dtype=np.float64)
     
-    These map to chess.Piece types for compatibility with python-chess library.
+    for i in range(n):
+        edge_density = features[i, 0]
+        
+        # Empty square score in tenths, as in is_square_empty
+        empty_score = 0
+        if edge_density < 0.1:
+            empty_score += 4
+        if features[i, 1] < 500:
+            empty_score += 3
+        if features[i, 2] < 0.3:
+            empty_score += 3
+        
+        is_empty = empty_score > 5
+        empty_confidence = (empty_score if is_empty else 10 - empty_score) / 10.0
+        if is_empty and empty_confidence > min_confidence:
+            codes[i] = 0
+            confidence[i] = empty_confidence
+            continue
+        
+        # Piece color, as in estimate_piece_color
+        brightness = features[i, 3]
+        color_index = 0
+        if brightness >= 100:
+            color_index += 1
+        if brightness > 125:
+            color_index += 1
+        if brightness > 150:
+            color_index += 1
+        color_confidence = 0.7 if color_index == 0 or color_index == 3 else 0.5
+        
+        # Piece type, as in estimate_piece_type
+        if edge_density < 0.15:
+            piece_type = chess.PAWN
+        elif edge_density < 0.25:
+            piece_type = chess.ROOK
+        elif edge_density < 0.35:
+            piece_type = chess.KNIGHT
+        else:
+            piece_type = chess.QUEEN
+        
+        confidence[i] = (color_confidence + 0.4) / 2
+        if confidence[i] < min_confidence:
+            codes[i] = -1
+        else:
+            codes[i] = 1 + 6 * (color_index >= 2) + piece_type - 1
+    
+    return codes, confidence
+
+
+def _score_board_numpy(
+    features: np.ndarray,
+    min_confidence: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    NumPy version of _score_board_loop, used when numba is not installed.
     """
-    WHITE_PAWN = ('P', chess.PAWN, chess.WHITE)
-    WHITE_KNIGHT = ('N', chess.KNIGHT, chess.WHITE)
-    WHITE_BISHOP = ('B', chess.BISHOP, chess.WHITE)
-    WHITE_ROOK = ('R', chess.ROOK, chess.WHITE)
-    WHITE_QUEEN = ('Q', chess.QUEEN, chess.WHITE)
-    WHITE_KING = ('K', chess.KING, chess.WHITE)
-    BLACK_PAWN = ('p', chess.PAWN, chess.BLACK)
-    BLACK_KNIGHT = ('n', chess.KNIGHT, chess.BLACK)
-    BLACK_BISHOP = ('b', chess.BISHOP, chess.BLACK)
-    BLACK_ROOK = ('r', chess.ROOK, chess.BLACK)
-    BLACK_QUEEN = ('q', chess.QUEEN, chess.BLACK)
-    BLACK_KING = ('k', chess.KING, chess.BLACK)
-    EMPTY = ('.', None, None)
+    edge_density = features[:, 0]
+    empty_score = (
+        (edge_density < 0.1) * 4
+        + (features[:, 1] < 500) * 3
+        + (features[:, 2] < 0.3) * 3
+    )
+    is_empty = empty_score > 5
+    empty_confidence = np.where(is_empty, empty_score, 10 - empty_score) / 10.0
+    
+    brightness = features[:, 3]
+    color_index = (brightness >= 100) * 1 + (brightness > 125) + (brightness > 150)
+    color_confidence = np.array([conf for _, conf in _COLOR_TABLE])[color_index]
+    piece_types = np.select(
+        [edge_density < 0.15, edge_density < 0.25, edge_density < 0.35],
+        [chess.PAWN, chess.ROOK, chess.KNIGHT],
+        chess.QUEEN
+    )
+    piece_confidence = (color_confidence + 0.4) / 2
+    piece_codes = np.where(
+        piece_confidence < min_confidence,
+        -1,
+        1 + 6 * (color_index >= 2) + piece_types - 1
+    )
+    
+    empty = is_empty & (empty_confidence > min_confidence)
+    codes = np.where(empty, 0, piece_codes).astype(np.int32)
+    return codes, np.where(empty, empty_confidence, piece_confidence)
+
+
+# The loop compiles to a single fused pass with numba; without it the
+# vectorized NumPy version is faster than interpreting the loop
+if njit is not None:
+    _score_board = njit(cache=True)(_score_board_loop)
+else:
+    _score_board = _score_board_numpy
 
 
 class RecognitionResult:
@@ -123,51 +438,170 @@ class PieceRecognizer:
         """
         self.logger = logging.getLogger(__name__)
         self.min_confidence = min_confidence
+        
+        # Side length squares are downscaled to before feature extraction;
+        # the features are low-frequency statistics that barely change
+        self._feature_size = 32
+        
+        # Squares up to this side length are analyzed at their own size
+        self._max_native_size = 40
+        
+        # Scratch images reused across squares, allocated on first use and
+        # reallocated when the square size changes; one set per thread since
+        # the GUIs call the recognizer from their worker threads
+        self._buffers = threading.local()
+        
+        # (piece type, color) -> PieceType, so results map to the enum in O(1)
+        self._piece_map = {
+            (pt.value[1], pt.value[2]): pt
+            for pt in PieceType if pt is not PieceType.EMPTY
+        }
+
+    @property
+    def feature_size(self) -> int:
+        """Side length squares are downscaled to before feature extraction."""
+        return self._feature_size
+
+    @property
+    def max_native_size(self) -> int:
+        """Largest square side analyzed without downscaling."""
+        return self._max_native_size
+
+    def _downscale_square(
+        self,
+        square_image: np.ndarray,
+        gray: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], float]:
+        """
+        Shrink a square to the feature size if it is larger.
+        
+        Edge pixel counts shrink linearly with the image side while the area
+        shrinks quadratically, so the returned scale converts edge densities
+        measured on the small image back to the original resolution.
+        
+        Args:
+            square_image (np.ndarray): Image of a single chess square.
+            gray (Optional[np.ndarray]): Grayscale version of the square.
+            
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray], float]:
+                (square_image, gray, edge_scale)
+        """
+        height = square_image.shape[0]
+        if height <= self._max_native_size:
+            return square_image, gray, 1.0
+        
+        size = (self._feature_size, self._feature_size)
+        square_image = cv2.resize(square_image, size, interpolation=cv2.INTER_AREA)
+        if gray is not None:
+            gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+        return square_image, gray, self._feature_size / height
+
+    def _feature_buffers(
+        self,
+        shape: Tuple[int, int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the scratch images used by analyze_square_features.
+        
+        Args:
+            shape (Tuple[int, int]): Height and width of the square.
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                (gray, edges, comparison) buffers of the given shape.
+        """
+        buffers = self._buffers
+        gray_buf = getattr(buffers, 'gray', None)
+        if gray_buf is None or gray_buf.shape != shape:
+            buffers.gray = np.empty(shape, dtype=np.uint8)
+            buffers.edges = np.empty(shape, dtype=np.uint8)
+            buffers.compare = np.empty(shape, dtype=np.uint8)
+        return buffers.gray, buffers.edges, buffers.compare
+
+    def _batch_buffer(self, count: int) -> np.ndarray:
+        """
+        Get the scratch stack that board squares are shrunk into.
+        
+        Args:
+            count (int): Number of squares on the board.
+            
+        Returns:
+            np.ndarray: Buffer of shape (count, feature_size, feature_size, 3).
+        """
+        shape = (count, self._feature_size, self._feature_size, 3)
+        batch = getattr(self._buffers, 'batch', None)
+        if batch is None or batch.shape != shape:
+            batch = self._buffers.batch = np.empty(shape, dtype=np.uint8)
+        return batch
 
-    def analyze_square_features(self, square_image: np.ndarray) -> Dict[str, float]:
+    def analyze_square_features(
+        self,
+        square_image: np.ndarray,
+        gray: Optional[np.ndarray] = None,
+        compute_saturation: bool = False
+    ) -> Dict[str, float]:
         """
         Extract features from a square image for piece recognition.
         
         This method analyzes various features like pixel intensity, edges,
-        and color distribution to help identify pieces.
+        and color distribution to help identify pieces. Squares larger than
+        the feature size are downscaled first.
         
         Args:
             square_image (np.ndarray): Image of a single chess square.
+            gray (Optional[np.ndarray]): Grayscale version of the square, if
+                the caller already has it.
+            compute_saturation (bool): Also compute the average saturation,
+                which needs an extra HSV conversion and is not used by the
+                recognition heuristics.
             
         Returns:
             Dict[str, float]: Dictionary of feature values.
         """
         features = {}
+        dark_threshold = 100
         
-        # Convert to different color spaces for analysis
-        gray = cv2.cvtColor(square_image, cv2.COLOR_BGR2GRAY)
-        hsv = cv2.cvtColor(square_image, cv2.COLOR_BGR2HSV)
-        
-        # Feature 1: Average brightness
-        features['avg_brightness'] = np.mean(gray)
+        square_image, gray, edge_scale = self._downscale_square(square_image, gray)
+        gray_buf, edge_buf, cmp_buf = self._feature_buffers(square_image.shape[:2])
+        if gray is None:
+            gray = cv2.cvtColor(square_image, cv2.COLOR_BGR2GRAY, dst=gray_buf)
         
-        # Feature 2: Brightness variance (helps detect if square has content)
-        features['brightness_variance'] = np.var(gray)
+        # Feature 1 & 2: Average brightness and brightness variance (helps
+        # detect if square has content), both from a single pass
+        mean, stddev = cv2.meanStdDev(gray)
+        features['avg_brightness'] = mean[0, 0]
+        features['brightness_variance'] = stddev[0, 0] ** 2
         
         # Feature 3: Edge density (pieces have more edges than empty squares)
-        edges = cv2.Canny(gray, 50, 150)
-        features['edge_density'] = np.sum(edges > 0) / edges.size
+        edges = cv2.Canny(gray, 50, 150, edges=edge_buf)
+        features['edge_density'] = cv2.countNonZero(edges) / edges.size * edge_scale
         
         # Feature 4: Dark pixel ratio (pieces are generally darker)
-        dark_threshold = 100
-        features['dark_pixel_ratio'] = np.sum(gray < dark_threshold) / gray.size
+        dark_mask = cv2.compare(gray, dark_threshold, cv2.CMP_LT, dst=cmp_buf)
+        features['dark_pixel_ratio'] = cv2.countNonZero(dark_mask) / dark_mask.size
         
         # Feature 5: Color saturation (helps distinguish colored boards/pieces)
-        features['avg_saturation'] = np.mean(hsv[:, :, 1])
+        if compute_saturation:
+            hsv = cv2.cvtColor(square_image, cv2.COLOR_BGR2HSV)
+            features['avg_saturation'] = cv2.mean(cv2.extractChannel(hsv, 1))[0]
         
-        # Feature 6: Center region darkness (pieces occupy center)
+        # Feature 6: Center region darkness (pieces occupy center); a view of
+        # the dark mask, so no second comparison pass is needed
         h, w = gray.shape
-        center_region = gray[h//4:3*h//4, w//4:3*w//4]
-        features['center_darkness'] = np.mean(center_region < dark_threshold)
+        center_mask = dark_mask[h//4:3*h//4, w//4:3*w//4]
+        features['center_darkness'] = cv2.countNonZero(center_mask) / center_mask.size
+        
+        # Feature 7: Center region brightness (used to estimate piece color)
+        features['center_mean_brightness'] = cv2.mean(gray[h//4:3*h//4, w//4:3*w//4])[0]
         
         return features
 
-    def is_square_empty(self, square_image: np.ndarray) -> Tuple[bool, float]:
+    def is_square_empty(
+        self,
+        square_image: np.ndarray,
+        features: Optional[Dict[str, float]] = None
+    ) -> Tuple[bool, float]:
         """
         Determine if a square is empty or contains a piece.
         
@@ -175,73 +609,70 @@ class PieceRecognizer:
         
         Args:
             square_image (np.ndarray): Image of a chess square.
+            features (Optional[Dict[str, float]]): Precomputed features of the
+                square from analyze_square_features.
             
         Returns:
             Tuple[bool, float]: (is_empty, confidence)
         """
-        features = self.analyze_square_features(square_image)
+        if features is None:
+            features = self.analyze_square_features(square_image)
         
         # Heuristics for empty square detection
         # Empty squares typically have:
         # - Low edge density
         # - Low brightness variance
         # - Uniform color
+        #
+        # The score is kept in tenths as an integer:
+        # - Low edge density suggests empty (0.4)
+        # - Low variance suggests uniform square (0.3)
+        # - Low center darkness suggests no piece (0.3)
+        empty_score = (
+            (features['edge_density'] < 0.1) * 4
+            + (features['brightness_variance'] < 500) * 3
+            + (features['center_darkness'] < 0.3) * 3
+        )
         
-        empty_score = 0.0
-        
-        # Low edge density suggests empty
-        if features['edge_density'] < 0.1:
-            empty_score += 0.4
-        
-        # Low variance suggests uniform square
-        if features['brightness_variance'] < 500:
-            empty_score += 0.3
-        
-        # Low center darkness suggests no piece
-        if features['center_darkness'] < 0.3:
-            empty_score += 0.3
-        
-        is_empty = empty_score > 0.5
-        confidence = empty_score if is_empty else (1.0 - empty_score)
+        is_empty = bool(empty_score > 5)
+        confidence = (empty_score if is_empty else 10 - empty_score) / 10.0
         
         return (is_empty, confidence)
 
-    def estimate_piece_color(self, square_image: np.ndarray) -> Tuple[Optional[chess.Color], float]:
+    def estimate_piece_color(
+        self,
+        square_image: np.ndarray,
+        features: Optional[Dict[str, float]] = None
+    ) -> Tuple[Optional[chess.Color], float]:
         """
         Estimate whether a piece is white or black.
         
         Args:
             square_image (np.ndarray): Image of a square with a piece.
+            features (Optional[Dict[str, float]]): Precomputed features of the
+                square from analyze_square_features.
             
         Returns:
             Tuple[Optional[chess.Color], float]: (color, confidence)
         """
-        gray = cv2.cvtColor(square_image, cv2.COLOR_BGR2GRAY)
+        if features is None:
+            features = self.analyze_square_features(square_image)
         
-        # Extract center region where piece is likely located
-        h, w = gray.shape
-        center_region = gray[h//4:3*h//4, w//4:3*w//4]
-        
-        # Calculate average brightness of the piece region
-        avg_brightness = np.mean(center_region)
+        # Average brightness of the center region where the piece is located
+        avg_brightness = features['center_mean_brightness']
         
         # Determine color based on brightness
-        # White pieces are typically brighter than black pieces
-        if avg_brightness > 150:
-            return (chess.WHITE, 0.7)
-        elif avg_brightness < 100:
-            return (chess.BLACK, 0.7)
-        else:
-            # Medium brightness - less confident
-            if avg_brightness > 125:
-                return (chess.WHITE, 0.5)
-            else:
-                return (chess.BLACK, 0.5)
+        # White pieces are typically brighter than black pieces; medium
+        # brightness (100-150) gives a less confident estimate
+        return _COLOR_TABLE[
+            (avg_brightness >= 100) + (avg_brightness > 125) + (avg_brightness > 150)
+        ]
 
     def estimate_piece_type(
         self,
         square_image: np.ndarray,
-        piece_color: chess.Color
+        piece_color: chess.Color,
+        features: Optional[Dict[str, float]] = None
     ) -> Tuple[Optional[int], float]:
         """
         Estimate the type of piece (pawn, knight, etc.).
@@ -252,11 +683,14 @@ class PieceRecognizer:
         Args:
             square_image (np.ndarray): Image of a square with a piece.
             piece_color (chess.Color): The color of the piece.
+            features (Optional[Dict[str, float]]): Precomputed features of the
+                square from analyze_square_features.
             
         Returns:
             Tuple[Optional[int], float]: (piece_type, confidence)
         """
-        features = self.analyze_square_features(square_image)
+        if features is None:
+            features = self.analyze_square_features(square_image)
         
         # This is a simplified heuristic approach
         # In a real system, you would use ML models or template matching
@@ -291,8 +725,15 @@ class PieceRecognizer:
         Returns:
             RecognitionResult: Recognition result with confidence and alternatives.
         """
+        # Check the memory layout once rather than letting every OpenCV call
+        # copy a badly strided square
+        square_image = _opencv_layout(square_image)
+        
+        # Extract the features once and share them between all estimates
+        features = self.analyze_square_features(square_image)
+        
         # First, check if square is empty
-        is_empty, empty_confidence = self.is_square_empty(square_image)
+        is_empty, empty_confidence = self.is_square_empty(square_image, features)
         
         if is_empty and empty_confidence > self.min_confidence:
             return RecognitionResult(
@@ -301,20 +742,14 @@ class PieceRecognizer:
             )
         
         # If not empty, try to identify the piece
-        piece_color, color_confidence = self.estimate_piece_color(square_image)
-        piece_type, type_confidence = self.estimate_piece_type(square_image, piece_color)
+        piece_color, color_confidence = self.estimate_piece_color(square_image, features)
+        piece_type, type_confidence = self.estimate_piece_type(square_image, piece_color, features)
         
         # Combine confidences
         overall_confidence = (color_confidence + type_confidence) / 2
         
         # Map to PieceType enum
-        piece_enum = None
-        for pt in PieceType:
-            if pt != PieceType.EMPTY:
-                symbol, p_type, p_color = pt.value
-                if p_type == piece_type and p_color == piece_color:
-                    piece_enum = pt
-                    break
+        piece_enum = self._piece_map.get((piece_type, piece_color))
         
         # If confidence is too low, mark as unknown (empty with low confidence)
         if overall_confidence < self.min_confidence:
@@ -340,6 +775,7 @@ class PieceRecognizer:
             List[List[RecognitionResult]]: 8x8 grid of recognition results.
         """
         results = []
+        log_squares = self.logger.isEnabledFor(logging.DEBUG)
         
         for row_idx, row in enumerate(squares):
             row_results = []
@@ -348,53 +784,298 @@ class PieceRecognizer:
                 row_results.append(result)
                 
                 # Log recognition
-                square_name = chess.square_name(
-                    chess.square(col_idx, 7 - row_idx)
-                )
-                self.logger.debug(f"{square_name}: {result}")
+                if log_squares:
+                    square_name = _SQUARE_NAMES[row_idx][col_idx]
+                    self.logger.debug(f"{square_name}: {result}")
             
             results.append(row_results)
         
         self.logger.info("Board recognition complete")
         return results
 
-    def results_to_fen(self, results: List[List[RecognitionResult]]) -> str:
+    def analyze_board_features(
+        self,
+        board: np.ndarray,
+        source_size: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
         """
-        Convert recognition results to FEN notation.
+        Extract the recognition features of many equally sized squares at once.
+        
+        Computes the same values as analyze_square_features as arrays with
+        one entry per square, using bulk NumPy reductions instead of one call
+        per square.
+        
+        Args:
+            board (np.ndarray): Stacked BGR square images of shape (N, H, W, 3).
+            source_size (Optional[int]): Height of the original squares when
+                board holds them already shrunk to the feature size.
+            
+        Returns:
+            Dict[str, np.ndarray]: Feature name to array of shape (N,).
+        """
+        dark_threshold = 100
+        edge_scale = 1.0
+        if source_size is not None and source_size > self._max_native_size:
+            edge_scale = self._feature_size / source_size
+        elif board.shape[1] > self._max_native_size:
+            edge_scale = self._feature_size / board.shape[1]
+            board = np.stack([
+                self._downscale_square(square)[0] for square in board
+            ])
+        n, h, w = board.shape[:3]
+        
+        # Color conversion is per pixel, so all squares convert in one call
+        gray = cv2.cvtColor(board.reshape(n * h, w, 3), cv2.COLOR_BGR2GRAY).reshape(n, h, w)
+        center = (slice(None), slice(h//4, 3*h//4), slice(w//4, 3*w//4))
+        center_size = (3*h//4 - h//4) * (3*w//4 - w//4)
+        
+        # Threshold all squares with one cv2.compare over the stacked view and
+        # count the set pixels per square, as countNonZero does per square
+        dark_mask = cv2.compare(gray.reshape(n * h, w), dark_threshold, cv2.CMP_LT).reshape(n, h, w)
+        dark_counts = np.count_nonzero(dark_mask, axis=(1, 2))
+        center_dark_counts = np.count_nonzero(dark_mask[center], axis=(1, 2))
+        
+        # Edges are found per square: on a mosaic, edges along the square
+        # borders would be counted and the results would differ from
+        # recognize_piece. Canny runs into one reused edge buffer
+        edge_buf = self._feature_buffers((h, w))[1]
+        edge_counts = np.fromiter(
+            (_count_edge_pixels(square, edge_buf) for square in gray),
+            dtype=np.float64,
+            count=n
+        )
+        
+        # The brightness statistics are reduced in one pass, on the uint8
+        # data directly instead of upcasting the whole stack to float64 as
+        # ndarray.mean would
+        stats = _board_stats(gray)
+        
+        return {
+            'avg_brightness': stats[0],
+            'brightness_variance': stats[1],
+            'edge_density': edge_counts / (h * w) * edge_scale,
+            'dark_pixel_ratio': dark_counts / (h * w),
+            'center_darkness': center_dark_counts / center_size,
+            'center_mean_brightness': stats[2]
+        }
+
+    def recognize_board_vectorized(
+        self,
+        squares: List[List[np.ndarray]]
+    ) -> List[List[RecognitionResult]]:
+        """
+        Recognize all pieces on a chess board in one batch.
+        
+        Gives the same results as recognize_board, but the squares are stacked
+        into a single array and the heuristics are evaluated for all of them
+        in one fused pass (compiled with numba when it is installed). All
+        squares must have the same size.
+        
+        Args:
+            squares (List[List[np.ndarray]]): 8x8 grid of square images.
+            
+        Returns:
+            List[List[RecognitionResult]]: 8x8 grid of recognition results.
+        """
+        n_rows = len(squares)
+        n_cols = len(squares[0])
+        flat_squares = [square for row in squares for square in row]
+        
+        # Large squares are shrunk straight into one reused stack instead of
+        # stacking the full-size squares and shrinking each one afterwards
+        height = flat_squares[0].shape[0]
+        if height > self._max_native_size:
+            board = self._batch_buffer(len(flat_squares))
+            size = (self._feature_size, self._feature_size)
+            for i, square in enumerate(flat_squares):
+                cv2.resize(square, size, dst=board[i], interpolation=cv2.INTER_AREA)
+            features = self.analyze_board_features(board, source_size=height)
+        else:
+            features = self.analyze_board_features(np.stack(flat_squares))
+        
+        feature_matrix = np.column_stack([features[name] for name in _BOARD_FEATURES])
+        codes, confidences = _score_board(feature_matrix, self.min_confidence)
+        
+        flat_results = []
+        for code, confidence in zip(codes.tolist(), confidences.tolist()):
+            if code < 0:
+                self.logger.warning(f"Low confidence recognition: {confidence:.2f}")
+                piece_enum = None
+            else:
+                piece_enum = _BOARD_CODES[code]
+            flat_results.append(RecognitionResult(
+                piece_type=piece_enum,
+                confidence=confidence
+            ))
+        
+        self.logger.info("Board recognition complete")
+        return [flat_results[row * n_cols:(row + 1) * n_cols] for row in range(n_rows)]
+
+    def warmup(self):
+        """
+        Prepare the batched recognition path ahead of the first board.
+        
+        Runs the board feature extraction and scoring once on a blank board,
+        which compiles the numba kernel (or loads it from the cache) so the
+        first real recognition does not pay for it.
+        """
+        blank_board = np.zeros((64, self._feature_size, self._feature_size, 3), dtype=np.uint8)
+        features = self.analyze_board_features(blank_board)
+        feature_matrix = np.column_stack([features[name] for name in _BOARD_FEATURES])
+        _score_board(feature_matrix, self.min_confidence)
+
+    def results_to_piece_map(
+        self,
+        results: List[List[RecognitionResult]]
+    ) -> Dict[chess.Square, chess.Piece]:
+        """
+        Convert recognition results to a python-chess piece map.
+        
+        Args:
+            results (List[List[RecognitionResult]]): 8x8 grid of results, row 0
+                being rank 8.
+            
+        Returns:
+            Dict[chess.Square, chess.Piece]: Dictionary of square -> piece;
+                empty and unknown squares are left out.
+        """
+        piece_map = {}
+        for row_idx, row in enumerate(results):
+            for col_idx, result in enumerate(row):
+                piece = result.to_chess_piece()
+                if piece is not None:
+                    piece_map[chess.square(col_idx, 7 - row_idx)] = piece
+        return piece_map
+
+    def results_to_codes(
+        self,
+        results: List[List[RecognitionResult]],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert recognition results to a grid of piece codes.
+        
+        Codes are 0 for an empty square, -1 for an unknown piece and
+        1-12 for the black then white pieces, pawn to king.
         
         Args:
             results (List[List[RecognitionResult]]): 8x8 grid of results.
+            out (Optional[np.ndarray]): int8 array of the grid's shape to fill.
             
         Returns:
-            str: FEN string representing the board position (piece placement only).
+            np.ndarray: int8 grid of piece codes.
         """
-        fen_rows = []
+        n_rows, n_cols = len(results), len(results[0])
+        codes = np.fromiter(
+            (_PIECE_CODES[result.piece_type] for row in results for result in row),
+            dtype=np.int8,
+            count=n_rows * n_cols
+        ).reshape(n_rows, n_cols)
+        if out is None:
+            return codes
+        out[...] = codes
+        return out
+
+    def results_to_records(
+        self,
+        results: List[List[RecognitionResult]],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert recognition results to a flat array of board records.
         
-        for row in results:
-            fen_row = ""
-            empty_count = 0
+        Square (row, col) of the grid is record row * n_cols + col, so a
+        single square is read or replaced with one index.
+        
+        Args:
+            results (List[List[RecognitionResult]]): 8x8 grid of results.
+            out (Optional[np.ndarray]): RESULT_DTYPE array of one record per square to fill.
             
-            for result in row:
-                if result.piece_type == PieceType.EMPTY or result.piece_type is None:
-                    empty_count += 1
-                else:
-                    if empty_count > 0:
-                        fen_row += str(empty_count)
-                        empty_count = 0
-                    fen_row += result.to_fen_char()
+        Returns:
+            np.ndarray: RESULT_DTYPE array of (piece code, confidence) records.
+        """
+        count = len(results) * len(results[0])
+        records = np.empty(count, dtype=RESULT_DTYPE) if out is None else out
+        records['piece'] = self.results_to_codes(results).ravel()
+        records['conf'] = np.fromiter(
+            (result.confidence for row in results for result in row),
+            dtype=np.float64,
+            count=count
+        )
+        return records
+
+    @staticmethod
+    def result_to_record(result: RecognitionResult) -> Tuple[int, float]:
+        """
+        Convert one recognition result to a board record.
+        
+        Args:
+            result (RecognitionResult): Recognition result of a square.
             
-            # Add remaining empty squares
-            if empty_count > 0:
-                fen_row += str(empty_count)
+        Returns:
+            Tuple[int, float]: (piece code, confidence) for a RESULT_DTYPE array.
+        """
+        return _PIECE_CODES[result.piece_type], result.confidence
+
+    @staticmethod
+    def record_to_result(record: np.void) -> RecognitionResult:
+        """
+        Convert one board record back to a recognition result.
+        
+        Args:
+            record (np.void): RESULT_DTYPE record of a square.
             
-            fen_rows.append(fen_row)
+        Returns:
+            RecognitionResult: Result with the record's piece type and confidence.
+        """
+        code = int(record['piece'])
+        return RecognitionResult(
+            piece_type=_BOARD_CODES[code] if code >= 0 else None,
+            confidence=float(record['conf'])
+        )
+
+    def codes_to_fen(self, codes: np.ndarray) -> str:
+        """
+        Convert a grid of piece codes to FEN notation.
         
-        # Join rows with '/' and add default game state
-        # (white to move, all castling available, no en passant, etc.)
-        fen = '/'.join(fen_rows) + ' w KQkq - 0 1'
+        Each 8-square row is read as one 64-bit word whose empty-square
+        flags are gathered into a byte with a single multiplication; that
+        byte selects the row's precomputed FEN template, and the piece
+        letters of the whole board are filled in with one formatting step.
         
-        return fen
-    
+        Grids of any other shape are converted square by square.
+        
+        Args:
+            codes (np.ndarray): int8 piece codes of the 64 squares, as an 8x8
+                grid or flat in row-major order, see results_to_codes.
+            
+        Returns:
+            str: FEN string representing the board position (piece placement only).
+        """
+        if codes.shape in ((8, 8), (64,)):
+            raw = codes.astype(np.int8, copy=False).tobytes()
+            words = struct.unpack('>8Q', raw.translate(_EMPTY_FLAGS))
+            templates = [_EMPTY_PATTERNS[word * _GATHER_BITS >> 56 & 0xFF] for word in words]
+            placement = '/'.join(templates) % tuple(raw.translate(_PIECE_LETTERS, _EMPTY_BYTES))
+        else:
+            placement = '/'.join(_codes_row_to_fen(row) for row in np.atleast_2d(codes))
+        
+        # Default game state (white to move, all castling available,
+        # no en passant, etc.)
+        return placement + ' w KQkq - 0 1'
+
+    def results_to_fen(self, results: List[List[RecognitionResult]]) -> str:
+        """
+        Convert recognition results to FEN notation.
+        
+        Args:
+            results (List[List[RecognitionResult]]): 8x8 grid of results.
+            
+        Returns:
+            str: FEN string representing the board position (piece placement only).
+        """
+        return self.codes_to_fen(self.results_to_codes(results))
+
     def retrain_from_feedback(self, training_data: List[Tuple[np.ndarray, PieceType]]) -> Dict:
         """
         Retrain/fine-tune the piece recognizer using feedback data.
@@ -425,7 +1106,10 @@ class PieceRecognizer:
         # Analyze features for each piece type
         piece_features = {}
         for piece_type, images in piece_samples.items():
-            features_list = [self.analyze_square_features(img) for img in images]
+            features_list = [
+                self.analyze_square_features(img, compute_saturation=True)
+                for img in images
+            ]
             
             # Calculate average features for this piece type
             avg_features = {}
@@ -440,14 +1124,125 @@ class PieceRecognizer:
             
             piece_features[piece_type.name] = avg_features
         
+        return self._apply_learned_features(
+            piece_features,
+            {pt.name: len(imgs) for pt, imgs in piece_samples.items()},
+            len(training_data)
+        )
+    
+    def retrain_from_batch(
+        self,
+        squares: np.ndarray,
+        labels: np.ndarray,
+        source_sizes: np.ndarray,
+        native_squares: Optional[Dict[int, np.ndarray]] = None
+    ) -> Dict:
+        """
+        Retrain the piece recognizer from feedback stacked into arrays.
+        
+        Gives the same statistics as retrain_from_feedback, but the features
+        of all samples are computed in one batch and each piece type's
+        samples are selected with a boolean mask over the labels.
+        
+        Args:
+            squares: Square images resized to the feature size, shape (N, S, S, 3).
+            labels: Label codes, 1 + the index of the correct PieceType.
+            source_sizes: Heights of the squares before resizing.
+            native_squares: Original images of the samples no larger than
+                max_native_size, by index into squares. Their features are
+                computed at their own size, as retrain_from_feedback does.
+            
+        Returns:
+            Dict: Training statistics and improvements.
+        """
+        if len(labels) == 0:
+            self.logger.warning("No training data provided")
+            return {'status': 'failed', 'reason': 'no_data'}
+        
+        self.logger.info(f"Retraining with {len(labels)} samples")
+        
+        features = self._training_features(squares)
+        
+        # Edge densities measured on shrunk squares are scaled back per sample
+        size = squares.shape[1]
+        features['edge_density'] = features['edge_density'] * np.where(
+            source_sizes > self._max_native_size, size / np.maximum(source_sizes, 1), 1.0
+        )
+        
+        # Small samples are not downscaled by analyze_square_features, so
+        # their rows are recomputed from the originals, one stack per size
+        if native_squares:
+            by_shape = {}
+            for index, image in native_squares.items():
+                by_shape.setdefault(image.shape, []).append(index)
+            for indices in by_shape.values():
+                native = self._training_features(
+                    np.stack([native_squares[index] for index in indices])
+                )
+                for key, values in native.items():
+                    features[key][indices] = values
+        
+        piece_types = (None,) + tuple(PieceType)
+        piece_features = {}
+        piece_counts = {}
+        for code in np.unique(labels).tolist():
+            mask = labels == code
+            name = piece_types[code].name
+            piece_features[name] = {
+                key: {
+                    'mean': np.mean(values[mask]),
+                    'std': np.std(values[mask]),
+                    'min': np.min(values[mask]),
+                    'max': np.max(values[mask])
+                }
+                for key, values in features.items()
+            }
+            piece_counts[name] = int(np.count_nonzero(mask))
+        
+        return self._apply_learned_features(piece_features, piece_counts, len(labels))
+    
+    def _training_features(self, squares: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute the retraining features of equally sized squares.
+        
+        Args:
+            squares: Stacked BGR square images of shape (N, H, W, 3).
+            
+        Returns:
+            Dict[str, np.ndarray]: analyze_board_features plus the average
+                saturation, one entry per square.
+        """
+        features = self.analyze_board_features(squares)
+        n, h, w = squares.shape[:3]
+        hsv = cv2.cvtColor(squares.reshape(n * h, w, 3), cv2.COLOR_BGR2HSV).reshape(n, h, w, 3)
+        features['avg_saturation'] = hsv[..., 1].mean(axis=(1, 2))
+        return features
+    
+    def _apply_learned_features(
+        self,
+        piece_features: Dict,
+        piece_counts: Dict[str, int],
+        samples_processed: int
+    ) -> Dict:
+        """
+        Adopt learned per-piece features and summarize the retraining run.
+        
+        Args:
+            piece_features: Feature statistics per piece type name.
+            piece_counts: Number of samples per piece type name.
+            samples_processed: Total number of samples.
+            
+        Returns:
+            Dict: Training statistics and improvements.
+        """
         # Adjust thresholds based on learned features
         self._update_thresholds_from_features(piece_features)
         
         stats = {
             'status': 'success',
-            'samples_processed': len(training_data),
-            'piece_types_trained': len(piece_samples),
-            'piece_counts': {pt.name: len(imgs) for pt, imgs in piece_samples.items()},
+            'samples_processed': samples_processed,
+            'piece_types_trained': len(piece_features),
+            'piece_counts': piece_counts,
             'learned_features': piece_features
         }
         
@@ -0,0 +1,31 @@
+"""
+Piece Type Module.
+
+This module defines the PieceType enumeration shared by piece recognition
+and feedback collection. It only depends on python-chess so that modules
+which merely need piece identities do not pull in OpenCV or NumPy.
+"""
+
+import chess
+from enum import Enum
+
+
+class PieceType(Enum):
+    """
+    Enumeration of chess piece types with their symbols.
+    
+    These map to chess.Piece types for compatibility with python-chess library.
+    """
+    WHITE_PAWN = ('P', chess.PAWN, chess.WHITE)
+    WHITE_KNIGHT = ('N', chess.KNIGHT, chess.WHITE)
+    WHITE_BISHOP = ('B', chess.BISHOP, chess.WHITE)
+    WHITE_ROOK = ('R', chess.ROOK, chess.WHITE)
+    WHITE_QUEEN = ('Q', chess.QUEEN, chess.WHITE)
+    WHITE_KING = ('K', chess.KING, chess.WHITE)
+    BLACK_PAWN = ('p', chess.PAWN, chess.BLACK)
+    BLACK_KNIGHT = ('n', chess.KNIGHT, chess.BLACK)
+    BLACK_BISHOP = ('b', chess.BISHOP, chess.BLACK)
+    BLACK_ROOK = ('r', chess.ROOK, chess.BLACK)
+    BLACK_QUEEN = ('q', chess.QUEEN, chess.BLACK)
+    BLACK_KING = ('k', chess.KING, chess.BLACK)
+    EMPTY = ('.', None, None)
@@ -7,19 +7,26 @@ application using Tkinter.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-from typing import Optional, List
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import chess
-import cv2
 import numpy as np
 from PIL import Image, ImageTk
 
 from src.chess_engine.board_manager import BoardManager
 from src.chess_engine.threat_analyzer import ThreatAnalyzer
 from src.chess_engine.move_suggester import MoveSuggester
-from src.computer_vision.board_detector import BoardDetector
-from src.computer_vision.piece_recognizer import PieceRecognizer
+
+# The computer vision modules (and OpenCV with them) are imported on a
+# worker thread by _init_cv_models so the window appears without waiting
+if TYPE_CHECKING:
+    from src.computer_vision.board_detector import BoardDetector
+    from src.computer_vision.piece_recognizer import PieceRecognizer, RecognitionResult
 
 
 class ChessEngineGUI:
@@ -59,23 +66,107 @@ class ChessEngineGUI:
         self.threat_analyzer = ThreatAnalyzer(self.board_manager)
         self.move_suggester = MoveSuggester(self.board_manager)
         
-        # Initialize computer vision components
-        self.board_detector = BoardDetector()
-        self.piece_recognizer = PieceRecognizer()
+        # Computer vision components, created in the background
+        self.board_detector: Optional['BoardDetector'] = None
+        self.piece_recognizer: Optional['PieceRecognizer'] = None
         
         # State variables
         self.current_image = None
         self.detected_board = None
         self.recognition_results = None
         
+        # Number of the latest image load; loads that finish after a newer
+        # one was requested are dropped
+        self._load_generation = 0
+        
+        # Display state: canvas and image size of the last draw, the RGB
+        # buffer of the displayed image and the converted images of recent
+        # draws, keyed by (image id, shape, canvas width, canvas height)
+        self._last_canvas_size = None
+        self._rgb_buffer = None
+        self._resize_cache = {}
+        
+        # Tk image shown on the canvas, reused while its size stays the same
+        self._tk_image = None
+        
+        # FEN of the position shown in the board state tab
+        self._last_board_fen = None
+        
+        # Threat summaries and best moves per FEN; both only depend on the
+        # position, so repeated clicks reuse them
+        self._threat_cache = {}
+        self._moves_cache = {}
+        
+        # Image currently on the canvas and whether a resize redraw of it
+        # is already scheduled
+        self._displayed_image = None
+        self._redraw_pending = False
+        
         # Set up logging
         self.logger = logging.getLogger(__name__)
         
+        # Board detection and recognition run here, off the Tk main thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        
         # Build the GUI
         self._build_gui()
         
+        # Load the computer vision components while the window is shown
+        self._cv_ready = self._executor.submit(self._init_cv_models)
+        self._cv_ready.add_done_callback(
+            lambda f: self.root.after(0, self._on_cv_models_ready, f)
+        )
+        
         self.logger.info("Chess Engine GUI initialized")
 
+    def _init_cv_models(self):
+        """
+        Import and create the computer vision components.
+        
+        Runs on a worker thread. Also warms up the recognition kernels, which
+        happens while the user is still picking a screenshot.
+        """
+        from src.computer_vision.board_detector import BoardDetector
+        from src.computer_vision.piece_recognizer import PieceRecognizer
+        
+        self.board_detector = BoardDetector()
+        self.piece_recognizer = PieceRecognizer()
+        self.piece_recognizer.warmup()
+
+    def _on_cv_models_ready(self, future: Future):
+        """
+        Enable recognition once the computer vision components are loaded.
+        
+        Runs on the Tk main thread.
+        
+        Args:
+            future (Future): Future of the _init_cv_models call.
+        """
+        try:
+            future.result()
+        except Exception as e:
+            self.logger.error(f"Failed to load computer vision components: {e}", exc_info=True)
+            messagebox.showerror("Error", f"Failed to load computer vision components: {e}")
+            return
+        
+        if self.current_image is not None:
+            self.recognize_button.config(state=tk.NORMAL)
+
+    def _load_image_worker(self, file_path: str) -> Optional[np.ndarray]:
+        """
+        Load an image once the computer vision components are available.
+        
+        Runs on a worker thread.
+        
+        Args:
+            file_path (str): Path of the image.
+            
+        Returns:
+            Optional[np.ndarray]: Loaded image or None if loading failed.
+        """
+        self._cv_ready.result()
+        return self.board_detector.load_image(file_path)
+
     def _build_gui(self):
         """
         Build the GUI layout and widgets.
@@ -212,6 +303,12 @@ class ChessEngineGUI:
         )
         self.image_canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Single image item, updated by display_image for every new image
+        self._image_item = self.image_canvas.create_image(300, 200, anchor=tk.CENTER)
+        
+        # Refit the displayed image when the canvas is resized
+        self.image_canvas.bind("<Configure>", self._on_resize)
+        
         # === Bottom Right Panel: Analysis Results ===
         results_frame = ttk.LabelFrame(
             main_container,
@@ -224,14 +321,16 @@ class ChessEngineGUI:
         self.results_notebook = ttk.Notebook(results_frame)
         self.results_notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Board state tab
-        self.board_text = scrolledtext.ScrolledText(
+        # Board state tab; the board text has a fixed size, so a plain label
+        # is enough and cheaper to update than a text widget
+        self.board_label = ttk.Label(
             self.results_notebook,
-            width=60,
-            height=10,
-            font=("Courier", 10)
+            font=("Courier", 10),
+            anchor=tk.NW,
+            justify=tk.LEFT,
+            padding="5"
         )
-        self.results_notebook.add(self.board_text, text="Board State")
+        self.results_notebook.add(self.board_label, text="Board State")
         
         # Threats tab
         self.threats_text = scrolledtext.ScrolledText(
@@ -253,13 +352,20 @@ class ChessEngineGUI:
         
         # Initialize board display
         self.update_board_display()
+        
+        # Lay everything out once, then stop the main container from
+        # resizing itself to its contents, so later text and button updates
+        # do not ripple geometry changes through the whole grid
+        self.root.update_idletasks()
+        main_container.grid_propagate(False)
+        self.main_container = main_container
 
     def load_image(self):
         """
         Load a chess board screenshot from file.
         
         Opens a file dialog for the user to select an image file,
-        loads it, and displays it in the GUI.
+        loads it in the background, and displays it in the GUI.
         """
         # Open file dialog
         file_path = filedialog.askopenfilename(
@@ -273,19 +379,51 @@ class ChessEngineGUI:
         if not file_path:
             return
         
-        # Load image using OpenCV
-        self.current_image = self.board_detector.load_image(file_path)
+        # Decode the image on the worker thread; large screenshots would
+        # otherwise freeze the GUI while loading
+        self.image_status_label.config(text="Loading...")
+        self._load_generation += 1
+        generation = self._load_generation
+        future = self._executor.submit(self._load_image_worker, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_image_loaded, f, file_path, generation)
+        )
+
+    def _on_image_loaded(self, future: Future, file_path: str, generation: int):
+        """
+        Display an image once it has been loaded.
+        
+        Runs on the Tk main thread. Loads overtaken by a newer one are dropped.
+        
+        Args:
+            future (Future): Future of the _load_image_worker call.
+            file_path (str): Path of the loaded image.
+            generation (int): Number of the load request.
+        """
+        if generation != self._load_generation:
+            self.logger.info(f"Dropping superseded image load: {file_path}")
+            return
+        
+        try:
+            self.current_image = future.result()
+        except Exception as e:
+            self.logger.error(f"Failed to load image: {e}", exc_info=True)
+            self.current_image = None
         
         if self.current_image is None:
             messagebox.showerror("Error", "Failed to load image")
+            self.image_status_label.config(text="No image loaded")
             return
         
+        self._resize_cache.clear()
+        
         # Display image
         self.display_image(self.current_image)
         
         # Update status
         self.image_status_label.config(text=f"Loaded: {Path(file_path).name}")
-        self.recognize_button.config(state=tk.NORMAL)
+        if self._cv_ready.done() and self._cv_ready.exception() is None:
+            self.recognize_button.config(state=tk.NORMAL)
         
         self.logger.info(f"Image loaded: {file_path}")
 
@@ -296,8 +434,9 @@ class ChessEngineGUI:
         Args:
             image (np.ndarray): OpenCV image to display.
         """
-        # Convert BGR to RGB
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        import cv2
+        
+        self._displayed_image = image
         
         # Resize to fit canvas while maintaining aspect ratio
         canvas_width = self.image_canvas.winfo_width()
@@ -309,56 +448,178 @@ class ChessEngineGUI:
         if canvas_height <= 1:
             canvas_height = 400
         
-        h, w = image_rgb.shape[:2]
-        scale = min(canvas_width / w, canvas_height / h)
-        new_width = int(w * scale)
-        new_height = int(h * scale)
+        h, w = image.shape[:2]
+        self._last_canvas_size = (canvas_width, canvas_height, w, h)
         
-        resized = cv2.resize(image_rgb, (new_width, new_height))
+        # Redraws of the same image at the same size reuse the converted image
+        cache_key = (id(image), image.shape, canvas_width, canvas_height)
+        cached = self._resize_cache.get(cache_key)
+        if cached is not None:
+            pil_image = cached[1]
+        else:
+            scale = min(canvas_width / w, canvas_height / h)
+            new_width = max(1, int(w * scale))
+            new_height = max(1, int(h * scale))
+            
+            # Convert BGR to RGB at whichever resolution is smaller: after
+            # shrinking (with INTER_AREA, the best filter for it) or before
+            # enlarging. The output goes to a buffer reused while the display
+            # size stays the same
+            if self._rgb_buffer is None or self._rgb_buffer.shape[:2] != (new_height, new_width):
+                self._rgb_buffer = np.empty((new_height, new_width, 3), dtype=np.uint8)
+            if new_width < w:
+                resized = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+                image_rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+            else:
+                image_rgb = cv2.resize(
+                    cv2.cvtColor(image, cv2.COLOR_BGR2RGB),
+                    (new_width, new_height),
+                    dst=self._rgb_buffer,
+                    interpolation=cv2.INTER_LINEAR
+                )
+            
+            # Convert to PIL Image (which copies RGB data out of the buffer)
+            pil_image = Image.fromarray(image_rgb)
+            
+            # The entry holds on to the source image so its id stays unique
+            if len(self._resize_cache) >= 8:
+                self._resize_cache.clear()
+            self._resize_cache[cache_key] = (image, pil_image)
+        
+        # Copy the pixels into the existing Tk image, creating a new one only
+        # when the display size changes. The reference kept in _tk_image
+        # also prevents garbage collection
+        tk_image = self._tk_image
+        if tk_image is not None and (tk_image.width(), tk_image.height()) == pil_image.size:
+            tk_image.paste(pil_image)
+        else:
+            self._tk_image = ImageTk.PhotoImage(pil_image)
+            self.image_canvas.itemconfigure(self._image_item, image=self._tk_image)
         
-        # Convert to PIL Image and then to ImageTk
-        pil_image = Image.fromarray(resized)
-        tk_image = ImageTk.PhotoImage(pil_image)
+        # Center the canvas image item
+        self.image_canvas.coords(self._image_item, canvas_width // 2, canvas_height // 2)
+
+    def _on_resize(self, event: tk.Event):
+        """
+        Schedule a redraw of the displayed image after a canvas resize.
         
-        # Keep a reference to prevent garbage collection
-        self.image_canvas.image = tk_image
+        Resizing the window produces a burst of Configure events; they are
+        coalesced into at most one redraw per idle cycle.
         
-        # Clear canvas and display image
-        self.image_canvas.delete("all")
-        self.image_canvas.create_image(
-            canvas_width // 2,
-            canvas_height // 2,
-            image=tk_image,
-            anchor=tk.CENTER
-        )
+        Args:
+            event (tk.Event): The Configure event.
+        """
+        if self._redraw_pending or self._displayed_image is None:
+            return
+        
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """
+        Redraw the displayed image if the canvas size has changed.
+        """
+        self._redraw_pending = False
+        
+        canvas_size = (self.image_canvas.winfo_width(), self.image_canvas.winfo_height())
+        if self._last_canvas_size is not None and canvas_size == self._last_canvas_size[:2]:
+            return
+        
+        self.display_image(self._displayed_image)
 
     def recognize_board(self):
         """
         Detect and recognize the chess board from the loaded image.
         
         Uses computer vision to detect the board, extract squares,
-        and recognize pieces.
+        and recognize pieces. The work runs on a background thread so the
+        GUI stays responsive; the results are shown by
+        _recognize_board_done once it finishes.
         """
         if self.current_image is None:
             messagebox.showwarning("Warning", "Please load an image first")
             return
         
-        # Show progress
+        # Show progress and prevent a second run while this one is in flight
         self.image_status_label.config(text="Detecting board...")
-        self.root.update()
+        self.recognize_button.config(state=tk.DISABLED)
+        self.confirm_button.config(state=tk.DISABLED)
+        
+        # The image doubles as the request token: a result is only shown
+        # while its image is still the loaded one
+        image = self.current_image
+        future = self._executor.submit(self._recognize_board_worker, image)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._recognize_board_done, f, image)
+        )
+
+    def _recognize_board_worker(
+        self,
+        image: np.ndarray
+    ) -> Optional[Tuple[
+        np.ndarray,
+        List[List[np.ndarray]],
+        List[List['RecognitionResult']],
+        Dict[chess.Square, chess.Piece],
+        str
+    ]]:
+        """
+        Detect the board and recognize its pieces.
         
-        # Detect board
-        detection_result = self.board_detector.detect_board(self.current_image)
+        Runs on a worker thread and must not touch any Tk widgets.
         
-        if detection_result is None:
-            # Try with full image as board
-            h, w = self.current_image.shape[:2]
-            detection_result = self.board_detector.detect_board(
-                self.current_image,
-                manual_region=(0, 0, w, h)
-            )
+        Args:
+            image (np.ndarray): Screenshot to recognize.
+            
+        Returns:
+            Optional[Tuple]: (board_image, squares, recognition_results,
+                piece_map, fen), or None if no board could be detected.
+        """
+        # Detect board, falling back to the full image as board
+        detection_result = self.board_detector.detect_board(image, fallback_full_image=True)
         
         if detection_result is None:
+            return None
+        
+        board_image, squares = detection_result
+        
+        # Recognize pieces; divide_into_squares gives equally sized squares,
+        # so the batched path can be used
+        recognition_results = self.piece_recognizer.recognize_board_vectorized(squares)
+        
+        # The piece map sets up the board directly; the FEN is only shown for
+        # confirmation and editing
+        piece_map = self.piece_recognizer.results_to_piece_map(recognition_results)
+        fen = self.piece_recognizer.results_to_fen(recognition_results)
+        
+        return board_image, squares, recognition_results, piece_map, fen
+
+    def _recognize_board_done(self, future: Future, image: np.ndarray):
+        """
+        Show the results of a finished board recognition.
+        
+        Runs on the Tk main thread. Results for an image that has since been
+        replaced are dropped.
+        
+        Args:
+            future (Future): Future of the _recognize_board_worker call.
+            image (np.ndarray): Image the recognition was run on.
+        """
+        if image is not self.current_image:
+            self.logger.info("Dropping recognition result for a replaced image")
+            return
+        
+        self.recognize_button.config(state=tk.NORMAL)
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.error(f"Board recognition failed: {e}", exc_info=True)
+            messagebox.showerror("Error", f"Board recognition failed: {e}")
+            self.image_status_label.config(text="Detection failed")
+            return
+        
+        if result is None:
             messagebox.showerror(
                 "Error",
                 "Could not detect chess board. Please try a different image."
@@ -366,38 +627,32 @@ class ChessEngineGUI:
             self.image_status_label.config(text="Detection failed")
             return
         
-        board_image, squares = detection_result
+        board_image, squares, self.recognition_results, piece_map, fen = result
         self.detected_board = (board_image, squares)
+        self._resize_cache.clear()
         
         # Display detected board
         self.display_image(board_image)
-        self.image_status_label.config(text="Recognizing pieces...")
-        self.root.update()
-        
-        # Recognize pieces
-        self.recognition_results = self.piece_recognizer.recognize_board(squares)
-        
-        # Generate FEN and display for confirmation
-        fen = self.piece_recognizer.results_to_fen(self.recognition_results)
         
         # Show FEN in entry
         self.fen_entry.delete(0, tk.END)
         self.fen_entry.insert(0, fen)
         
         # Update board display with recognized position
-        if self.board_manager.set_position_from_fen(fen):
-            self.update_board_display()
-            self.image_status_label.config(text="Recognition complete - Please confirm")
-            self.confirm_button.config(state=tk.NORMAL)
-            
-            # Ask user to confirm
-            message = "Board position recognized!\n\n"
-            message += "Please review the board state in the 'Board State' tab.\n"
-            message += "If correct, click 'Confirm Position' to proceed with analysis."
-            messagebox.showinfo("Recognition Complete", message)
-        else:
-            messagebox.showerror("Error", "Invalid board position recognized")
-            self.image_status_label.config(text="Invalid position")
+        self.board_manager.set_piece_map(piece_map)
+        self._clear_analysis_cache()
+        self.update_board_display()
+        self.image_status_label.config(text="Recognition complete - Please confirm")
+        self.confirm_button.config(state=tk.NORMAL)
+        
+        # Lay out and redraw all of the above together before the dialog
+        self.root.update_idletasks()
+        
+        # Ask user to confirm
+        message = "Board position recognized!\n\n"
+        message += "Please review the board state in the 'Board State' tab.\n"
+        message += "If correct, click 'Confirm Position' to proceed with analysis."
+        messagebox.showinfo("Recognition Complete", message)
 
     def confirm_position(self):
         """
@@ -437,47 +692,79 @@ class ChessEngineGUI:
             return
         
         if self.board_manager.set_position_from_fen(fen):
+            self._clear_analysis_cache()
             self.update_board_display()
             messagebox.showinfo("Success", "Position set successfully!")
             self.logger.info(f"Position set from FEN: {fen}")
         else:
             messagebox.showerror("Error", "Invalid FEN string")
 
-    def update_board_display(self):
+    def _set_text(self, widget: scrolledtext.ScrolledText, text: str):
         """
-        Update the board state display in the text widget.
+        Replace the contents of a read-only results text widget.
+        
+        The whole text is inserted at once, and the widget is only writable
+        while it is being replaced.
+        
+        Args:
+            widget (scrolledtext.ScrolledText): Widget to update.
+            text (str): New contents.
+        """
+        widget.configure(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, text)
+        widget.configure(state=tk.DISABLED)
+
+    def update_board_display(self):
         """
-        self.board_text.delete(1.0, tk.END)
+        Update the board state display in the board state label.
         
-        # Display ASCII board
-        board_str = str(self.board_manager)
-        self.board_text.insert(tk.END, board_str + "\n\n")
+        Does nothing if the position is the one already displayed.
+        """
+        fen = self.board_manager.get_fen()
+        if fen == self._last_board_fen:
+            return
         
-        # Display FEN
-        self.board_text.insert(tk.END, f"FEN: {self.board_manager.get_fen()}\n\n")
+        # Display ASCII board and FEN
+        parts = [
+            str(self.board_manager), "\n\n",
+            f"FEN: {fen}\n\n"
+        ]
         
         # Display game state
         turn = "White" if self.board_manager.get_turn() == chess.WHITE else "Black"
-        self.board_text.insert(tk.END, f"Turn: {turn}\n")
+        parts.append(f"Turn: {turn}\n")
         
         if self.board_manager.is_checkmate():
-            self.board_text.insert(tk.END, "Status: CHECKMATE\n")
+            parts.append("Status: CHECKMATE\n")
         elif self.board_manager.is_check():
-            self.board_text.insert(tk.END, "Status: CHECK\n")
+            parts.append("Status: CHECK\n")
         elif self.board_manager.is_stalemate():
-            self.board_text.insert(tk.END, "Status: STALEMATE\n")
+            parts.append("Status: STALEMATE\n")
         else:
-            self.board_text.insert(tk.END, "Status: Normal\n")
+            parts.append("Status: Normal\n")
+        
+        self.board_label.config(text="".join(parts))
+        self._last_board_fen = fen
+
+    def _clear_analysis_cache(self):
+        """
+        Drop the cached threat summaries and move suggestions.
+        """
+        self._threat_cache.clear()
+        self._moves_cache.clear()
 
     def analyze_threats(self):
         """
         Analyze threats in the current position and display results.
         """
-        self.threats_text.delete(1.0, tk.END)
-        
         # Get threat summary
-        summary = self.threat_analyzer.get_threat_summary()
-        self.threats_text.insert(tk.END, summary)
+        fen = self.board_manager.get_fen()
+        summary = self._threat_cache.get(fen)
+        if summary is None:
+            summary = self.threat_analyzer.get_threat_summary()
+            self._threat_cache[fen] = summary
+        self._set_text(self.threats_text, summary)
         
         # Switch to threats tab
         self.results_notebook.select(1)
@@ -488,28 +775,34 @@ class ChessEngineGUI:
         """
         Get best move suggestions with explanations and display them.
         """
-        self.moves_text.delete(1.0, tk.END)
-        
         # Get best moves
-        best_moves = self.move_suggester.get_best_moves(num_moves=5)
+        fen = self.board_manager.get_fen()
+        best_moves = self._moves_cache.get(fen)
+        if best_moves is None:
+            best_moves = self.move_suggester.get_best_moves(num_moves=5)
+            self._moves_cache[fen] = best_moves
         
         if not best_moves:
-            self.moves_text.insert(tk.END, "No legal moves available (game over)")
+            self._set_text(self.moves_text, "No legal moves available (game over)")
             return
         
         # Display each move with explanation
-        self.moves_text.insert(tk.END, "=== BEST MOVES ===\n\n")
+        parts = ["=== BEST MOVES ===\n\n"]
         
         for i, move_eval in enumerate(best_moves, 1):
-            self.moves_text.insert(tk.END, f"{i}. Move: {move_eval.move.uci()}\n")
-            self.moves_text.insert(tk.END, f"   Score: {move_eval.score:.2f}\n")
-            self.moves_text.insert(tk.END, f"   Explanation: {move_eval.explanation}\n")
+            parts.append(
+                f"{i}. Move: {move_eval.move.uci()}\n"
+                f"   Score: {move_eval.score:.2f}\n"
+                f"   Explanation: {move_eval.explanation}\n"
+            )
             
             if move_eval.tactical_themes:
                 themes = ", ".join(move_eval.tactical_themes)
-                self.moves_text.insert(tk.END, f"   Themes: {themes}\n")
+                parts.append(f"   Themes: {themes}\n")
             
-            self.moves_text.insert(tk.END, "\n")
+            parts.append("\n")
+        
+        self._set_text(self.moves_text, "".join(parts))
         
         # Switch to best moves tab
         self.results_notebook.select(2)
@@ -521,11 +814,12 @@ class ChessEngineGUI:
         Reset the board to starting position.
         """
         self.board_manager.reset()
+        self._clear_analysis_cache()
         self.update_board_display()
         
         # Clear analysis results
-        self.threats_text.delete(1.0, tk.END)
-        self.moves_text.delete(1.0, tk.END)
+        self._set_text(self.threats_text, "")
+        self._set_text(self.moves_text, "")
         
         messagebox.showinfo("Reset", "Board reset to starting position")
         self.logger.info("Board reset")
@@ -543,6 +837,20 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    # Move the configured handlers (console and, when launched through
+    # src.main, the rotating log file) behind a listener thread so the
+    # Tk event loop only ever enqueues records
+    root_logger = logging.getLogger()
+    handlers = [handler for handler in root_logger.handlers
+                if not isinstance(handler, QueueHandler)]
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Create and run GUI
     root = tk.Tk()
     app = ChessEngineGUI(root)
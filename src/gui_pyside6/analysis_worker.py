@@ -0,0 +1,100 @@
+"""
+Analysis Worker Module for PySide6 Chess Engine GUI.
+
+This module provides the worker object that runs threat analysis and move
+search off the Qt main thread.
+"""
+
+from PySide6.QtCore import QObject, Signal, Slot
+import logging
+from typing import Optional
+
+from src.chess_engine.board_manager import BoardManager
+from src.chess_engine.threat_analyzer import ThreatAnalyzer
+from src.chess_engine.move_suggester import MoveSuggester
+
+
+class AnalysisWorker(QObject):
+    """
+    Worker that analyzes chess positions on a QThread.
+    
+    The worker keeps its own BoardManager, so the position shown in the
+    window can change while an analysis runs. A run is abandoned as soon
+    as a different position is requested or the request is cancelled.
+    
+    Signals:
+        finished: Emitted with (fen, threat summary, best moves) of a completed run.
+        failed: Emitted with (fen, error message) when an analysis fails.
+    """
+    
+    finished = Signal(str, str, list)
+    failed = Signal(str, str)
+    
+    def __init__(self, num_moves: int = 5):
+        """
+        Initialize the analysis worker.
+        
+        Args:
+            num_moves (int): Number of best moves to search for.
+        """
+        super().__init__()
+        self.num_moves = num_moves
+        self.logger = logging.getLogger(__name__)
+        self._board_manager: Optional[BoardManager] = None
+        self._threat_analyzer: Optional[ThreatAnalyzer] = None
+        self._move_suggester: Optional[MoveSuggester] = None
+        
+        # Position the window currently wants analyzed; written from the
+        # main thread, read between moves by the running search
+        self._requested_fen: Optional[str] = None
+    
+    def request(self, fen: str):
+        """
+        Mark a position as the one wanted, abandoning any other running analysis.
+        
+        Call from the main thread before queuing run for the same FEN.
+        
+        Args:
+            fen (str): FEN of the position to analyze.
+        """
+        self._requested_fen = fen
+    
+    def cancel(self):
+        """Abandon the running analysis, if any."""
+        self._requested_fen = None
+    
+    @Slot(str)
+    def run(self, fen: str):
+        """
+        Analyze a position and emit the results.
+        
+        Args:
+            fen (str): FEN of the position to analyze.
+        """
+        if self._requested_fen != fen:
+            return
+        
+        if self._board_manager is None:
+            self._board_manager = BoardManager()
+            self._threat_analyzer = ThreatAnalyzer(self._board_manager)
+            self._move_suggester = MoveSuggester(self._board_manager)
+        
+        try:
+            if not self._board_manager.set_position_from_fen(fen):
+                self.failed.emit(fen, "Invalid board position.")
+                return
+            threat_summary = self._threat_analyzer.get_threat_summary()
+            best_moves = self._move_suggester.get_best_moves(
+                num_moves=self.num_moves,
+                should_stop=lambda: self._requested_fen != fen
+            )
+        except Exception as e:
+            self.logger.error(f"Error during engine analysis: {e}", exc_info=True)
+            self.failed.emit(fen, str(e))
+            return
+        
+        if self._requested_fen != fen:
+            self.logger.info("Engine analysis abandoned")
+            return
+        
+        self.finished.emit(fen, threat_summary, best_moves)
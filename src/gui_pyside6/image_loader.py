@@ -0,0 +1,167 @@
+"""
+Image Loader Module for PySide6 Chess Engine GUI.
+
+This module probes image dimensions from the file header with QImageReader,
+so oversized images are refused before anything is decoded, and provides
+the ImageLoadWorker that decodes image files off the Qt main thread.
+"""
+
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QImageReader
+import logging
+from typing import Optional, Tuple
+import mmap
+import os
+import cv2
+import numpy as np
+
+from src.computer_vision.board_detector import BoardDetector
+from .pipeline_cache import PipelineResultCache
+
+
+# Largest image accepted at all, in pixels (about Qt's 256 MB decode limit)
+MAX_IMAGE_PIXELS = 64_000_000
+
+# Files above this size are memory-mapped rather than read when OpenCV decodes them
+MMAP_THRESHOLD = 50 << 20
+
+logger = logging.getLogger(__name__)
+
+
+def probe_image_size(file_path: str,
+                     max_pixels: int = MAX_IMAGE_PIXELS) -> Optional[Tuple[int, int]]:
+    """
+    Read the image dimensions from the file header without decoding.
+    
+    Only the header is read, so this is cheap enough to call on the main
+    thread before handing the file to ImageLoadWorker.
+    
+    Args:
+        file_path (str): Path to the image file.
+        max_pixels (int): Largest accepted image size in pixels.
+    
+    Returns:
+        Optional[Tuple[int, int]]: Tuple of (width, height), or None if Qt
+            cannot read the header.
+    
+    Raises:
+        ValueError: If the image is larger than max_pixels.
+    """
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if not size.isValid():
+        return None
+    
+    width, height = size.width(), size.height()
+    if width * height > max_pixels:
+        raise ValueError(
+            f"Image is too large ({width}x{height}). "
+            f"Please use an image below {max_pixels // 1_000_000} megapixels."
+        )
+    return width, height
+
+
+def decode_mapped(file_path: str, flags: int = cv2.IMREAD_COLOR) -> Optional[np.ndarray]:
+    """
+    Decode an image file with OpenCV from a memory map of the file.
+    
+    OpenCV decodes straight out of the page cache, so no file-sized copy
+    is made in user space.
+    
+    Args:
+        file_path (str): Path to the image file.
+        flags (int): cv2.imdecode flags, e.g. a reduced-resolution flag.
+    
+    Returns:
+        Optional[np.ndarray]: Decoded BGR image, or None if decoding failed.
+    """
+    try:
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buffer = np.frombuffer(mm, dtype=np.uint8)
+            image = cv2.imdecode(buffer, flags)
+            # Release the export so the map can be closed
+            del buffer
+    except (OSError, ValueError) as e:
+        logger.error(f"Error mapping image {file_path}: {e}")
+        return None
+    
+    if image is None:
+        logger.error(f"Failed to decode image: {file_path}")
+    return image
+
+
+class ImageLoadWorker(QObject):
+    """
+    Worker that reads, downscales and hashes image files on a QThread.
+    
+    Images are decoded with OpenCV. Check the size with probe_image_size
+    on the main thread before queuing run.
+    
+    Signals:
+        loaded: Emitted with (file path, BGR image, scale, content digest).
+        failed: Emitted with (file path, user-facing message) when loading fails.
+    """
+    
+    loaded = Signal(str, object, float, str)
+    failed = Signal(str, str)
+    
+    def __init__(self, board_detector: BoardDetector):
+        """
+        Initialize the image load worker.
+        
+        Args:
+            board_detector (BoardDetector): Detector whose loader decodes the images.
+        """
+        super().__init__()
+        self.board_detector = board_detector
+    
+    @Slot(str, int)
+    def run(self, file_path: str, max_dimension: int):
+        """
+        Load an image file at no more than max_dimension on its long side.
+        
+        Args:
+            file_path (str): Path to the image file.
+            max_dimension (int): Longest side of the loaded image.
+        """
+        # The file can vanish or become unreadable after it was chosen
+        try:
+            # Decode at the largest power-of-two reduction that stays above max_dimension
+            size = self.board_detector.image_size(file_path)
+            if os.path.getsize(file_path) > MMAP_THRESHOLD:
+                # Large files are decoded from a memory map instead of a read copy
+                image = decode_mapped(
+                    file_path, self.board_detector.reduced_read_flag(size, max_dimension)
+                )
+            else:
+                image = self.board_detector.load_image(file_path, target_max_side=max_dimension)
+        except OSError as e:
+            self.failed.emit(file_path, f"Failed to read the image file:\n{e}")
+            return
+        
+        if image is None:
+            self.failed.emit(file_path, "Failed to load image. Please check the file format.")
+            return
+        
+        full_side = max(size) if size is not None else max(image.shape[:2])
+        
+        # Clamp the working resolution; square detection does not need more
+        h, w = image.shape[:2]
+        if max(h, w) > max_dimension:
+            resize = max_dimension / max(h, w)
+            image = cv2.resize(
+                image,
+                (int(w * resize), int(h * resize)),
+                interpolation=cv2.INTER_AREA
+            )
+        scale = max(image.shape[:2]) / full_side
+        
+        try:
+            digest = PipelineResultCache.digest_file(file_path)
+        except OSError as e:
+            self.failed.emit(file_path, f"Failed to read the image file:\n{e}")
+            return
+        
+        self.loaded.emit(file_path, image, scale, digest)
@@ -8,27 +8,35 @@ GUI components and integrates the chess engine with computer vision.
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QPushButton, QLabel, QFileDialog,
-    QMessageBox, QTabWidget, QStatusBar
+    QMessageBox, QTabWidget, QStatusBar, QProgressBar
 )
-from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import Qt, Signal, Slot, QThread, QTimer
+from PySide6.QtGui import QAction, QIcon, QColor
+from collections import OrderedDict
+import gc
 import logging
-from pathlib import Path
+import os
+from functools import cached_property
 from typing import Optional
-import numpy as np
 import chess
+import cv2
+import numpy as np
 
 from src.chess_engine.board_manager import BoardManager
-from src.chess_engine.threat_analyzer import ThreatAnalyzer
-from src.chess_engine.move_suggester import MoveSuggester
 from src.computer_vision.board_detector import BoardDetector
-from src.computer_vision.piece_recognizer import PieceRecognizer, PieceType, RecognitionResult
+from src.computer_vision.piece_recognizer import (
+    RESULT_DTYPE, PieceRecognizer, PieceType, RecognitionResult
+)
 from src.computer_vision.feedback_manager import FeedbackManager
 
 from .widgets.pipeline_widget import PipelineVisualizationWidget
 from .widgets.board_widget import BoardReconstructionWidget
 from .widgets.analysis_widget import EngineAnalysisWidget
 from .widgets.control_panel import ControlPanelWidget
+from .pipeline_worker import PipelineWorker
+from .analysis_worker import AnalysisWorker
+from .pipeline_cache import PipelineResultCache
+from .image_loader import ImageLoadWorker, probe_image_size
 
 
 class MainWindow(QMainWindow):
@@ -44,13 +52,38 @@ class MainWindow(QMainWindow):
     
     Attributes:
         board_manager (BoardManager): Chess board state manager.
-        threat_analyzer (ThreatAnalyzer): Threat analysis engine.
-        move_suggester (MoveSuggester): Move suggestion engine.
         board_detector (BoardDetector): Computer vision board detector.
-        piece_recognizer (PieceRecognizer): Piece recognition system.
+        piece_recognizer (PieceRecognizer): Piece recognition system (created on first use).
+        analysis_widget (EngineAnalysisWidget): Engine analysis tab (created on first use).
         logger (logging.Logger): Application logger.
+        
+    Signals:
+        start_loading: Emitted to hand a file path and maximum dimension
+            to the image loader on the pipeline worker thread.
+        start_processing: Emitted to hand an image, orientation preference
+            and run generation to the pipeline worker thread.
+        clear_stage_cache: Emitted to drop the worker's cached stage results.
+        clear_recognition_cache: Emitted to drop the worker's cached square results.
+        warm_up: Emitted once at startup to run the pipeline worker's warmup.
+        start_analysis: Emitted to hand a FEN to the analysis worker thread.
     """
     
+    start_loading = Signal(str, int)  # file path, maximum dimension
+    start_processing = Signal(object, str, int)  # image, orientation preference, generation
+    clear_stage_cache = Signal()
+    clear_recognition_cache = Signal()
+    warm_up = Signal()
+    start_analysis = Signal(str)  # FEN
+    
+    # Longest side, in pixels, of the image the pipeline works on
+    MAX_IMAGE_DIMENSION = 1600
+    
+    # Longest side of the raw image preview (the widest pipeline display)
+    PREVIEW_DIMENSION = 600
+    
+    # Number of analyzed positions kept for instant re-analysis
+    ANALYSIS_CACHE_SIZE = 64
+    
     def __init__(self):
         """Initialize the main window and all components."""
         super().__init__()
@@ -60,28 +93,62 @@ class MainWindow(QMainWindow):
         
         # Initialize chess engine components
         self.board_manager = BoardManager()
-        self.threat_analyzer = ThreatAnalyzer(self.board_manager)
-        self.move_suggester = MoveSuggester(self.board_manager)
         
-        # Initialize computer vision components
+        # Initialize computer vision components (the recognizer is created
+        # lazily when the first image is processed)
         self.board_detector = BoardDetector()
-        self.piece_recognizer = PieceRecognizer()
         
         # Initialize feedback manager
         self.feedback_manager = FeedbackManager()
         
+        # Processed results of previously seen image files
+        self.pipeline_cache = PipelineResultCache()
+        
         # State variables
         self.current_image: Optional[np.ndarray] = None
+        self.image_scale: float = 1.0  # current_image size / file size
+        self._image_digest: Optional[str] = None  # Content hash of the loaded file
+        self._loading_path: Optional[str] = None  # File being loaded by the worker
+        self._pending_cache_key: Optional[str] = None  # Key for the running pipeline
+        self._pipeline_busy = False  # A pipeline run is queued or running
+        # Identifies the current pipeline run; signals of older runs are dropped
+        self._pipeline_generation = 0
         self.detected_board: Optional[tuple] = None
         self.recognition_results: Optional[list] = None
         self.board_squares: Optional[list] = None  # Store square images for feedback
+        # recognition_results as flat (piece code, confidence) records, square
+        # (row, col) at row * 8 + col (see PieceRecognizer.results_to_records)
+        self._board_records = np.zeros(64, dtype=RESULT_DTYPE)
         self.board_orientation: str = 'white'  # Track current board orientation
         
+        # Run the image processing pipeline on a background thread
+        self._pipeline_thread = QThread(self)
+        self._worker = PipelineWorker(self.board_detector)
+        self._worker.moveToThread(self._pipeline_thread)
+        # Images are decoded on the same thread, ahead of any processing
+        self._loader = ImageLoadWorker(self.board_detector)
+        self._loader.moveToThread(self._pipeline_thread)
+        self._pipeline_thread.start()
+        
+        # Run engine analysis on its own thread; results are kept per FEN
+        self._analysis_thread = QThread(self)
+        self._analysis_worker = AnalysisWorker(num_moves=5)
+        self._analysis_worker.moveToThread(self._analysis_thread)
+        self._analysis_thread.start()
+        # FEN -> (summary, moves), least recently used first
+        self._analysis_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # Position the analysis worker was last asked to analyze
+        self._analysis_fen: Optional[str] = None
+        
         # Set up the UI
         self._setup_ui()
         self._setup_menu_bar()
         self._connect_signals()
         
+        # Compile the recognition kernels once the event loop is running,
+        # rather than on the first click of Process Image
+        QTimer.singleShot(0, self._warm_up_pipeline)
+        
         self.logger.info("Main window initialized")
     
     def _setup_ui(self):
@@ -117,9 +184,11 @@ class MainWindow(QMainWindow):
         self.board_widget = BoardReconstructionWidget()
         self.tab_widget.addTab(self.board_widget, "Board Reconstruction")
         
-        # Engine analysis tab
-        self.analysis_widget = EngineAnalysisWidget()
-        self.tab_widget.addTab(self.analysis_widget, "Engine Analysis")
+        # Engine analysis tab; the widget is built the first time it is needed
+        self._analysis_widget: Optional[EngineAnalysisWidget] = None
+        self._analysis_container = QWidget()
+        QVBoxLayout(self._analysis_container).setContentsMargins(0, 0, 0, 0)
+        self.tab_widget.addTab(self._analysis_container, "Engine Analysis")
         
         right_splitter.addWidget(self.tab_widget)
         
@@ -137,6 +206,31 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready - Load an image to begin")
+        
+        # Pipeline progress, one step per pipeline stage
+        self._progress = QProgressBar()
+        self._progress.setRange(0, 7)
+        self._progress.setMaximumWidth(200)
+        self.status_bar.addPermanentWidget(self._progress)
+    
+    @Slot()
+    def _warm_up_pipeline(self):
+        """Hand the recognizer to the pipeline worker and warm it up there."""
+        self._worker.piece_recognizer = self.piece_recognizer
+        self.warm_up.emit()
+    
+    @cached_property
+    def piece_recognizer(self) -> PieceRecognizer:
+        """PieceRecognizer: Piece recognition system, created on first use."""
+        return PieceRecognizer()
+    
+    @property
+    def analysis_widget(self) -> EngineAnalysisWidget:
+        """EngineAnalysisWidget: Engine analysis tab content, created on first use."""
+        if self._analysis_widget is None:
+            self._analysis_widget = EngineAnalysisWidget()
+            self._analysis_container.layout().addWidget(self._analysis_widget)
+        return self._analysis_widget
     
     def _setup_menu_bar(self):
         """Set up the application menu bar."""
@@ -170,6 +264,10 @@ class MainWindow(QMainWindow):
         step_action.triggered.connect(self.step_through_pipeline)
         process_menu.addAction(step_action)
         
+        clear_cache_action = QAction("&Clear Pipeline Cache", self)
+        clear_cache_action.triggered.connect(self.clear_pipeline_cache)
+        process_menu.addAction(clear_cache_action)
+        
         process_menu.addSeparator()
         
         flip_action = QAction("&Flip Board Orientation", self)
@@ -223,15 +321,45 @@ class MainWindow(QMainWindow):
         # Pipeline widget signals
         self.pipeline_widget.stage_selected.connect(self.on_pipeline_stage_selected)
         
+        # Build the analysis widget when its tab is first shown
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        
         # Board widget signals
         self.board_widget.piece_corrected.connect(self.on_piece_corrected)
+        
+        # Image loader signals
+        self.start_loading.connect(self._loader.run, Qt.QueuedConnection)
+        self._loader.loaded.connect(self._on_image_loaded)
+        self._loader.failed.connect(self._on_image_load_failed)
+        
+        # Pipeline worker signals
+        self.start_processing.connect(self._worker.run, Qt.QueuedConnection)
+        self.clear_stage_cache.connect(self._worker.clear_cache, Qt.QueuedConnection)
+        self.clear_recognition_cache.connect(
+            self._worker.clear_recognition_cache, Qt.QueuedConnection
+        )
+        self.warm_up.connect(self._worker.warmup, Qt.QueuedConnection)
+        self._worker.progress.connect(self._on_pipeline_progress)
+        self._worker.preprocessed.connect(self._on_preprocessed)
+        self._worker.contours_ready.connect(self._on_contours_ready)
+        self._worker.board_ready.connect(self._on_board_ready)
+        self._worker.recognized.connect(self._on_recognized)
+        self._worker.fen_ready.connect(self._on_fen_ready)
+        self._worker.failed.connect(self._on_pipeline_failed)
+        
+        # Analysis worker signals
+        self.start_analysis.connect(self._analysis_worker.run, Qt.QueuedConnection)
+        self._analysis_worker.finished.connect(self._on_analysis_finished)
+        self._analysis_worker.failed.connect(self._on_analysis_failed)
     
+    @Slot()
     def load_image(self):
         """
         Load a chess board image from file.
         
-        Opens a file dialog for the user to select an image,
-        loads it using the board detector, and displays it.
+        Opens a file dialog for the user to select an image and
+        hands it to the image loader on the worker thread; the image is
+        displayed by _on_image_loaded.
         """
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -244,57 +372,112 @@ class MainWindow(QMainWindow):
             return
         
         self.logger.info(f"Loading image: {file_path}")
-        self.status_bar.showMessage(f"Loading image: {Path(file_path).name}")
-        
-        # Load image
-        self.current_image = self.board_detector.load_image(file_path)
+        self.status_bar.showMessage(f"Loading image: {os.path.basename(file_path)}")
         
-        if self.current_image is None:
-            QMessageBox.critical(
-                self,
-                "Error",
-                "Failed to load image. Please check the file format."
-            )
+        # Refuse oversized images from the file header, before decoding
+        try:
+            probe_image_size(file_path)
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
             self.status_bar.showMessage("Failed to load image")
             return
         
+        # Decoding runs on the worker thread; _on_image_loaded takes over
+        self._loading_path = file_path
+        self.control_panel.enable_process_button(False)
+        self.start_loading.emit(file_path, self.MAX_IMAGE_DIMENSION)
+    
+    @Slot(str, object, float, str)
+    def _on_image_loaded(self, file_path: str, image: np.ndarray, scale: float, digest: str):
+        """
+        Make a loaded image the current image and display it.
+        
+        Args:
+            file_path (str): Path of the loaded file.
+            image (np.ndarray): Loaded BGR image at working resolution.
+            scale (float): Working size relative to the file's size.
+            digest (str): Content hash of the file.
+        """
+        if file_path != self._loading_path:
+            return  # Another image was chosen meanwhile
+        self._loading_path = None
+        
+        # A run still processing the previous image must not report on this one
+        self._abandon_pipeline_run()
+        
+        self.current_image = image
+        self.image_scale = scale
+        self._image_digest = digest
+        
+        # Cached stage results belong to the previous image
+        self.clear_stage_cache.emit()
+        
         # Display raw image in pipeline widget
-        self.pipeline_widget.set_raw_image(self.current_image)
+        self.pipeline_widget.set_raw_image(self._make_preview(self.current_image))
         
         # Update status
-        self.status_bar.showMessage(f"Loaded: {Path(file_path).name} - Ready to process")
+        self.status_bar.showMessage(f"Loaded: {os.path.basename(file_path)} - Ready to process")
         self.control_panel.enable_process_button(True)
         
         self.logger.info(f"Image loaded successfully: {self.current_image.shape}")
     
-    def _flip_board_data(self, squares):
+    @Slot(str, str)
+    def _on_image_load_failed(self, file_path: str, message: str):
         """
-        Flip board squares and recognition results 180 degrees.
+        Report an image that could not be loaded.
         
         Args:
-            squares: Current squares grid to update.
-            
-        Returns:
-            Updated squares grid after flipping.
+            file_path (str): Path of the file.
+            message (str): User-facing description of the failure.
         """
-        self.board_squares = self.board_detector.flip_board(self.board_squares)
+        if file_path != self._loading_path:
+            return
+        self._loading_path = None
         
-        # Flip recognition results
-        flipped_results = []
-        for row in reversed(self.recognition_results):
-            flipped_row = list(reversed(row))
-            flipped_results.append(flipped_row)
-        self.recognition_results = flipped_results
+        QMessageBox.critical(self, "Error", message)
+        self.status_bar.showMessage("Failed to load image")
+        self.control_panel.enable_process_button(self.current_image is not None)
+    
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """
+        Create the engine analysis widget the first time its tab is shown.
         
-        # Update squares reference for display
-        return self.board_squares
+        Args:
+            index (int): Index of the newly selected tab.
+        """
+        if index == 1:
+            self.analysis_widget
     
+    def _make_preview(self, image: np.ndarray) -> np.ndarray:
+        """
+        Downscale an image to preview size for display.
+        
+        Args:
+            image (np.ndarray): Full working-resolution image.
+            
+        Returns:
+            np.ndarray: Image no larger than PREVIEW_DIMENSION on its long side.
+        """
+        h, w = image.shape[:2]
+        scale = self.PREVIEW_DIMENSION / max(h, w)
+        if scale >= 1.0:
+            return image
+        
+        return cv2.resize(
+            image,
+            (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_AREA
+        )
+    
+    @Slot()
     def process_image(self):
         """
         Process the loaded image through the complete pipeline.
         
-        This method runs all image processing stages and updates
-        the visualization widgets with intermediate results.
+        The pipeline runs on the worker thread; each stage reports back
+        through the worker signals, which update the visualization widgets
+        with intermediate results.
         """
         if self.current_image is None:
             QMessageBox.warning(
@@ -304,132 +487,213 @@ class MainWindow(QMainWindow):
             )
             return
         
-        self.logger.info("Starting image processing pipeline")
-        self.status_bar.showMessage("Processing image...")
+        # The menu action stays enabled while the worker runs
+        if self._pipeline_busy:
+            return
         
-        try:
-            # Step 1: Preprocess image
-            self.status_bar.showMessage("Step 1/7: Preprocessing...")
-            preprocessed = self.board_detector.preprocess_image(self.current_image)
-            self.pipeline_widget.set_preprocessing_result(self.current_image, preprocessed)
-            
-            # Step 2: Detect contours
-            self.status_bar.showMessage("Step 2/7: Detecting contours...")
-            contours = self.board_detector.detect_board_contours(preprocessed)
-            self.pipeline_widget.set_contours(self.current_image, contours)
-            
-            # Step 3: Detect board
-            self.status_bar.showMessage("Step 3/7: Detecting board region...")
-            detection_result = self.board_detector.detect_board(self.current_image)
-            
-            if detection_result is None:
-                # Try with full image as board
-                h, w = self.current_image.shape[:2]
-                detection_result = self.board_detector.detect_board(
-                    self.current_image,
-                    manual_region=(0, 0, w, h)
-                )
-            
-            if detection_result is None:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Could not detect chess board. Please try a different image."
-                )
-                self.status_bar.showMessage("Board detection failed")
+        orientation_pref = self.control_panel.get_orientation_preference()
+        
+        # Reuse the stored result if this image was processed before
+        cache_key = None
+        if self._image_digest is not None:
+            cache_key = f"{self._image_digest}-{orientation_pref}-{self.MAX_IMAGE_DIMENSION}"
+            cached = self.pipeline_cache.load(cache_key)
+            if cached is not None:
+                board_image, squares, results, fen = cached
+                self._pipeline_generation += 1
+                generation = self._pipeline_generation
+                self._pending_cache_key = None
+                self.pipeline_widget.begin_batch()
+                
+                # The cache holds no preprocessing or contour stages, so
+                # drop whatever an earlier run left there
+                self.pipeline_widget.clear()
+                self.pipeline_widget.set_raw_image(self._make_preview(self.current_image))
+                self._on_board_ready(generation, board_image, squares)
+                self._on_recognized(generation, squares, results)
+                self._progress.setValue(7)
+                self._on_fen_ready(generation, fen)
                 return
+        
+        self.status_bar.showMessage("Processing image...")
+        self._progress.setValue(0)
+        self.control_panel.enable_process_button(False)
+        self._pending_cache_key = cache_key
+        self._pipeline_busy = True
+        self._pipeline_generation += 1
+        
+        # Stage results are drawn together when the run ends
+        self.pipeline_widget.begin_batch()
+        
+        # Hand over the recognizer before the queued start signal so the
+        # worker sees it (it is created here on the first run)
+        self._worker.piece_recognizer = self.piece_recognizer
+        self.start_processing.emit(self.current_image, orientation_pref, self._pipeline_generation)
+    
+    def _abandon_pipeline_run(self):
+        """Drop the running pipeline's remaining results, if a run is in flight."""
+        self._pipeline_generation += 1
+        self._pipeline_busy = False
+        self._pending_cache_key = None
+        self.pipeline_widget.end_batch()
+        self._progress.setValue(0)
+    
+    @Slot(int, int, str)
+    def _on_pipeline_progress(self, generation: int, step: int, message: str):
+        """
+        Show the stage the pipeline worker has started.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            step (int): Pipeline step number (1-7).
+            message (str): Stage description.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self._progress.setValue(step)
+        self.status_bar.showMessage(f"Step {step}/7: {message}")
+    
+    @Slot(int, object, object)
+    def _on_preprocessed(self, generation: int, image: np.ndarray, preprocessed: np.ndarray):
+        """
+        Display the preprocessing stage.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            image (np.ndarray): Image the run processes.
+            preprocessed (np.ndarray): Preprocessed image.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self.pipeline_widget.set_preprocessing_result(image, preprocessed)
+    
+    @Slot(int, object, list)
+    def _on_contours_ready(self, generation: int, image: np.ndarray, contours: list):
+        """
+        Display the detected contours.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            image (np.ndarray): Image the run processes.
+            contours (list): Detected board contours.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self.pipeline_widget.set_contours(image, contours)
+    
+    @Slot(int, object, list)
+    def _on_board_ready(self, generation: int, board_image: np.ndarray, squares: list):
+        """
+        Store and display the detected board region and squares.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            board_image (np.ndarray): Extracted board image.
+            squares (list): 8x8 grid of square images.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self.detected_board = (board_image, squares)
+        self.pipeline_widget.set_board_region(board_image)
+        self.pipeline_widget.set_squares(squares)
+    
+    @Slot(int, list, list)
+    def _on_recognized(self, generation: int, squares: list, results: list):
+        """
+        Store and display the orientation-normalized recognition results.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            squares (list): 8x8 grid of square images, white at the bottom.
+            results (list): 8x8 grid of recognition results, white at the bottom.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self.board_squares = squares  # Store for feedback
+        self.recognition_results = results
+        self.piece_recognizer.results_to_records(results, out=self._board_records)
+        self.board_orientation = 'white'
+        self.pipeline_widget.set_recognition_results(squares, results)
+    
+    @Slot(int, str)
+    def _on_fen_ready(self, generation: int, fen: str):
+        """
+        Apply the recognized position and update the board display.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            fen (str): FEN of the recognized position.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self._pipeline_busy = False
+        self.pipeline_widget.end_batch()
+        self.control_panel.enable_process_button(True)
+        
+        if self.board_manager.set_position_from_fen(fen):
+            # Update board reconstruction widget
+            self.board_widget.set_board_orientation(self.board_orientation)
+            self.board_widget.set_board_state(self.board_manager)
+            self.board_widget.set_recognition_results(self.recognition_results)
             
-            board_image, squares = detection_result
-            self.detected_board = (board_image, squares)
-            self.board_squares = squares  # Store for feedback
-            
-            # Step 4: Show board region
-            self.status_bar.showMessage("Step 4/7: Extracting board...")
-            self.pipeline_widget.set_board_region(board_image)
-            
-            # Step 5: Show square segmentation
-            self.status_bar.showMessage("Step 5/7: Segmenting squares...")
-            self.pipeline_widget.set_squares(squares)
-            
-            # Step 6: Recognize pieces
-            self.status_bar.showMessage("Step 6/7: Recognizing pieces...")
-            self.recognition_results = self.piece_recognizer.recognize_board(squares)
+            # Switch to board reconstruction tab
+            self.tab_widget.setCurrentIndex(0)
             
-            # Detect or apply board orientation based on user preference
-            orientation_pref = self.control_panel.get_orientation_preference()
+            self.control_panel.enable_analysis_button(True)
+            self.control_panel.enable_flip_board_button(True)
+            self.control_panel.set_board_orientation(self.board_orientation)
             
-            if orientation_pref == 'auto':
-                # Use automatic detection
-                detected_orientation = self.board_detector.detect_board_orientation(
-                    squares, self.recognition_results
+            if self._pending_cache_key is not None:
+                self.pipeline_cache.store(
+                    self._pending_cache_key, self.detected_board[0],
+                    self.board_squares, self.recognition_results, fen
                 )
-                self.logger.info(f"Physical orientation detected: {detected_orientation}")
-                
-                # If black pieces are at bottom, flip the data to normalize it
-                if detected_orientation == 'black':
-                    self.logger.info("Flipping board data to normalize (black detected at bottom)")
-                    squares = self._flip_board_data(squares)
-                
-                # After normalization, always set to white perspective
-                self.board_orientation = 'white'
-                
-            elif orientation_pref == 'white':
-                # User expects white on bottom - no flipping needed
-                self.board_orientation = 'white'
-                self.logger.info(f"Board orientation (manual): white on bottom")
-                
-            else:  # orientation_pref == 'black'
-                # User expects black on bottom - flip the data to normalize it
-                self.logger.info(f"Board orientation (manual): black on bottom - flipping data")
-                squares = self._flip_board_data(squares)
-                
-                # After normalization, set to white perspective
-                self.board_orientation = 'white'
-            
-            self.pipeline_widget.set_recognition_results(squares, self.recognition_results)
+                self._pending_cache_key = None
             
-            # Step 7: Generate FEN and update board
-            self.status_bar.showMessage("Step 7/7: Generating board position...")
-            fen = self.piece_recognizer.results_to_fen(self.recognition_results)
-            
-            if self.board_manager.set_position_from_fen(fen):
-                # Update board reconstruction widget
-                self.board_widget.set_board_orientation(self.board_orientation)
-                self.board_widget.set_board_state(self.board_manager)
-                self.board_widget.set_recognition_results(self.recognition_results)
-                
-                # Switch to board reconstruction tab
-                self.tab_widget.setCurrentIndex(0)
-                
-                self.status_bar.showMessage("Processing complete - Review the board position")
-                self.control_panel.enable_analysis_button(True)
-                self.control_panel.enable_flip_board_button(True)
-                self.control_panel.set_board_orientation(self.board_orientation)
-                
-                # Show success message
-                QMessageBox.information(
-                    self,
-                    "Processing Complete",
-                    "Board position recognized successfully!\n\n"
-                    "Please review the board reconstruction and run engine analysis."
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to parse the recognized board position."
-                )
-                self.status_bar.showMessage("Invalid board position")
-        
-        except Exception as e:
-            self.logger.error(f"Error during image processing: {e}", exc_info=True)
+            # Non-modal notification so the board can be reviewed right away
+            self.status_bar.showMessage(
+                "Board recognized - Review the board position and run engine analysis",
+                8000
+            )
+            self._highlight_board_tab()
+        else:
             QMessageBox.critical(
                 self,
                 "Error",
-                f"An error occurred during processing:\n{str(e)}"
+                "Failed to parse the recognized board position."
             )
-            self.status_bar.showMessage("Processing failed")
+            self.status_bar.showMessage("Invalid board position")
+    
+    def _highlight_board_tab(self, duration_ms: int = 5000):
+        """
+        Briefly color the board reconstruction tab to draw attention to it.
+        
+        Args:
+            duration_ms (int): How long the highlight stays, in milliseconds.
+        """
+        tab_bar = self.tab_widget.tabBar()
+        tab_bar.setTabTextColor(0, QColor("green"))
+        QTimer.singleShot(duration_ms, tab_bar, lambda: tab_bar.setTabTextColor(0, QColor()))
     
+    @Slot(int, str)
+    def _on_pipeline_failed(self, generation: int, message: str):
+        """
+        Report a pipeline failure.
+        
+        Args:
+            generation (int): Pipeline run the signal belongs to.
+            message (str): User-facing description of the failure.
+        """
+        if generation != self._pipeline_generation:
+            return
+        self._pipeline_busy = False
+        self.pipeline_widget.end_batch()
+        self.control_panel.enable_process_button(True)
+        self._progress.setValue(0)
+        QMessageBox.critical(self, "Error", message)
+        self.status_bar.showMessage("Processing failed")
+    
+    @Slot()
     def step_through_pipeline(self):
         """
         Step through the image processing pipeline interactively.
@@ -448,6 +712,7 @@ class MainWindow(QMainWindow):
         self.pipeline_widget.enable_step_mode()
         self.status_bar.showMessage("Step-through mode enabled - Use Next/Previous buttons")
     
+    @Slot(str)
     def on_pipeline_stage_selected(self, stage_name: str):
         """
         Handle when a pipeline stage is selected.
@@ -457,6 +722,7 @@ class MainWindow(QMainWindow):
         """
         self.status_bar.showMessage(f"Viewing: {stage_name}")
     
+    @Slot()
     def flip_board_orientation(self):
         """
         Flip the board orientation (rotate 180 degrees).
@@ -485,6 +751,7 @@ class MainWindow(QMainWindow):
                 flipped_row = list(reversed(row))
                 flipped_results.append(flipped_row)
             self.recognition_results = flipped_results
+            self._board_records[:] = self._board_records[::-1].copy()
             
             # Toggle orientation
             self.board_orientation = 'black' if self.board_orientation == 'white' else 'white'
@@ -494,7 +761,7 @@ class MainWindow(QMainWindow):
             self.control_panel.set_board_orientation(self.board_orientation)
             
             # Regenerate FEN with flipped data
-            fen = self.piece_recognizer.results_to_fen(self.recognition_results)
+            fen = self.piece_recognizer.codes_to_fen(self._board_records['piece'])
             
             if self.board_manager.set_position_from_fen(fen):
                 # Update board reconstruction widget with new orientation
@@ -503,22 +770,20 @@ class MainWindow(QMainWindow):
                 self.board_widget.set_recognition_results(self.recognition_results)
                 
                 # Update analysis widget with new orientation if it has been displayed
-                self.analysis_widget.set_board_orientation(self.board_orientation)
+                if self._analysis_widget is not None:
+                    self._analysis_widget.set_board_orientation(self.board_orientation)
                 
                 # Update pipeline widget with flipped squares
+                self.pipeline_widget.begin_batch()
                 self.pipeline_widget.set_squares(self.board_squares)
                 self.pipeline_widget.set_recognition_results(self.board_squares, self.recognition_results)
+                self.pipeline_widget.end_batch()
                 
-                self.status_bar.showMessage(f"Board flipped - {self.board_orientation.capitalize()} now at bottom")
-                
-                # Show success message
-                QMessageBox.information(
-                    self,
-                    "Board Flipped",
-                    f"Board orientation flipped successfully!\n\n"
-                    f"Current orientation: {self.board_orientation.capitalize()} at bottom\n\n"
-                    f"You can flip again if needed or run engine analysis."
+                self.status_bar.showMessage(
+                    f"Board flipped - {self.board_orientation.capitalize()} now at bottom",
+                    8000
                 )
+                self._highlight_board_tab()
             else:
                 QMessageBox.critical(
                     self,
@@ -536,14 +801,16 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage("Board flip failed")
     
+    @Slot()
     def run_engine_analysis(self):
         """
         Run chess engine analysis on the current board position.
         
-        Performs threat analysis and generates move suggestions,
-        then displays the results in the analysis widget.
+        Performs threat analysis and generates move suggestions on the
+        analysis thread, then displays the results in the analysis widget.
+        Results are cached per position, so re-analysis is immediate.
         """
-        if self.board_manager.get_fen() == chess.STARTING_FEN:
+        if self.board_manager.is_starting_position():
             QMessageBox.warning(
                 self,
                 "Warning",
@@ -551,38 +818,83 @@ class MainWindow(QMainWindow):
             )
             return
         
+        fen = self.board_manager.get_fen()
+        cached = self._analysis_cache.get(fen)
+        if cached is not None:
+            self._analysis_cache.move_to_end(fen)
+            self._show_analysis(*cached)
+            return
+        
         self.logger.info("Running engine analysis")
         self.status_bar.showMessage("Running engine analysis...")
+        self.control_panel.enable_analysis_button(False)
         
-        try:
-            # Analyze threats
-            threat_summary = self.threat_analyzer.get_threat_summary()
-            
-            # Get best moves
-            best_moves = self.move_suggester.get_best_moves(num_moves=5)
-            
-            # Update analysis widget with current board orientation
-            self.analysis_widget.set_board_orientation(self.board_orientation)
-            self.analysis_widget.set_board_state(self.board_manager)
-            self.analysis_widget.set_threat_analysis(threat_summary)
-            self.analysis_widget.set_best_moves(best_moves)
-            
-            # Switch to analysis tab
-            self.tab_widget.setCurrentIndex(1)
-            
-            self.status_bar.showMessage("Engine analysis complete")
-            
+        # Supersedes (and so stops) any analysis of another position
+        self._analysis_fen = fen
+        self._analysis_worker.request(fen)
+        self.start_analysis.emit(fen)
+    
+    @Slot(str, str, list)
+    def _on_analysis_finished(self, fen: str, threat_summary: str, best_moves: list):
+        """
+        Cache a finished analysis and show it if the position is still current.
+        
+        Args:
+            fen (str): Analyzed position.
+            threat_summary (str): Threat analysis text.
+            best_moves (list): Best MoveEvaluation objects.
+        """
+        self._analysis_cache[fen] = (threat_summary, best_moves)
+        if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        if fen == self._analysis_fen:
+            self._analysis_fen = None
+            self.control_panel.enable_analysis_button(True)
+        
+        if fen == self.board_manager.get_fen():
+            self._show_analysis(threat_summary, best_moves)
             self.logger.info("Engine analysis completed successfully")
+    
+    @Slot(str, str)
+    def _on_analysis_failed(self, fen: str, message: str):
+        """
+        Report a failed analysis of the requested or shown position.
         
-        except Exception as e:
-            self.logger.error(f"Error during engine analysis: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"An error occurred during analysis:\n{str(e)}"
-            )
-            self.status_bar.showMessage("Analysis failed")
+        Args:
+            fen (str): Position whose analysis failed.
+            message (str): Error description.
+        """
+        if fen != self._analysis_fen and fen != self.board_manager.get_fen():
+            return  # A superseded analysis; a newer one may still be running
+        self._analysis_fen = None
+        self.control_panel.enable_analysis_button(True)
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"An error occurred during analysis:\n{message}"
+        )
+        self.status_bar.showMessage("Analysis failed")
     
+    def _show_analysis(self, threat_summary: str, best_moves: list):
+        """
+        Display analysis results for the current position.
+        
+        Args:
+            threat_summary (str): Threat analysis text.
+            best_moves (list): Best MoveEvaluation objects.
+        """
+        # Update analysis widget with current board orientation
+        self.analysis_widget.set_board_orientation(self.board_orientation)
+        self.analysis_widget.set_board_state(self.board_manager)
+        self.analysis_widget.set_threat_analysis(threat_summary)
+        self.analysis_widget.set_best_moves(best_moves)
+        
+        # Switch to analysis tab
+        self.tab_widget.setCurrentIndex(1)
+        
+        self.status_bar.showMessage("Engine analysis complete")
+    
+    @Slot()
     def reset_application(self):
         """Reset the application to initial state."""
         reply = QMessageBox.question(
@@ -597,18 +909,30 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             # Clear state
             self.current_image = None
+            self.image_scale = 1.0
+            self._image_digest = None
+            self._loading_path = None
             self.detected_board = None
             self.recognition_results = None
             self.board_squares = None
             self.board_orientation = 'white'
+            self._abandon_pipeline_run()
+            self.clear_stage_cache.emit()
+            self._analysis_worker.cancel()
+            self._analysis_fen = None
             
             # Reset board
             self.board_manager.reset()
+            self._progress.setValue(0)
             
             # Clear widgets
             self.pipeline_widget.clear()
             self.board_widget.clear()
-            self.analysis_widget.clear()
+            if self._analysis_widget is not None:
+                self._analysis_widget.clear()
+            
+            # Return the released image buffers right away
+            gc.collect()
             
             # Reset control panel
             self.control_panel.reset()
@@ -616,6 +940,7 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Application reset - Load an image to begin")
             self.logger.info("Application reset")
     
+    @Slot(str, int, int, object)
     def on_piece_corrected(self, square_name: str, row: int, col: int, corrected_piece: PieceType):
         """
         Handle piece correction from user.
@@ -631,12 +956,12 @@ class MainWindow(QMainWindow):
         # Get original prediction
         original_piece = None
         original_confidence = 0.0
+        index = row * 8 + col
         
-        if self.recognition_results and row < len(self.recognition_results):
-            if col < len(self.recognition_results[row]):
-                result = self.recognition_results[row][col]
-                original_piece = result.piece_type
-                original_confidence = result.confidence
+        if self.recognition_results and 0 <= index < len(self._board_records):
+            result = self.piece_recognizer.record_to_result(self._board_records[index])
+            original_piece = result.piece_type
+            original_confidence = result.confidence
         
         # Get square image if available
         square_image = None
@@ -655,43 +980,43 @@ class MainWindow(QMainWindow):
         )
         
         # Update recognition results
+        corrected_result = RecognitionResult(
+            piece_type=corrected_piece,
+            confidence=1.0  # User correction is 100% confident
+        )
         if self.recognition_results:
-            self.recognition_results[row][col] = RecognitionResult(
-                piece_type=corrected_piece,
-                confidence=1.0  # User correction is 100% confident
-            )
+            self.recognition_results[row][col] = corrected_result
+            self._board_records[index] = self.piece_recognizer.result_to_record(corrected_result)
         
-        # Regenerate FEN and update board
-        fen = self.piece_recognizer.results_to_fen(self.recognition_results)
+        # Change only the corrected square; results are stored white at the
+        # bottom, so row/col map to the square the FEN had there
+        self.board_manager.set_piece_at(
+            chess.square(col, 7 - row), corrected_result.to_chess_piece()
+        )
         
-        if self.board_manager.set_position_from_fen(fen):
-            # Update board widget with current orientation
-            self.board_widget.set_board_orientation(self.board_orientation)
-            self.board_widget.set_board_state(self.board_manager)
-            self.board_widget.set_recognition_results(self.recognition_results)
-            
-            # Show feedback stats in status bar (removed popup for faster workflow)
-            stats = self.feedback_manager.get_correction_statistics()
-            self.status_bar.showMessage(
-                f"✓ Piece corrected on {square_name.upper()} - "
-                f"Total corrections: {stats['total_corrections']}",
-                5000  # Show for 5 seconds
-            )
-        else:
-            QMessageBox.critical(
-                self,
-                "Error",
-                "Failed to update board position after correction."
-            )
+        # Update board widget with current orientation
+        self.board_widget.set_board_orientation(self.board_orientation)
+        self.board_widget.set_board_state(self.board_manager)
+        self.board_widget.set_recognition_results(self.recognition_results)
+        
+        # Show feedback stats in status bar (removed popup for faster workflow)
+        self.status_bar.showMessage(
+            f"✓ Piece corrected on {square_name.upper()} - "
+            f"Total corrections: {self.feedback_manager.get_feedback_count()}",
+            5000  # Show for 5 seconds
+        )
     
+    @Slot()
     def retrain_recognizer(self):
         """Retrain the piece recognizer using collected feedback."""
         self.logger.info("Starting retraining from feedback")
         
-        # Get training data from feedback
-        training_data = self.feedback_manager.get_training_data()
+        # Get training data from feedback, stacked at the feature size
+        squares, labels, source_sizes, native_squares = self.feedback_manager.get_training_batch(
+            self.piece_recognizer.feature_size, self.piece_recognizer.max_native_size
+        )
         
-        if not training_data:
+        if len(labels) == 0:
             QMessageBox.warning(
                 self,
                 "No Training Data",
@@ -704,7 +1029,7 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self,
             "Confirm Retraining",
-            f"Retrain the piece recognizer using {len(training_data)} feedback samples?\n\n"
+            f"Retrain the piece recognizer using {len(labels)} feedback samples?\n\n"
             "This will adjust recognition parameters based on your corrections.",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
@@ -715,9 +1040,14 @@ class MainWindow(QMainWindow):
         
         # Perform retraining
         self.status_bar.showMessage("Retraining recognizer...")
-        result = self.piece_recognizer.retrain_from_feedback(training_data)
+        result = self.piece_recognizer.retrain_from_batch(
+            squares, labels, source_sizes, native_squares
+        )
         
         if result['status'] == 'success':
+            # Cached results came from the old recognition parameters
+            self.pipeline_cache.clear()
+            self.clear_recognition_cache.emit()
             self.status_bar.showMessage("Retraining complete")
             
             # Show results
@@ -738,6 +1068,13 @@ class MainWindow(QMainWindow):
                 f"Reason: {result.get('reason', 'Unknown error')}"
             )
     
+    @Slot()
+    def clear_pipeline_cache(self):
+        """Delete all stored pipeline results so images are processed again."""
+        self.pipeline_cache.clear()
+        self.status_bar.showMessage("Pipeline cache cleared", 5000)
+    
+    @Slot()
     def show_feedback_stats(self):
         """Show detailed feedback statistics."""
         stats = self.feedback_manager.get_correction_statistics()
@@ -771,11 +1108,12 @@ class MainWindow(QMainWindow):
             f"<p><b>Corrections by piece type:</b><br><pre>{piece_stats}</pre></p>"
         )
     
+    @Slot()
     def clear_feedback(self):
         """Clear all collected feedback data."""
-        stats = self.feedback_manager.get_correction_statistics()
+        total_corrections = self.feedback_manager.get_feedback_count()
         
-        if stats['total_corrections'] == 0:
+        if total_corrections == 0:
             QMessageBox.information(
                 self,
                 "No Data",
@@ -786,7 +1124,7 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self,
             "Confirm Clear",
-            f"Clear all {stats['total_corrections']} feedback entries?\n\n"
+            f"Clear all {total_corrections} feedback entries?\n\n"
             "This will permanently delete all collected training data.",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
@@ -794,13 +1132,23 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.feedback_manager.clear_feedback()
-            self.status_bar.showMessage("Feedback data cleared")
-            QMessageBox.information(
-                self,
-                "Data Cleared",
-                "All feedback data has been cleared."
-            )
+            self.status_bar.showMessage("All feedback data cleared", 5000)
+    
+    def closeEvent(self, event):
+        """
+        Stop the worker threads and the feedback writer before the window closes.
+        
+        Args:
+            event: Close event.
+        """
+        self._analysis_worker.cancel()
+        for thread in (self._pipeline_thread, self._analysis_thread):
+            thread.quit()
+            thread.wait()
+        self.feedback_manager.close()
+        super().closeEvent(event)
     
+    @Slot()
     def show_about(self):
         """Show the about dialog."""
         QMessageBox.about(
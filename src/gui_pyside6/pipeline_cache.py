@@ -0,0 +1,168 @@
+"""
+Pipeline Result Cache Module for PySide6 Chess Engine GUI.
+
+This module provides a small persistent cache of pipeline results keyed by
+the content hash of the source image file, so reopening an image skips
+board detection and piece recognition.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.computer_vision.piece_recognizer import PieceType, RecognitionResult
+
+
+# Cached pipeline output: (board_image, squares, recognition_results, fen)
+CachedResult = Tuple[np.ndarray, List[List[np.ndarray]], List[List[RecognitionResult]], str]
+
+
+class PipelineResultCache:
+    """
+    On-disk cache of processed chess board images.
+    
+    Each entry is an ``.npz`` file with the board and square images plus a
+    sibling ``.json`` file with the recognition results and FEN. Only the
+    most recently used entries are kept.
+    
+    Attributes:
+        cache_dir (Path): Directory holding the cache entries.
+        max_entries (int): Number of entries kept on disk.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 32):
+        """
+        Initialize the pipeline result cache.
+        
+        Args:
+            cache_dir: Directory for cache entries. If None, uses output/pipeline_cache.
+            max_entries: Number of most recently used entries to keep.
+        """
+        self.logger = logging.getLogger(__name__)
+        
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent.parent / 'output' / 'pipeline_cache'
+        
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+    
+    @staticmethod
+    def digest_file(file_path: str) -> str:
+        """
+        Compute the content hash used as cache key for an image file.
+        
+        Args:
+            file_path: Path to the image file.
+        
+        Returns:
+            str: Hex digest of the file contents.
+        """
+        with open(file_path, 'rb') as f:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        """Return the (.npz, .json) paths of a cache entry."""
+        return self.cache_dir / f"{key}.npz", self.cache_dir / f"{key}.json"
+    
+    def load(self, key: str) -> Optional[CachedResult]:
+        """
+        Load a cached pipeline result.
+        
+        Args:
+            key: Cache key (image digest plus processing parameters).
+        
+        Returns:
+            Optional[CachedResult]: Tuple of (board_image, squares, results, fen),
+                or None on a cache miss.
+        """
+        npz_path, json_path = self._paths(key)
+        
+        try:
+            with open(json_path, 'rb') as f:
+                meta = json.load(f)
+            with np.load(npz_path) as arrays:
+                board_image = arrays['board']
+                flat_squares = [arrays[f'square_{i}'] for i in range(64)]
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        # Mark the entry as recently used
+        os.utime(npz_path)
+        
+        squares = [flat_squares[row * 8:(row + 1) * 8] for row in range(8)]
+        results = [
+            [
+                RecognitionResult(
+                    piece_type=PieceType[name] if name is not None else None,
+                    confidence=confidence
+                )
+                for name, confidence in zip(names, confidences)
+            ]
+            for names, confidences in zip(meta['pieces'], meta['confidences'])
+        ]
+        
+        self.logger.info(f"Pipeline result loaded from cache: {key}")
+        return board_image, squares, results, meta['fen']
+    
+    def store(self, key: str, board_image: np.ndarray, squares: List[List[np.ndarray]],
+              results: List[List[RecognitionResult]], fen: str):
+        """
+        Store a pipeline result and evict the least recently used entries.
+        
+        Args:
+            key: Cache key (image digest plus processing parameters).
+            board_image: Extracted board image.
+            squares: 8x8 grid of square images.
+            results: 8x8 grid of recognition results.
+            fen: FEN of the recognized position.
+        """
+        npz_path, json_path = self._paths(key)
+        meta = {
+            'fen': fen,
+            'pieces': [
+                [r.piece_type.name if r.piece_type is not None else None for r in row]
+                for row in results
+            ],
+            'confidences': [[float(r.confidence) for r in row] for row in results],
+        }
+        arrays = {f'square_{row * 8 + col}': square
+                  for row, row_squares in enumerate(squares)
+                  for col, square in enumerate(row_squares)}
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(json_path, 'w') as f:
+                json.dump(meta, f)
+            np.savez(npz_path, board=board_image, **arrays)
+        except OSError as e:
+            self.logger.warning(f"Could not write pipeline cache entry {key}: {e}")
+            return
+        
+        self._evict()
+    
+    def _evict(self):
+        """Delete all but the max_entries most recently used entries."""
+        entries = sorted(
+            self.cache_dir.glob('*.npz'),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        for npz_path in entries[self.max_entries:]:
+            npz_path.unlink(missing_ok=True)
+            npz_path.with_suffix('.json').unlink(missing_ok=True)
+    
+    def clear(self):
+        """Delete every cache entry."""
+        if not self.cache_dir.exists():
+            return
+        
+        for path in self.cache_dir.iterdir():
+            if path.suffix in ('.npz', '.json'):
+                path.unlink(missing_ok=True)
+        
+        self.logger.info("Pipeline result cache cleared")
@@ -0,0 +1,254 @@
+"""
+Pipeline Worker Module for PySide6 Chess Engine GUI.
+
+This module provides the worker object that runs the image processing
+pipeline off the Qt main thread and reports each stage through signals.
+"""
+
+from PySide6.QtCore import QObject, Signal, Slot
+from collections import OrderedDict
+import hashlib
+import logging
+from typing import Any, Callable, List, Optional
+import numpy as np
+
+from src.computer_vision.board_detector import BoardDetector
+from src.computer_vision.piece_recognizer import PieceRecognizer, RecognitionResult
+
+
+class PipelineWorker(QObject):
+    """
+    Worker that runs board detection and piece recognition on a QThread.
+    
+    The worker is moved to a background thread by the main window and
+    started through a queued signal connection, so the event loop keeps
+    repainting while the pipeline runs. Intermediate results are handed
+    back to the main thread through the signals below. Every signal starts
+    with the generation the run was started with, so the receiver can drop
+    results of runs it has abandoned.
+    
+    Signals:
+        progress: Emitted when a stage starts (generation, step number, message).
+        preprocessed: Emitted with the source and preprocessed images.
+        contours_ready: Emitted with the source image and contours.
+        board_ready: Emitted with the board image and squares grid.
+        recognized: Emitted with the orientation-normalized squares and results.
+        fen_ready: Emitted with the FEN of the recognized position.
+        failed: Emitted with a user-facing message when processing fails.
+    """
+    
+    progress = Signal(int, int, str)
+    preprocessed = Signal(int, object, object)
+    contours_ready = Signal(int, object, list)
+    board_ready = Signal(int, object, list)
+    recognized = Signal(int, list, list)
+    fen_ready = Signal(int, str)
+    failed = Signal(int, str)
+    
+    # Number of intermediate stage results kept for re-runs
+    STAGE_CACHE_SIZE = 8
+    
+    # Number of per-square recognition results kept across images
+    SQUARE_CACHE_SIZE = 1024
+    
+    def __init__(self, board_detector: BoardDetector,
+                 piece_recognizer: Optional[PieceRecognizer] = None):
+        """
+        Initialize the pipeline worker.
+        
+        Args:
+            board_detector (BoardDetector): Detector used for the board stages.
+            piece_recognizer (Optional[PieceRecognizer]): Recognizer used for the
+                piece stages. May be assigned later, but before run is invoked.
+        """
+        super().__init__()
+        self.board_detector = board_detector
+        self.piece_recognizer = piece_recognizer
+        self.logger = logging.getLogger(__name__)
+        self._stage_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._square_cache: "OrderedDict[bytes, RecognitionResult]" = OrderedDict()
+    
+    def _cached(self, stage: str, fn: Callable, image: np.ndarray, *args):
+        """
+        Return a pipeline stage result, computing it only on a cache miss.
+        
+        Results are keyed by the identity of the input image, so the cache
+        must be cleared whenever a different image is loaded.
+        
+        Args:
+            stage (str): Stage name.
+            fn (Callable): Function computing the stage from (image, *args).
+            image (np.ndarray): Stage input image.
+            *args: Extra stage parameters.
+        
+        Returns:
+            The (possibly cached) stage result.
+        """
+        key = (id(image), stage, repr(args))
+        if key in self._stage_cache:
+            self._stage_cache.move_to_end(key)
+            return self._stage_cache[key]
+        
+        result = fn(image, *args)
+        self._stage_cache[key] = result
+        if len(self._stage_cache) > self.STAGE_CACHE_SIZE:
+            self._stage_cache.popitem(last=False)
+        return result
+    
+    @Slot()
+    def clear_cache(self):
+        """Drop all cached stage results."""
+        self._stage_cache.clear()
+    
+    @Slot()
+    def clear_recognition_cache(self):
+        """Drop all cached square recognition results, e.g. after retraining."""
+        self._square_cache.clear()
+    
+    @Slot()
+    def warmup(self):
+        """
+        Run the pipeline's one-time setup ahead of the first image.
+        
+        Preprocesses a blank image, which starts OpenCV's thread pool, and
+        warms up the piece recognizer, which compiles its numba kernels or
+        loads them from the on-disk cache.
+        """
+        self.board_detector.preprocess_image(np.zeros((64, 64, 3), dtype=np.uint8))
+        if self.piece_recognizer is not None:
+            self.piece_recognizer.warmup()
+        self.logger.info("Pipeline warmed up")
+    
+    def _recognize_with_cache(
+        self,
+        squares: List[List[np.ndarray]]
+    ) -> List[List[RecognitionResult]]:
+        """
+        Recognize a board, reusing the results of previously seen squares.
+        
+        Squares are keyed by a hash of their pixels, so re-processing an
+        image or a board with mostly unchanged squares only runs the
+        recognizer on the squares it has not seen. The misses are
+        recognized together in one batch.
+        
+        Args:
+            squares (List[List[np.ndarray]]): 8x8 grid of square images.
+        
+        Returns:
+            List[List[RecognitionResult]]: 8x8 grid of recognition results.
+        """
+        flat_squares = [square for row in squares for square in row]
+        keys = [
+            hashlib.blake2b(np.ascontiguousarray(square), digest_size=16).digest()
+            for square in flat_squares
+        ]
+        
+        misses = [i for i, key in enumerate(keys) if key not in self._square_cache]
+        if misses:
+            fresh = self.piece_recognizer.recognize_board_vectorized(
+                [[flat_squares[i] for i in misses]]
+            )[0]
+            for i, result in zip(misses, fresh):
+                self._square_cache[keys[i]] = result
+        
+        flat_results = []
+        for key in keys:
+            self._square_cache.move_to_end(key)
+            flat_results.append(self._square_cache[key])
+        
+        while len(self._square_cache) > self.SQUARE_CACHE_SIZE:
+            self._square_cache.popitem(last=False)
+        
+        n_cols = len(squares[0])
+        return [flat_results[row * n_cols:(row + 1) * n_cols] for row in range(len(squares))]
+    
+    def _flip(self, squares, results):
+        """
+        Flip board squares and recognition results 180 degrees.
+        
+        Args:
+            squares: Squares grid to flip.
+            results: Recognition results grid to flip.
+        
+        Returns:
+            Tuple of (flipped squares, flipped results).
+        """
+        squares = self.board_detector.flip_board(squares)
+        results = [list(reversed(row)) for row in reversed(results)]
+        return squares, results
+    
+    @Slot(object, str, int)
+    def run(self, image: np.ndarray, orientation_pref: str = 'auto', generation: int = 0):
+        """
+        Run the complete image processing pipeline.
+        
+        Args:
+            image (np.ndarray): Loaded BGR image to process.
+            orientation_pref (str): 'auto', 'white' or 'black' (side at the bottom).
+            generation (int): Run identifier passed back with every signal.
+        """
+        self.logger.info("Starting image processing pipeline")
+        
+        try:
+            # Step 1: Preprocess image
+            self.progress.emit(generation, 1, "Preprocessing...")
+            preprocessed = self._cached("preprocess", self.board_detector.preprocess_image, image)
+            self.preprocessed.emit(generation, image, preprocessed)
+            
+            # Step 2: Detect contours
+            self.progress.emit(generation, 2, "Detecting contours...")
+            contours = self._cached(
+                "contours", self.board_detector.detect_board_contours, preprocessed
+            )
+            self.contours_ready.emit(generation, image, contours)
+            
+            # Step 3: Detect board, falling back to the full image as board
+            self.progress.emit(generation, 3, "Detecting board region...")
+            detection_result = self._cached(
+                "detect",
+                lambda img: self.board_detector.detect_board(
+                    img, contours=contours, fallback_full_image=True
+                ),
+                image
+            )
+            
+            if detection_result is None:
+                self.failed.emit(generation, "Could not detect chess board. Please try a different image.")
+                return
+            
+            # Steps 4-5: Board region and square segmentation
+            board_image, squares = detection_result
+            self.progress.emit(generation, 5, "Extracting board and segmenting squares...")
+            self.board_ready.emit(generation, board_image, squares)
+            
+            # Step 6: Recognize pieces
+            self.progress.emit(generation, 6, "Recognizing pieces...")
+            results = self._recognize_with_cache(squares)
+            
+            # Normalize the data so white is always at the bottom
+            if orientation_pref == 'auto':
+                detected_orientation = self.board_detector.detect_board_orientation(
+                    squares, results
+                )
+                self.logger.info(f"Physical orientation detected: {detected_orientation}")
+                
+                if detected_orientation == 'black':
+                    self.logger.info("Flipping board data to normalize (black detected at bottom)")
+                    squares, results = self._flip(squares, results)
+            
+            elif orientation_pref == 'white':
+                self.logger.info("Board orientation (manual): white on bottom")
+            
+            else:  # orientation_pref == 'black'
+                self.logger.info("Board orientation (manual): black on bottom - flipping data")
+                squares, results = self._flip(squares, results)
+            
+            self.recognized.emit(generation, squares, results)
+            
+            # Step 7: Generate FEN
+            self.progress.emit(generation, 7, "Generating board position...")
+            self.fen_ready.emit(generation, self.piece_recognizer.results_to_fen(results))
+        
+        except Exception as e:
+            self.logger.error(f"Error during image processing: {e}", exc_info=True)
+            self.failed.emit(generation, f"An error occurred during processing:\n{str(e)}")
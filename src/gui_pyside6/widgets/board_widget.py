@@ -10,8 +10,8 @@ from PySide6.QtWidgets import (
     QTextEdit, QGraphicsView, QGraphicsScene, QGraphicsRectItem,
     QGraphicsTextItem, QPushButton
 )
-from PySide6.QtCore import Qt, QRectF, Signal
-from PySide6.QtGui import QColor, QBrush, QPen, QFont, QPixmap, QImage
+from PySide6.QtCore import Qt, QRectF, Signal, Slot
+from PySide6.QtGui import QColor, QBrush, QPen, QFont
 import chess
 from typing import Optional, List
 import numpy as np
@@ -194,6 +194,7 @@ class BoardReconstructionWidget(QWidget):
         
         layout.addLayout(content_layout)
     
+    @Slot(bool)
     def _toggle_correction_mode(self, checked: bool):
         """Toggle correction mode on/off."""
         self.correction_mode_enabled = checked
@@ -68,7 +68,7 @@ class ControlPanelWidget(QWidget):
         load_layout = QVBoxLayout()
         
         self.load_button = QPushButton("Load Image...")
-        self.load_button.clicked.connect(self.load_image_signal.emit)
+        self.load_button.clicked.connect(self.load_image_signal)
         load_layout.addWidget(self.load_button)
         
         self.image_status = QLabel("No image loaded")
@@ -85,12 +85,12 @@ class ControlPanelWidget(QWidget):
         
         self.process_button = QPushButton("Process Image")
         self.process_button.setEnabled(False)
-        self.process_button.clicked.connect(self.process_image_signal.emit)
+        self.process_button.clicked.connect(self.process_image_signal)
         process_layout.addWidget(self.process_button)
         
         self.step_button = QPushButton("Step Through Pipeline")
         self.step_button.setEnabled(False)
-        self.step_button.clicked.connect(self.step_through_signal.emit)
+        self.step_button.clicked.connect(self.step_through_signal)
         process_layout.addWidget(self.step_button)
         
         process_group.setLayout(process_layout)
@@ -121,7 +121,7 @@ class ControlPanelWidget(QWidget):
         self.flip_board_button = QPushButton("Flip Board Orientation")
         self.flip_board_button.setEnabled(False)
         self.flip_board_button.setToolTip("Rotate the board 180 degrees (switch between white/black perspective)")
-        self.flip_board_button.clicked.connect(self.flip_board_signal.emit)
+        self.flip_board_button.clicked.connect(self.flip_board_signal)
         orientation_layout.addWidget(self.flip_board_button)
         
         self.orientation_label = QLabel("Current: Not set")
@@ -152,7 +152,7 @@ class ControlPanelWidget(QWidget):
         
         self.analysis_button = QPushButton("Run Engine Analysis")
         self.analysis_button.setEnabled(False)
-        self.analysis_button.clicked.connect(self.run_analysis_signal.emit)
+        self.analysis_button.clicked.connect(self.run_analysis_signal)
         analysis_layout.addWidget(self.analysis_button)
         
         analysis_group.setLayout(analysis_layout)
@@ -161,7 +161,7 @@ class ControlPanelWidget(QWidget):
         # Reset Section
         layout.addSpacing(20)
         self.reset_button = QPushButton("Reset Application")
-        self.reset_button.clicked.connect(self.reset_signal.emit)
+        self.reset_button.clicked.connect(self.reset_signal)
         layout.addWidget(self.reset_button)
         
         # Info Section
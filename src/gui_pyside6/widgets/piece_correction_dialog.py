@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QButtonGroup, QGridLayout, QGroupBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 import chess
 from typing import Optional
@@ -170,6 +170,7 @@ class PieceCorrectionDialog(QDialog):
                     btn.setChecked(True)
                     break
     
+    @Slot()
     def _on_confirm(self):
         """Handle confirm button click."""
         checked_button = self.button_group.checkedButton()
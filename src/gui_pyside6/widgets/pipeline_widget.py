@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QScrollArea, QPushButton, QComboBox, QGridLayout
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Slot, Qt
 from PySide6.QtGui import QPixmap, QImage, QFont
 import cv2
 import numpy as np
@@ -36,6 +36,9 @@ class PipelineVisualizationWidget(QWidget):
     # Define signals
     stage_selected = Signal(str)  # stage name
     
+    # Widest a stage image is ever displayed; stages are stored at this size
+    DISPLAY_WIDTH = 600
+    
     def __init__(self, parent=None):
         """
         Initialize the pipeline visualization widget.
@@ -47,8 +50,17 @@ class PipelineVisualizationWidget(QWidget):
         
         self.pipeline_stages = {}
         self.current_stage = None
+        
+        # (id(image), max_width) -> (image, pixmap); the image reference
+        # keeps the id from being reused while the entry is cached
+        self._pixmap_cache = {}
         self.step_mode = False
         
+        # Between begin_batch and end_batch repaints are held back and the
+        # stage selector is updated once at the end
+        self._batching = False
+        self._selector_stale = False
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -107,6 +119,27 @@ class PipelineVisualizationWidget(QWidget):
         
         layout.addLayout(nav_layout)
     
+    def _shrink_for_display(self, image: np.ndarray) -> np.ndarray:
+        """
+        Shrink a stage image to the display width.
+        
+        Stage images are only ever shown at DISPLAY_WIDTH or below, so
+        storing them at that size releases the full-resolution buffers as
+        soon as a stage has been rendered.
+        
+        Args:
+            image (np.ndarray): Stage image.
+            
+        Returns:
+            np.ndarray: A shrunk copy, or the image itself if it is narrow enough.
+        """
+        height, width = image.shape[:2]
+        if width <= self.DISPLAY_WIDTH:
+            return image
+        
+        size = (self.DISPLAY_WIDTH, max(1, round(height * self.DISPLAY_WIDTH / width)))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    
     def _numpy_to_qpixmap(self, image: np.ndarray, max_width: int = 600) -> QPixmap:
         """
         Convert a numpy array image to QPixmap.
@@ -118,18 +151,24 @@ class PipelineVisualizationWidget(QWidget):
         Returns:
             QPixmap: Converted image.
         """
+        key = (id(image), max_width)
+        cached = self._pixmap_cache.get(key)
+        if cached is not None:
+            return cached[1]
+        
+        # Wrap the array buffer directly; QPixmap.fromImage makes the only copy.
+        # Views (e.g. stage crops) have to be packed first to expose a buffer.
+        data = np.ascontiguousarray(image)
+        height, width = data.shape[:2]
+        bytes_per_line = data.strides[0]
+        
         # Handle different image types
-        if len(image.shape) == 2:
+        if len(data.shape) == 2:
             # Grayscale
-            height, width = image.shape
-            bytes_per_line = width
-            q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
+            q_image = QImage(data.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
         else:
-            # Color image - convert BGR to RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            height, width, channel = image_rgb.shape
-            bytes_per_line = 3 * width
-            q_image = QImage(image_rgb.data, width, height, bytes_per_line, QImage.Format_RGB888)
+            # Color image, BGR channel order as loaded by OpenCV
+            q_image = QImage(data.data, width, height, bytes_per_line, QImage.Format_BGR888)
         
         pixmap = QPixmap.fromImage(q_image)
         
@@ -137,8 +176,22 @@ class PipelineVisualizationWidget(QWidget):
         if pixmap.width() > max_width:
             pixmap = pixmap.scaledToWidth(max_width, Qt.SmoothTransformation)
         
+        self._prune_pixmap_cache()
+        self._pixmap_cache[key] = (image, pixmap)
         return pixmap
     
+    def _prune_pixmap_cache(self):
+        """Drop cached pixmaps of images no longer in any pipeline stage."""
+        live_ids = set()
+        for stage_data in self.pipeline_stages.values():
+            if isinstance(stage_data, dict):
+                live_ids.update(id(image) for image in stage_data.values())
+            else:
+                live_ids.add(id(stage_data))
+        
+        for key in [key for key in self._pixmap_cache if key[0] not in live_ids]:
+            del self._pixmap_cache[key]
+    
     def _add_stage_to_grid(self, stage_name: str, image: np.ndarray, row: int, col: int):
         """
         Add a stage image to the grid layout.
@@ -177,6 +230,7 @@ class PipelineVisualizationWidget(QWidget):
             if item.widget():
                 item.widget().deleteLater()
     
+    @Slot(str)
     def _on_stage_changed(self, stage_name: str):
         """
         Handle stage selection change.
@@ -247,8 +301,9 @@ class PipelineVisualizationWidget(QWidget):
         Args:
             image (np.ndarray): Raw input image.
         """
-        self.pipeline_stages["1. Raw Image"] = image.copy()
-        self._update_stage_selector()
+        shrunk = self._shrink_for_display(image)
+        self.pipeline_stages["1. Raw Image"] = shrunk if shrunk is not image else image.copy()
+        self._stages_changed()
         self._display_all_stages()
     
     def set_preprocessing_result(self, original: np.ndarray, preprocessed: np.ndarray):
@@ -266,11 +321,11 @@ class PipelineVisualizationWidget(QWidget):
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
         
         self.pipeline_stages["2. Preprocessing"] = {
-            "Grayscale": gray,
-            "Blurred": blurred,
-            "Thresholded": preprocessed
+            "Grayscale": self._shrink_for_display(gray),
+            "Blurred": self._shrink_for_display(blurred),
+            "Thresholded": self._shrink_for_display(preprocessed)
         }
-        self._update_stage_selector()
+        self._stages_changed()
     
     def set_contours(self, original: np.ndarray, contours: List):
         """
@@ -289,10 +344,10 @@ class PipelineVisualizationWidget(QWidget):
         edges = cv2.Canny(gray, 50, 150)
         
         self.pipeline_stages["3. Edge & Contour Detection"] = {
-            "Edges": edges,
-            "Contours": contour_image
+            "Edges": self._shrink_for_display(edges),
+            "Contours": self._shrink_for_display(contour_image)
         }
-        self._update_stage_selector()
+        self._stages_changed()
     
     def set_board_region(self, board_image: np.ndarray):
         """
@@ -301,8 +356,9 @@ class PipelineVisualizationWidget(QWidget):
         Args:
             board_image (np.ndarray): Extracted board image.
         """
-        self.pipeline_stages["4. Board Region"] = board_image.copy()
-        self._update_stage_selector()
+        shrunk = self._shrink_for_display(board_image)
+        self.pipeline_stages["4. Board Region"] = shrunk if shrunk is not board_image else board_image.copy()
+        self._stages_changed()
     
     def set_squares(self, squares: List[List[np.ndarray]]):
         """
@@ -317,17 +373,11 @@ class PipelineVisualizationWidget(QWidget):
         
         sq_h, sq_w = squares[0][0].shape[:2]
         
-        # Create composite image
-        grid_image = np.zeros((sq_h * 8, sq_w * 8, 3), dtype=np.uint8)
-        
-        for row in range(8):
-            for col in range(8):
-                y1 = row * sq_h
-                y2 = (row + 1) * sq_h
-                x1 = col * sq_w
-                x2 = (col + 1) * sq_w
-                
-                grid_image[y1:y2, x1:x2] = squares[row][col]
+        # Create composite image, filled through an (8, 8, sq_h, sq_w, 3)
+        # view of its tiles in one assignment
+        grid_image = np.empty((sq_h * 8, sq_w * 8, 3), dtype=np.uint8)
+        tiles = grid_image.reshape(8, sq_h, 8, sq_w, 3).swapaxes(1, 2)
+        tiles[...] = squares
         
         # Draw grid lines
         for i in range(9):
@@ -338,8 +388,8 @@ class PipelineVisualizationWidget(QWidget):
             x = i * sq_w
             cv2.line(grid_image, (x, 0), (x, sq_h * 8), (0, 255, 0), 2)
         
-        self.pipeline_stages["5. Square Segmentation"] = grid_image
-        self._update_stage_selector()
+        self.pipeline_stages["5. Square Segmentation"] = self._shrink_for_display(grid_image)
+        self._stages_changed()
     
     def set_recognition_results(self, squares: List[List[np.ndarray]], results: List[List]):
         """
@@ -391,8 +441,39 @@ class PipelineVisualizationWidget(QWidget):
             x = i * sq_w
             cv2.line(grid_image, (x, 0), (x, sq_h * 8), (255, 255, 0), 1)
         
-        self.pipeline_stages["6. Piece Recognition"] = grid_image
-        self._update_stage_selector()
+        self.pipeline_stages["6. Piece Recognition"] = self._shrink_for_display(grid_image)
+        self._stages_changed()
+    
+    def begin_batch(self):
+        """
+        Start a batch of stage updates.
+        
+        Repaints of the widget are suspended until end_batch, so stages set
+        one after another are drawn in a single paint.
+        """
+        if self._batching:
+            return
+        
+        self._batching = True
+        self.setUpdatesEnabled(False)
+    
+    def end_batch(self):
+        """End a batch of stage updates and repaint once. Does nothing outside a batch."""
+        if not self._batching:
+            return
+        
+        self._batching = False
+        if self._selector_stale:
+            self._selector_stale = False
+            self._update_stage_selector()
+        self.setUpdatesEnabled(True)
+    
+    def _stages_changed(self):
+        """Update the stage selector now, or at the end of the running batch."""
+        if self._batching:
+            self._selector_stale = True
+        else:
+            self._update_stage_selector()
     
     def _update_stage_selector(self):
         """Update the stage selector dropdown."""
@@ -414,6 +495,7 @@ class PipelineVisualizationWidget(QWidget):
         if stage_list:
             self.stage_selector.setCurrentText(stage_list[0])
     
+    @Slot()
     def _previous_stage(self):
         """Navigate to the previous pipeline stage."""
         stage_list = list(self.pipeline_stages.keys())
@@ -426,6 +508,7 @@ class PipelineVisualizationWidget(QWidget):
             if current_idx > 0:
                 self.stage_selector.setCurrentText(stage_list[current_idx - 1])
     
+    @Slot()
     def _next_stage(self):
         """Navigate to the next pipeline stage."""
         stage_list = list(self.pipeline_stages.keys())
@@ -441,6 +524,7 @@ class PipelineVisualizationWidget(QWidget):
     def clear(self):
         """Clear all pipeline stages."""
         self.pipeline_stages.clear()
+        self._pixmap_cache.clear()
         self.current_stage = None
         self.step_mode = False
         
@@ -51,6 +51,41 @@ class TestBoardManager(unittest.TestCase):
         self.assertTrue(self.board_manager.get_fen().startswith(expected_fen_start))
         self.assertEqual(len(self.board_manager.move_history), 0)
 
+    def test_set_piece_map(self):
+        """Test setting the position from a piece map."""
+        fen = "r3k2r/pp3ppp/8/8/3Q4/8/PPP2PPP/R3K2R w KQkq - 0 1"
+        piece_map = chess.Board(fen).piece_map()
+        self.board_manager.make_move(chess.Move.from_uci("e2e4"))
+        
+        self.board_manager.set_piece_map(piece_map)
+        
+        self.assertEqual(self.board_manager.get_fen(), fen)
+        self.assertEqual(len(self.board_manager.move_history), 0)
+
+    def test_is_starting_position(self):
+        """Test detecting the starting position without building a FEN."""
+        self.assertTrue(self.board_manager.is_starting_position())
+        
+        self.board_manager.make_move(chess.Move.from_uci("e2e4"))
+        self.assertFalse(self.board_manager.is_starting_position())
+        
+        self.board_manager.set_position_from_fen(chess.STARTING_FEN)
+        self.assertTrue(self.board_manager.is_starting_position())
+        
+        # Same pieces, different side to move
+        self.board_manager.set_position_from_fen(chess.STARTING_FEN.replace(" w ", " b "))
+        self.assertFalse(self.board_manager.is_starting_position())
+
+    def test_set_piece_at(self):
+        """Test changing a single square in place."""
+        self.board_manager.set_piece_at(chess.E2, chess.Piece(chess.KNIGHT, chess.WHITE))
+        self.board_manager.set_piece_at(chess.D7, None)
+        
+        self.assertEqual(
+            self.board_manager.get_fen(),
+            "rnbqkbnr/ppp1pppp/8/8/8/8/PPPPNPPP/RNBQKBNR w KQkq - 0 1"
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for board segmentation.
+
+Tests that the board image is divided into squares without copying pixels,
+and that images are decoded at reduced size for a given working size.
+"""
+
+import unittest
+import numpy as np
+import cv2
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.computer_vision.board_detector import BoardDetector
+
+
+class TestSquareGrid(unittest.TestCase):
+    """Test dividing a board image into squares."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.detector = BoardDetector()
+        self.board = np.random.default_rng(0).integers(0, 256, (803, 801, 3), dtype=np.uint8)
+    
+    def test_square_grid_is_a_view(self):
+        """Test that the grid indexes squares by (row, col) without copying."""
+        grid = self.detector.square_grid(self.board)
+        
+        self.assertEqual(grid.shape, (8, 8, 100, 100, 3))
+        self.assertTrue(np.shares_memory(grid, self.board))
+        np.testing.assert_array_equal(grid[2, 5], self.board[200:300, 500:600])
+    
+    def test_divide_into_squares_of_region(self):
+        """Test dividing a non-contiguous board region into squares."""
+        region = self.board[5:700, 3:650]
+        squares = self.detector.divide_into_squares(region)
+        
+        self.assertEqual(len(squares), 8)
+        self.assertEqual(len(squares[0]), 8)
+        for row in range(8):
+            for col in range(8):
+                np.testing.assert_array_equal(
+                    squares[row][col],
+                    region[row * 86:(row + 1) * 86, col * 80:(col + 1) * 80]
+                )
+
+
+class TestPreprocessImage(unittest.TestCase):
+    """Test board detection preprocessing."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.detector = BoardDetector()
+        self.image = np.random.default_rng(0).integers(0, 256, (300, 400, 3), dtype=np.uint8)
+    
+    def test_results_independent_of_reused_buffers(self):
+        """Test that each call returns its own result despite the shared scratch images."""
+        first = self.detector.preprocess_image(self.image)
+        expected = first.copy()
+        second = self.detector.preprocess_image(np.zeros_like(self.image))
+        
+        self.assertIsNot(first, second)
+        np.testing.assert_array_equal(first, expected)
+    
+    def test_writes_into_out(self):
+        """Test that the result is written into a given array."""
+        out = np.empty(self.image.shape[:2], dtype=np.uint8)
+        result = self.detector.preprocess_image(self.image, out=out)
+        
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, BoardDetector().preprocess_image(self.image))
+
+
+
+class TestLoadImage(unittest.TestCase):
+    """Test decoding images at reduced resolution."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.detector = BoardDetector()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'board.jpg')
+        cv2.imwrite(self.path, np.full((1000, 2000, 3), 128, dtype=np.uint8))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_image_size_from_header(self):
+        """Test that the header size is (width, height)."""
+        self.assertEqual(self.detector.image_size(self.path), (2000, 1000))
+    
+    def test_reduced_read_flag_never_below_target(self):
+        """Test that the largest reduction keeping the target size is chosen."""
+        flag = self.detector.reduced_read_flag
+        self.assertEqual(flag((2000, 1000), 250), cv2.IMREAD_REDUCED_COLOR_8)
+        self.assertEqual(flag((2000, 1000), 600), cv2.IMREAD_REDUCED_COLOR_2)
+        self.assertEqual(flag((2000, 1000), 1600), cv2.IMREAD_COLOR)
+        self.assertEqual(flag(None, 250), cv2.IMREAD_COLOR)
+    
+    def test_load_image_at_target_size(self):
+        """Test that load_image decodes large images at reduced size."""
+        self.assertEqual(self.detector.load_image(self.path).shape, (1000, 2000, 3))
+        self.assertEqual(
+            self.detector.load_image(self.path, target_max_side=500).shape, (250, 500, 3)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,14 +6,19 @@ Tests feedback collection and storage functionality.
 
 import unittest
 import tempfile
+import gc
+import gzip
 import json
 from pathlib import Path
 import sys
 import os
+import weakref
+from unittest import mock
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from src.computer_vision import feedback_manager
 from src.computer_vision.feedback_manager import FeedbackManager, PieceFeedback
 from src.computer_vision.piece_recognizer import PieceType
 
@@ -36,6 +41,22 @@ class TestPieceFeedback(unittest.TestCase):
         self.assertEqual(feedback.user_correction, PieceType.WHITE_KNIGHT)
         self.assertIsNotNone(feedback.timestamp)
     
+    def test_feedback_json_bytes_cached(self):
+        """Test that the JSON encoding is computed once and round-trips."""
+        feedback = PieceFeedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        
+        encoded = feedback.to_json_bytes()
+        self.assertIs(feedback.to_json_bytes(), encoded)
+        self.assertEqual(json.loads(encoded), feedback.to_dict())
+    
+    def test_feedback_uses_slots(self):
+        """Test that feedback entries carry no per-instance __dict__."""
+        feedback = PieceFeedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        
+        self.assertFalse(hasattr(feedback, '__dict__'))
+        with self.assertRaises(AttributeError):
+            feedback.note = 'not a field'
+    
     def test_feedback_to_dict(self):
         """Test converting feedback to dictionary."""
         feedback = PieceFeedback(
@@ -115,6 +136,7 @@ class TestFeedbackManager(unittest.TestCase):
             original_confidence=0.6,
             user_correction=PieceType.WHITE_KNIGHT
         )
+        manager1.close()
         
         # Create new manager and check feedback was loaded
         manager2 = FeedbackManager(feedback_file=self.temp_path)
@@ -140,6 +162,81 @@ class TestFeedbackManager(unittest.TestCase):
         self.assertEqual(stats['by_piece_type']['BLACK_KNIGHT'], 1)
         self.assertAlmostEqual(stats['avg_original_confidence'], 0.6, places=2)
     
+    def test_correction_statistics_after_reload_and_clear(self):
+        """Test that the statistics aggregates are rebuilt on load and reset on clear."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        manager.add_feedback('e5', PieceType.BLACK_PAWN, 0.8, PieceType.BLACK_KNIGHT)
+        manager.close()
+        
+        reloaded = FeedbackManager(feedback_file=self.temp_path)
+        stats = reloaded.get_correction_statistics()
+        self.assertEqual(stats['by_piece_type'], {'WHITE_KNIGHT': 1, 'BLACK_KNIGHT': 1})
+        self.assertAlmostEqual(stats['avg_original_confidence'], 0.7)
+        
+        reloaded.clear_feedback()
+        reloaded.add_feedback('d4', PieceType.WHITE_ROOK, 0.3, PieceType.WHITE_QUEEN)
+        stats = reloaded.get_correction_statistics()
+        reloaded.close()
+        self.assertEqual(stats['total_corrections'], 1)
+        self.assertAlmostEqual(stats['avg_original_confidence'], 0.3)
+    
+    def test_flush_writes_pending_feedback(self):
+        """Test that flush() waits for the background writer."""
+        with FeedbackManager(feedback_file=self.temp_path) as manager:
+            for square in ('a1', 'b2', 'c3'):
+                manager.add_feedback(square, PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+            manager.flush()
+            
+            with open(self.temp_path) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), 3)
+    
+    def test_batch_defers_writes(self):
+        """Test that feedback added in a batch is written once at the end."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        
+        with manager.batch():
+            manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+            with manager.batch():
+                manager.add_feedback('d5', PieceType.BLACK_PAWN, 0.7, PieceType.BLACK_BISHOP)
+            manager.flush()
+            self.assertEqual(self.temp_path.stat().st_size, 0)
+        
+        manager.flush()
+        with open(self.temp_path, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        manager.close()
+    
+    def test_add_feedback_after_close(self):
+        """Test that feedback added after close() is still persisted."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.close()
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        
+        reloaded = FeedbackManager(feedback_file=self.temp_path)
+        self.assertEqual(reloaded.get_feedback_count(), 1)
+    
+    def test_closed_manager_is_released(self):
+        """Test that the exit hook does not keep a closed manager alive."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        manager.close()
+        
+        ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        self.assertIsNone(ref())
+    
+    def test_exit_hook_closes_open_manager(self):
+        """Test that the exit hook writes pending feedback of an open manager."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        
+        manager._atexit_hook()
+        self.assertIsNone(manager._writer)
+        self.assertEqual(FeedbackManager(feedback_file=self.temp_path).get_feedback_count(), 1)
+    
     def test_clear_feedback(self):
         """Test clearing feedback."""
         manager = FeedbackManager(feedback_file=self.temp_path)
@@ -173,6 +270,107 @@ class TestFeedbackManager(unittest.TestCase):
             if export_path.exists():
                 export_path.unlink()
 
+    
+    def test_export_feedback_jsonl(self):
+        """Test that a .jsonl export is a verbatim copy of the stored records."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        manager.add_feedback('e5', PieceType.BLACK_PAWN, 0.7, PieceType.BLACK_KNIGHT)
+        
+        export_path = self.temp_path.parent / 'export_test.jsonl.gz'
+        try:
+            manager.export_feedback(export_path)
+            
+            with gzip.open(export_path, 'rb') as f:
+                exported = f.read()
+            self.assertEqual(exported, self.temp_path.read_bytes())
+        finally:
+            if export_path.exists():
+                export_path.unlink()
+    
+    def test_gzip_feedback_persistence(self):
+        """Test that a .gz feedback file is compressed and reloads correctly."""
+        gz_path = self.temp_path.with_suffix('.jsonl.gz')
+        try:
+            manager1 = FeedbackManager(feedback_file=gz_path)
+            manager1.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+            manager1.add_feedback('d5', PieceType.BLACK_PAWN, 0.7, PieceType.BLACK_BISHOP)
+            manager1.close()
+            
+            # File must be valid gzip holding one JSON record per line
+            with gzip.open(gz_path, 'rt') as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual([line['square_name'] for line in lines], ['e4', 'd5'])
+            
+            manager2 = FeedbackManager(feedback_file=gz_path)
+            self.assertEqual(manager2.get_feedback_count(), 2)
+            self.assertEqual(manager2.feedback_data[1].user_correction, PieceType.BLACK_BISHOP)
+        finally:
+            if gz_path.exists():
+                gz_path.unlink()
+    
+    def test_load_legacy_json_array(self):
+        """Test that a legacy JSON array file is loaded and migrated."""
+        legacy = [PieceFeedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT).to_dict()]
+        with open(self.temp_path, 'w') as f:
+            json.dump(legacy, f, indent=2)
+        
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        self.assertEqual(manager.get_feedback_count(), 1)
+        
+        # Appending after migration must keep the file loadable
+        manager.add_feedback('d4', PieceType.WHITE_ROOK, 0.5, PieceType.WHITE_QUEEN)
+        manager.close()
+        reloaded = FeedbackManager(feedback_file=self.temp_path)
+        self.assertEqual(reloaded.get_feedback_count(), 2)
+    
+    def test_default_store_migrates_legacy_file(self):
+        """Test that the old default JSON store is carried over to the new default."""
+        legacy = [PieceFeedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT).to_dict()]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            with open(output_dir / FeedbackManager.LEGACY_FEEDBACK_NAME, 'w') as f:
+                json.dump(legacy, f, indent=2)
+            
+            with mock.patch.object(feedback_manager, '_OUTPUT_DIR', output_dir):
+                with FeedbackManager() as manager:
+                    self.assertEqual(manager.get_feedback_count(), 1)
+                    manager.add_feedback('d4', PieceType.WHITE_ROOK, 0.5, PieceType.WHITE_QUEEN)
+                
+                self.assertTrue((output_dir / FeedbackManager.DEFAULT_FEEDBACK_NAME).exists())
+                with FeedbackManager() as reloaded:
+                    self.assertEqual(reloaded.get_feedback_count(), 2)
+    
+    def test_save_feedback_replaces_file_atomically(self):
+        """Test that a full rewrite leaves no temporary file behind."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT)
+        manager._save_feedback()
+        manager.close()
+        
+        self.assertFalse(Path(str(self.temp_path) + '.tmp').exists())
+        reloaded = FeedbackManager(feedback_file=self.temp_path)
+        reloaded.close()
+        self.assertEqual(reloaded.get_feedback_count(), 1)
+    
+    def test_load_large_legacy_json_array(self):
+        """Test loading a legacy JSON array above the streaming threshold."""
+        class StreamingFeedbackManager(FeedbackManager):
+            STREAM_LOAD_BYTES = 0
+        
+        legacy = [
+            PieceFeedback(square, PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT).to_dict()
+            for square in ('a1', 'b2', 'c3')
+        ]
+        with open(self.temp_path, 'w') as f:
+            json.dump(legacy, f, indent=2)
+        
+        manager = StreamingFeedbackManager(feedback_file=self.temp_path)
+        manager.close()
+        
+        self.assertEqual(manager.get_feedback_count(), 3)
+        self.assertIsInstance(manager.feedback_data[0].original_confidence, float)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,7 @@ Tests the enhanced feedback collection with square images.
 
 import unittest
 import tempfile
+import json
 import numpy as np
 from pathlib import Path
 import sys
@@ -16,7 +17,7 @@ import cv2
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from src.computer_vision.feedback_manager import FeedbackManager, PieceFeedback
-from src.computer_vision.piece_recognizer import PieceType
+from src.computer_vision.piece_recognizer import PieceRecognizer, PieceType
 
 
 class TestFeedbackWithImages(unittest.TestCase):
@@ -67,7 +68,8 @@ class TestFeedbackWithImages(unittest.TestCase):
         self.assertIsNotNone(feedback.square_image_path)
         self.assertEqual(feedback.board_orientation, 'white')
         
-        # Verify image file exists
+        # Verify image file exists once the background writer has caught up
+        manager.flush()
         image_path = self.temp_dir / feedback.square_image_path
         self.assertTrue(image_path.exists())
     
@@ -96,6 +98,81 @@ class TestFeedbackWithImages(unittest.TestCase):
             self.assertIsInstance(image, np.ndarray)
             self.assertEqual(label, PieceType.WHITE_KNIGHT)
     
+    def test_get_training_batch(self):
+        """Test that training samples are stacked at one size with label codes."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        
+        for i, size in enumerate((100, 60, 20)):
+            manager.add_feedback(
+                square_name=f'a{i+1}',
+                original_prediction=PieceType.WHITE_PAWN,
+                original_confidence=0.6,
+                user_correction=PieceType.BLACK_ROOK,
+                square_image=np.random.randint(0, 256, (size, size, 3), dtype=np.uint8)
+            )
+        
+        squares, labels, heights, natives = manager.get_training_batch(32, 40)
+        
+        self.assertEqual(squares.shape, (3, 32, 32, 3))
+        self.assertEqual(list(heights), [100, 60, 20])
+        self.assertTrue(np.all(labels == 1 + list(PieceType).index(PieceType.BLACK_ROOK)))
+        self.assertEqual(list(natives), [2])
+        self.assertEqual(natives[2].shape, (20, 20, 3))
+        
+        # Samples whose image is gone are dropped
+        manager.flush()
+        (self.temp_dir / manager.feedback_data[1].square_image_path).unlink()
+        squares, labels, heights, natives = manager.get_training_batch(32, 40)
+        self.assertEqual(list(heights), [100, 20])
+        self.assertEqual(len(squares), 2)
+        self.assertEqual(list(natives), [1])
+    
+    def test_batch_retraining_matches_list_retraining(self):
+        """Test that both retraining paths learn the same features from mixed sizes."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        rng = np.random.default_rng(0)
+        
+        corrections = (PieceType.WHITE_PAWN, PieceType.BLACK_KNIGHT)
+        for i, size in enumerate((20, 60, 100, 20, 60, 100)):
+            manager.add_feedback(
+                square_name=f'a{i+1}',
+                original_prediction=PieceType.EMPTY,
+                original_confidence=0.6,
+                user_correction=corrections[i % 2],
+                square_image=rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+            )
+        
+        expected = PieceRecognizer().retrain_from_feedback(manager.get_training_data())
+        
+        recognizer = PieceRecognizer()
+        squares, labels, heights, natives = manager.get_training_batch(
+            recognizer.feature_size, recognizer.max_native_size
+        )
+        result = recognizer.retrain_from_batch(squares, labels, heights, natives)
+        
+        self.assertEqual(result['piece_counts'], expected['piece_counts'])
+        for name, features in expected['learned_features'].items():
+            for key, summary in features.items():
+                for stat, value in summary.items():
+                    self.assertAlmostEqual(
+                        result['learned_features'][name][key][stat], value, places=6,
+                        msg=f"{name} {key} {stat}"
+                    )
+    
+    def test_webp_image_format(self):
+        """Test storing square images as WebP."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            feedback_file = Path(temp_dir) / 'feedback.jsonl'
+            with FeedbackManager(feedback_file=feedback_file, image_format='webp') as manager:
+                test_image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+                manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, test_image)
+                
+                training_data = manager.get_training_data()
+            
+            self.assertTrue(manager.feedback_data[0].square_image_path.endswith('.webp'))
+            self.assertEqual(len(training_data), 1)
+            self.assertEqual(training_data[0][0].shape, (100, 100, 3))
+    
     def test_add_feedback_without_image(self):
         """Test adding feedback without image (backward compatibility)."""
         manager = FeedbackManager(feedback_file=self.temp_path)
@@ -129,6 +206,7 @@ class TestFeedbackWithImages(unittest.TestCase):
         )
         
         image_path = manager1.feedback_data[0].square_image_path
+        manager1.close()
         
         # Create new manager and verify data loaded
         manager2 = FeedbackManager(feedback_file=self.temp_path)
@@ -175,6 +253,182 @@ class TestFeedbackWithImages(unittest.TestCase):
         for fb in misclassified:
             self.assertNotEqual(fb.original_prediction, fb.user_correction)
 
+    
+    def test_recorrection_supersedes_previous_feedback(self):
+        """Test that correcting the same square image again replaces the old entry."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        test_image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, test_image)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_BISHOP, test_image)
+        manager.close()
+        
+        self.assertEqual(manager.get_feedback_count(), 1)
+        self.assertEqual(manager.get_feedback_by_piece_type(PieceType.WHITE_KNIGHT), [])
+        
+        # Reloading replays the log and keeps only the latest correction
+        manager2 = FeedbackManager(feedback_file=self.temp_path)
+        self.assertEqual(manager2.get_feedback_count(), 1)
+        self.assertEqual(len(manager2.get_feedback_by_piece_type(PieceType.WHITE_BISHOP)), 1)
+        manager2.close()
+    
+    def test_exact_key_supersede(self):
+        """Test superseding by exact key when near-duplicate matching is disabled."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.HAMMING_THRESHOLD = 0
+        test_image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, test_image)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_BISHOP, test_image)
+        manager.close()
+        
+        self.assertEqual(manager.get_feedback_count(), 1)
+        self.assertEqual(manager.get_feedback_by_piece_type(PieceType.WHITE_KNIGHT), [])
+        self.assertEqual(len(manager.get_feedback_by_piece_type(PieceType.WHITE_BISHOP)), 1)
+    
+    def test_supersede_keeps_piece_type_order(self):
+        """Test that superseding an entry leaves the others of its type in order."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        images = [
+            np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8) for _ in range(3)
+        ]
+        for square, image in zip(('a1', 'b2', 'c3'), images):
+            manager.add_feedback(square, PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, image)
+        manager.add_feedback('b2', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_BISHOP, images[1])
+        manager.close()
+        
+        knights = manager.get_feedback_by_piece_type(PieceType.WHITE_KNIGHT)
+        self.assertEqual([fb.square_name for fb in knights], ['a1', 'c3'])
+        self.assertEqual(manager.get_correction_statistics()['by_piece_type'],
+                         {'WHITE_KNIGHT': 2, 'WHITE_BISHOP': 1})
+    
+    def test_statistics_exclude_superseded_feedback(self):
+        """Test that statistics stay current as corrections are superseded."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        test_image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, test_image)
+        self.assertEqual(manager.get_correction_statistics()['by_piece_type'], {'WHITE_KNIGHT': 1})
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.8, PieceType.WHITE_BISHOP, test_image)
+        manager.add_feedback('d5', PieceType.BLACK_PAWN, 0.4, PieceType.BLACK_ROOK)
+        stats = manager.get_correction_statistics()
+        manager.close()
+        
+        self.assertEqual(stats['total_corrections'], 2)
+        self.assertEqual(stats['by_piece_type'], {'WHITE_BISHOP': 1, 'BLACK_ROOK': 1})
+        self.assertAlmostEqual(stats['avg_original_confidence'], 0.6)
+    
+    def test_exact_image_hash(self):
+        """Test that exact hashing only supersedes byte-identical images."""
+        manager = FeedbackManager(feedback_file=self.temp_path, image_hash='exact')
+        test_image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        changed_image = test_image.copy()
+        changed_image[0, 0, 0] ^= 1
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, test_image)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_BISHOP, changed_image)
+        self.assertEqual(manager.get_feedback_count(), 2)
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_ROOK, test_image)
+        manager.close()
+        
+        self.assertEqual(manager.get_feedback_count(), 2)
+        self.assertEqual(manager.get_feedback_by_piece_type(PieceType.WHITE_KNIGHT), [])
+    
+    def test_image_hash_ignores_recompression(self):
+        """Test that re-captures of the same square share a perceptual hash."""
+        image = np.full((100, 100, 3), 60, dtype=np.uint8)
+        cv2.circle(image, (50, 45), 25, (220, 220, 220), -1)
+        cv2.rectangle(image, (30, 75), (70, 90), (220, 220, 220), -1)
+        
+        _, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 70])
+        recompressed = cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+        rescaled = cv2.resize(image, (80, 80))
+        
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        image_hash = manager._compute_image_hash(image)
+        self.assertLess(image_hash, 1 << 64)
+        self.assertEqual(manager._compute_image_hash(recompressed), image_hash)
+        self.assertEqual(manager._compute_image_hash(rescaled), image_hash)
+        self.assertEqual(manager._compute_image_hash(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)), image_hash)
+        manager.close()
+    
+    def test_near_duplicate_image_supersedes(self):
+        """Test that a re-capture of the same square supersedes the old correction."""
+        manager = FeedbackManager(feedback_file=self.temp_path, image_hash='phash')
+        image = np.full((100, 100, 3), 60, dtype=np.uint8)
+        cv2.circle(image, (50, 45), 25, (220, 220, 220), -1)
+        brighter = cv2.convertScaleAbs(image, alpha=1.0, beta=15)
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, image)
+        manager.add_feedback('d4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_KNIGHT, image)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.WHITE_BISHOP, brighter)
+        manager.close()
+        
+        # Only the e4 correction is replaced; d4 is a different square
+        self.assertEqual(manager.get_feedback_count(), 2)
+        self.assertEqual(len(manager.get_feedback_by_piece_type(PieceType.WHITE_KNIGHT)), 1)
+        
+        manager2 = FeedbackManager(feedback_file=self.temp_path, image_hash='phash')
+        self.assertEqual(manager2.get_feedback_count(), 2)
+        self.assertEqual(len(manager2.get_feedback_by_piece_type(PieceType.WHITE_BISHOP)), 1)
+        manager2.close()
+    
+    def test_distinct_flat_squares_both_kept(self):
+        """Test that empty squares from different screenshots are separate corrections."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        light = np.full((80, 80, 3), (210, 235, 238), dtype=np.uint8)
+        dark = np.full((64, 64, 3), (99, 136, 181), dtype=np.uint8)
+        
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.EMPTY, light)
+        manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, PieceType.EMPTY, dark)
+        
+        self.assertEqual(manager.get_feedback_count(), 2)
+        self.assertEqual(len(manager.get_training_data()), 2)
+        manager.close()
+    
+    def test_load_string_unique_keys(self):
+        """Test that keys stored as "<hash>_<square>" strings still supersede."""
+        records = [
+            {'square_name': 'e4', 'original_prediction': 'WHITE_PAWN', 'original_confidence': 0.6,
+             'user_correction': 'WHITE_KNIGHT', 'unique_key': '9e616169e696699a_e4'},
+            {'op': 'supersede', 'unique_key': '9e616169e696699a_e4'},
+            {'square_name': 'e4', 'original_prediction': 'WHITE_PAWN', 'original_confidence': 0.6,
+             'user_correction': 'WHITE_BISHOP', 'unique_key': ['9e616169e696699a', 28]}
+        ]
+        with open(self.temp_path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.close()
+        
+        self.assertEqual(manager.get_feedback_count(), 1)
+        active = manager.get_feedback_by_piece_type(PieceType.WHITE_BISHOP)[0]
+        self.assertEqual(active.unique_key, (0x9e616169e696699a, 28))
+    
+    def test_compact_drops_superseded_entries(self):
+        """Test that compaction rewrites the log without superseded entries."""
+        manager = FeedbackManager(feedback_file=self.temp_path)
+        manager.COMPACT_RATIO = 1.0  # Disable automatic compaction
+        test_image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        
+        for correction in (PieceType.WHITE_KNIGHT, PieceType.WHITE_BISHOP, PieceType.WHITE_ROOK):
+            manager.add_feedback('e4', PieceType.WHITE_PAWN, 0.6, correction, test_image)
+        manager.flush()
+        
+        with open(self.temp_path, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 5)
+        
+        self.assertTrue(manager.compact(force=True))
+        self.assertEqual(len(manager.feedback_data), 1)
+        with open(self.temp_path, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 1)
+        
+        self.assertFalse(manager.compact(force=True))
+        manager.close()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,10 +5,18 @@ Ensures that RecognitionResult handles None piece_type correctly.
 """
 
 import unittest
+import chess
+import cv2
+import numpy as np
 from src.computer_vision.piece_recognizer import (
     PieceRecognizer,
     RecognitionResult,
-    PieceType
+    PieceType,
+    _board_stats_loop,
+    _board_stats_opencv,
+    _score_board_loop,
+    _score_board_numpy,
+    _PIECE_CODES
 )
 
 
@@ -80,5 +88,235 @@ class TestRecognitionResult(unittest.TestCase):
         self.assertEqual(fen_char, 'P')
 
 
+
+class TestSquareFeatures(unittest.TestCase):
+    """Test cases for PieceRecognizer.analyze_square_features."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.recognizer = PieceRecognizer()
+        self.square = np.full((100, 100, 3), 180, dtype=np.uint8)
+        self.square[30:70, 30:70] = 20
+
+    def test_features_match_reference(self):
+        """Test that the features match straightforward NumPy computations."""
+        features = self.recognizer.analyze_square_features(self.square)
+        small = cv2.resize(self.square, (32, 32), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        
+        self.assertAlmostEqual(features['avg_brightness'], np.mean(gray))
+        self.assertAlmostEqual(features['brightness_variance'], np.var(gray))
+        self.assertAlmostEqual(features['dark_pixel_ratio'], np.mean(gray < 100))
+        self.assertAlmostEqual(features['center_darkness'], np.mean(gray[8:24, 8:24] < 100))
+        self.assertGreater(features['edge_density'], 0.0)
+
+    def test_edge_density_independent_of_resolution(self):
+        """Test that downscaling keeps the edge density comparable."""
+        features = self.recognizer.analyze_square_features(self.square)
+        gray = cv2.cvtColor(self.square, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+        
+        self.assertAlmostEqual(features['edge_density'], np.mean(edges > 0), delta=0.005)
+
+
+    def test_precomputed_features_give_same_estimates(self):
+        """Test that passing precomputed features does not change the estimates."""
+        features = self.recognizer.analyze_square_features(self.square)
+        
+        self.assertEqual(
+            self.recognizer.is_square_empty(self.square, features),
+            self.recognizer.is_square_empty(self.square)
+        )
+        self.assertEqual(
+            self.recognizer.estimate_piece_color(self.square, features),
+            self.recognizer.estimate_piece_color(self.square)
+        )
+
+    def test_strided_square_gives_same_result(self):
+        """Test that squares sliced out of a larger image are handled."""
+        board = np.zeros((200, 200, 3), dtype=np.uint8)
+        board[::2, ::2] = self.square
+        view = board[::2, ::2]
+        
+        result = self.recognizer.recognize_piece(view)
+        expected = self.recognizer.recognize_piece(self.square)
+        self.assertEqual(result.piece_type, expected.piece_type)
+        self.assertEqual(result.confidence, expected.confidence)
+
+    def test_board_score_kernels_agree(self):
+        """Test that the loop and NumPy board scorers agree."""
+        rng = np.random.default_rng(0)
+        features = np.column_stack([
+            rng.uniform(0.0, 0.4, 256),
+            rng.uniform(0.0, 1000.0, 256),
+            rng.uniform(0.0, 0.6, 256),
+            rng.uniform(50.0, 200.0, 256)
+        ])
+        
+        for min_confidence in (0.3, 0.5, 0.6):
+            codes, confidence = _score_board_loop(features, min_confidence)
+            expected_codes, expected_confidence = _score_board_numpy(features, min_confidence)
+            
+            np.testing.assert_array_equal(codes, expected_codes)
+            np.testing.assert_array_equal(confidence, expected_confidence)
+
+    def test_board_stats_kernels_agree(self):
+        """Test that the loop and OpenCV square statistics agree."""
+        rng = np.random.default_rng(0)
+        gray = rng.integers(0, 256, (3, 32, 32), dtype=np.uint8)
+        gray[1] = cv2.GaussianBlur(gray[1], (7, 7), 0)
+        gray[2] = 200
+        gray[2, 8:24, 10:22] = 30
+        
+        np.testing.assert_allclose(
+            _board_stats_loop(gray),
+            _board_stats_opencv(gray),
+            rtol=1e-9
+        )
+
+    def test_warmup(self):
+        """Test that warming up leaves recognition results unchanged."""
+        before = self.recognizer.recognize_piece(self.square)
+        self.recognizer.warmup()
+        after = self.recognizer.recognize_piece(self.square)
+        
+        self.assertEqual(after.piece_type, before.piece_type)
+        self.assertEqual(after.confidence, before.confidence)
+
+    def test_vectorized_board_matches_recognize_board(self):
+        """Test that batched board recognition agrees with the per-square path."""
+        rng = np.random.default_rng(0)
+        squares = []
+        for row in range(8):
+            squares.append([])
+            for col in range(8):
+                square = np.full((100, 100, 3), (row + col) % 2 * 150 + 50, dtype=np.uint8)
+                if col % 3 == 1:
+                    cv2.circle(square, (50, 50), 10 + 4 * row, (20, 20, 20), -1)
+                elif col % 3 == 2:
+                    square = rng.integers(0, 256, (100, 100, 3), dtype=np.uint8)
+                squares[row].append(square)
+        
+        expected = self.recognizer.recognize_board(squares)
+        results = self.recognizer.recognize_board_vectorized(squares)
+        
+        for expected_row, row in zip(expected, results):
+            for expected_result, result in zip(expected_row, row):
+                self.assertEqual(result.piece_type, expected_result.piece_type)
+                self.assertAlmostEqual(result.confidence, expected_result.confidence)
+
+
+
+class TestResultsToFen(unittest.TestCase):
+    """Test cases for PieceRecognizer.results_to_fen."""
+
+    def test_results_to_fen(self):
+        """Test FEN generation with pieces, empty and unknown squares."""
+        recognizer = PieceRecognizer()
+        board = chess.Board("r3k2r/pp3ppp/8/8/3Q4/8/PPP2PPP/R3K2R w KQkq - 0 1")
+        results = []
+        for rank in range(7, -1, -1):
+            row = []
+            for file in range(8):
+                piece = board.piece_at(chess.square(file, rank))
+                piece_type = PieceType.EMPTY
+                if piece is not None:
+                    piece_type = next(
+                        pt for pt in PieceType if pt.value[0] == piece.symbol()
+                    )
+                row.append(RecognitionResult(piece_type, 0.9))
+            results.append(row)
+        
+        # Unknown pieces are written as empty squares
+        results[4][2] = RecognitionResult(None, 0.1)
+        
+        self.assertEqual(
+            recognizer.results_to_fen(results),
+            "r3k2r/pp3ppp/8/8/3Q4/8/PPP2PPP/R3K2R w KQkq - 0 1"
+        )
+        self.assertEqual(recognizer.results_to_piece_map(results), board.piece_map())
+        
+        codes = recognizer.results_to_codes(results)
+        self.assertEqual(codes.shape, (8, 8))
+        self.assertEqual(codes[4, 2], -1)
+        self.assertEqual(
+            recognizer.codes_to_fen(codes[::-1, ::-1]),
+            "R2K3R/PPP2PPP/8/4Q3/8/8/ppp3pp/r2k3r w KQkq - 0 1"
+        )
+    
+    def test_flat_records(self):
+        """Test flat (piece code, confidence) records of a board."""
+        recognizer = PieceRecognizer()
+        board = chess.Board()
+        results = [
+            [
+                RecognitionResult(
+                    next(pt for pt in PieceType if pt.value[0] == piece.symbol())
+                    if (piece := board.piece_at(chess.square(file, rank))) is not None
+                    else PieceType.EMPTY,
+                    0.5 + file / 16
+                )
+                for file in range(8)
+            ]
+            for rank in range(7, -1, -1)
+        ]
+        results[3][5] = RecognitionResult(None, 0.2)
+        
+        records = recognizer.results_to_records(results)
+        
+        self.assertEqual(records.shape, (64,))
+        np.testing.assert_array_equal(
+            records['piece'], recognizer.results_to_codes(results).ravel()
+        )
+        restored = recognizer.record_to_result(records[3 * 8 + 5])
+        self.assertIsNone(restored.piece_type)
+        self.assertEqual(restored.confidence, 0.2)
+        self.assertEqual(recognizer.record_to_result(records[7]).piece_type, PieceType.BLACK_ROOK)
+        
+        # Replacing one record changes the FEN of the flat codes
+        records[8 * 4 + 4] = recognizer.result_to_record(
+            RecognitionResult(PieceType.WHITE_QUEEN, 1.0)
+        )
+        self.assertEqual(
+            recognizer.codes_to_fen(records['piece']).split()[0],
+            "rnbqkbnr/pppppppp/8/8/4Q3/8/PPPPPPPP/RNBQKBNR"
+        )
+    
+    def test_codes_to_fen_matches_python_chess(self):
+        """Test FEN generation on random boards against python-chess."""
+        recognizer = PieceRecognizer()
+        symbols = {
+            code: pt.value[0]
+            for pt, code in _PIECE_CODES.items()
+            if pt not in (None, PieceType.EMPTY)
+        }
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            codes = rng.integers(-1, 13, (8, 8)).astype(np.int8)
+            codes[rng.random((8, 8)) < 0.5] = 0
+            board = chess.Board(None)
+            for row in range(8):
+                for col in range(8):
+                    if codes[row, col] > 0:
+                        board.set_piece_at(
+                            chess.square(col, 7 - row),
+                            chess.Piece.from_symbol(symbols[int(codes[row, col])])
+                        )
+            self.assertEqual(recognizer.codes_to_fen(codes).split()[0], board.board_fen())
+    
+    def test_non_standard_grid(self):
+        """Test FEN generation for grids that are not 8x8."""
+        recognizer = PieceRecognizer()
+        rook = _PIECE_CODES[PieceType.WHITE_ROOK]
+        king = _PIECE_CODES[PieceType.BLACK_KING]
+        codes = np.array([[rook, 0, 0], [0, -1, king]], dtype=np.int8)
+        
+        self.assertEqual(recognizer.codes_to_fen(codes), "R2/2k w KQkq - 0 1")
+        results = [
+            [RecognitionResult(PieceType.EMPTY, 0.9), RecognitionResult(PieceType.WHITE_PAWN, 0.9)]
+        ]
+        self.assertEqual(recognizer.results_to_fen(results).split()[0], "1P")
+
+
 if __name__ == '__main__':
     unittest.main()
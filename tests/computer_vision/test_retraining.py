@@ -6,6 +6,7 @@ Tests the retraining functionality using feedback data.
 
 import unittest
 import numpy as np
+import cv2
 import sys
 import os
 
@@ -113,6 +114,37 @@ class TestRetraining(unittest.TestCase):
         self.assertIn('EMPTY', result['piece_counts'])
         self.assertEqual(result['piece_counts']['EMPTY'], 4)
 
+    
+    def test_batch_matches_list_retraining(self):
+        """Test that retraining from stacked arrays learns the same features."""
+        rng = np.random.default_rng(0)
+        images = [rng.integers(0, 256, (64, 64, 3), dtype=np.uint8) for _ in range(6)]
+        piece_types = [PieceType.WHITE_PAWN] * 4 + [PieceType.BLACK_KNIGHT] * 2
+        
+        expected = self.recognizer.retrain_from_feedback(list(zip(images, piece_types)))
+        
+        size = self.recognizer.feature_size
+        squares = np.stack([
+            cv2.resize(image, (size, size), interpolation=cv2.INTER_AREA) for image in images
+        ])
+        labels = np.array([1 + list(PieceType).index(pt) for pt in piece_types], dtype=np.int8)
+        result = PieceRecognizer().retrain_from_batch(squares, labels, np.full(6, 64))
+        
+        self.assertEqual(result['piece_counts'], expected['piece_counts'])
+        for name, features in expected['learned_features'].items():
+            for key, summary in features.items():
+                for stat, value in summary.items():
+                    self.assertAlmostEqual(
+                        result['learned_features'][name][key][stat], value, places=6,
+                        msg=f"{name} {key} {stat}"
+                    )
+    
+    def test_batch_with_no_data(self):
+        """Test batch retraining with no samples."""
+        result = self.recognizer.retrain_from_batch(
+            np.empty((0, 32, 32, 3), dtype=np.uint8), np.empty(0, dtype=np.int8), np.empty(0)
+        )
+        self.assertEqual(result['status'], 'failed')
 
 if __name__ == '__main__':
     unittest.main()
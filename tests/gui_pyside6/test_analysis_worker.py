@@ -0,0 +1,99 @@
+"""
+Unit tests for the PySide6 analysis worker.
+
+Runs the worker synchronously and checks which analyses it reports.
+"""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from PySide6.QtWidgets import QApplication
+    from src.gui_pyside6.analysis_worker import AnalysisWorker
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+FEN = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+OTHER_FEN = "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+
+
+@unittest.skipIf(not PYSIDE6_AVAILABLE, "PySide6 not available")
+class TestAnalysisWorker(unittest.TestCase):
+    """Test the analysis worker signals."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures."""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.worker = AnalysisWorker(num_moves=3)
+        self.finished = []
+        self.failed = []
+        self.worker.finished.connect(lambda *args: self.finished.append(args))
+        self.worker.failed.connect(lambda *args: self.failed.append(args))
+    
+    def test_requested_position_is_analyzed(self):
+        """Test that a requested position reports its summary and moves."""
+        self.worker.request(FEN)
+        self.worker.run(FEN)
+        
+        self.assertEqual(len(self.finished), 1)
+        fen, summary, moves = self.finished[0]
+        self.assertEqual(fen, FEN)
+        self.assertIsInstance(summary, str)
+        self.assertEqual(len(moves), 3)
+    
+    def test_superseded_position_is_skipped(self):
+        """Test that a run for a position no longer requested does nothing."""
+        self.worker.request(OTHER_FEN)
+        self.worker.run(FEN)
+        
+        self.worker.cancel()
+        self.worker.run(OTHER_FEN)
+        
+        self.assertEqual(self.finished, [])
+    
+    def test_cancel_stops_running_search(self):
+        """Test that cancelling during the move search discards the result."""
+        self.worker.request(FEN)
+        self.worker.run(FEN)
+        self.finished.clear()
+        
+        # Cancel from inside the search, as the main thread would mid-run
+        suggester = self.worker._move_suggester
+        analyzed = []
+        original_analyze_move = suggester.analyze_move
+        
+        def analyze_and_cancel(move):
+            analyzed.append(move)
+            self.worker.cancel()
+            return original_analyze_move(move)
+        
+        suggester.analyze_move = analyze_and_cancel
+        self.worker.request(FEN)
+        self.worker.run(FEN)
+        
+        self.assertEqual(len(analyzed), 1)
+        self.assertEqual(self.finished, [])
+    
+    def test_invalid_position_fails(self):
+        """Test that an invalid FEN is reported through failed."""
+        self.worker.request("not a fen")
+        self.worker.run("not a fen")
+        
+        self.assertEqual(len(self.failed), 1)
+        self.assertEqual(self.finished, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
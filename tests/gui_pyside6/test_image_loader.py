@@ -0,0 +1,160 @@
+"""
+Unit tests for the PySide6 image loader.
+
+Writes small images to a temporary directory and reads them back.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+import cv2
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from PySide6.QtWidgets import QApplication
+    from src.gui_pyside6.image_loader import ImageLoadWorker, decode_mapped, probe_image_size
+    from src.gui_pyside6.pipeline_cache import PipelineResultCache
+    from src.computer_vision.board_detector import BoardDetector
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+@unittest.skipIf(not PYSIDE6_AVAILABLE, "PySide6 not available")
+class TestImageFiles(unittest.TestCase):
+    """Test probing and decoding image files."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures."""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def _write(self, image: np.ndarray, name: str = 'board.png') -> str:
+        """Write an image to the temporary directory and return its path."""
+        path = os.path.join(self.temp_dir.name, name)
+        cv2.imwrite(path, image)
+        return path
+    
+    def test_probe_reads_header_size(self):
+        """Test that the probe reports (width, height) of the file."""
+        path = self._write(np.zeros((31, 45, 3), dtype=np.uint8))
+        
+        self.assertEqual(probe_image_size(path), (45, 31))
+    
+    def test_oversized_image_refused(self):
+        """Test that images over max_pixels are refused."""
+        path = self._write(np.zeros((100, 100, 3), dtype=np.uint8))
+        
+        with self.assertRaises(ValueError):
+            probe_image_size(path, max_pixels=5000)
+    
+    def test_unreadable_file_returns_none(self):
+        """Test that a file Qt cannot read gives None."""
+        path = os.path.join(self.temp_dir.name, 'not_an_image.png')
+        with open(path, 'wb') as f:
+            f.write(b'not an image')
+        
+        self.assertIsNone(probe_image_size(path))
+    
+    def test_decode_mapped_matches_imread(self):
+        """Test that decoding from a memory map matches cv2.imread."""
+        image = np.random.default_rng(0).integers(0, 256, (40, 60, 3), dtype=np.uint8)
+        path = self._write(image)
+        
+        np.testing.assert_array_equal(decode_mapped(path), cv2.imread(path))
+    
+    def test_decode_mapped_unreadable_returns_none(self):
+        """Test that an undecodable file gives None."""
+        path = os.path.join(self.temp_dir.name, 'not_an_image.png')
+        with open(path, 'wb') as f:
+            f.write(b'not an image')
+        
+        self.assertIsNone(decode_mapped(path))
+
+
+@unittest.skipIf(not PYSIDE6_AVAILABLE, "PySide6 not available")
+class TestImageLoadWorker(unittest.TestCase):
+    """Test the image load worker signals."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures."""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.worker = ImageLoadWorker(BoardDetector())
+        self.emitted = []
+        self.worker.loaded.connect(lambda *args: self.emitted.append(('loaded', args)))
+        self.worker.failed.connect(lambda *args: self.emitted.append(('failed', args)))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_loaded_at_working_size(self):
+        """Test that a loaded image is scaled and reported with its digest."""
+        path = os.path.join(self.temp_dir.name, 'board.png')
+        cv2.imwrite(path, np.full((400, 800, 3), 90, dtype=np.uint8))
+        
+        self.worker.run(path, 200)
+        
+        [(name, (file_path, image, scale, digest))] = self.emitted
+        self.assertEqual(name, 'loaded')
+        self.assertEqual(file_path, path)
+        self.assertEqual(image.shape, (100, 200, 3))
+        self.assertAlmostEqual(scale, 0.25)
+        self.assertEqual(digest, PipelineResultCache.digest_file(path))
+    
+    def test_unreadable_file_fails(self):
+        """Test that a file no decoder can read is reported through failed."""
+        path = os.path.join(self.temp_dir.name, 'not_an_image.png')
+        with open(path, 'wb') as f:
+            f.write(b'not an image')
+        
+        self.worker.run(path, 200)
+        
+        self.assertEqual([name for name, _ in self.emitted], ['failed'])
+    
+    def test_missing_file_fails(self):
+        """Test that a file removed before loading is reported through failed."""
+        path = os.path.join(self.temp_dir.name, 'removed.png')
+        
+        self.worker.run(path, 200)
+        
+        [(name, (file_path, message))] = self.emitted
+        self.assertEqual(name, 'failed')
+        self.assertEqual(file_path, path)
+    
+    def test_digest_error_fails(self):
+        """Test that a file that cannot be hashed is reported through failed."""
+        path = os.path.join(self.temp_dir.name, 'board.png')
+        cv2.imwrite(path, np.full((40, 40, 3), 90, dtype=np.uint8))
+        
+        with mock.patch.object(PipelineResultCache, 'digest_file', side_effect=PermissionError):
+            self.worker.run(path, 200)
+        
+        self.assertEqual([name for name, _ in self.emitted], ['failed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
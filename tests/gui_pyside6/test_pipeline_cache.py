@@ -0,0 +1,88 @@
+"""
+Unit tests for the persistent pipeline result cache.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.gui_pyside6.pipeline_cache import PipelineResultCache
+from src.computer_vision.piece_recognizer import PieceType, RecognitionResult
+
+
+class TestPipelineResultCache(unittest.TestCase):
+    """Test storing, loading and evicting pipeline results."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = PipelineResultCache(Path(self.temp_dir.name), max_entries=2)
+        
+        self.board_image = np.random.randint(0, 255, (80, 80, 3), dtype=np.uint8)
+        self.squares = [[self.board_image[r * 10:(r + 1) * 10, c * 10:(c + 1) * 10]
+                         for c in range(8)] for r in range(8)]
+        self.results = [[RecognitionResult(None, 0.9) for _ in range(8)] for _ in range(8)]
+        self.results[0][4] = RecognitionResult(PieceType.BLACK_KING, 0.75)
+        self.results[7][4] = RecognitionResult(PieceType.WHITE_KING, 0.5)
+        self.fen = "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+    
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_round_trip(self):
+        """Test that a stored result loads back unchanged."""
+        self.cache.store('key', self.board_image, self.squares, self.results, self.fen)
+        
+        board_image, squares, results, fen = self.cache.load('key')
+        
+        np.testing.assert_array_equal(board_image, self.board_image)
+        np.testing.assert_array_equal(squares[3][5], self.squares[3][5])
+        self.assertEqual(results[0][4].piece_type, PieceType.BLACK_KING)
+        self.assertIsNone(results[1][1].piece_type)
+        self.assertAlmostEqual(results[7][4].confidence, 0.5)
+        self.assertEqual(fen, self.fen)
+    
+    def test_miss_returns_none(self):
+        """Test that an unknown key is a cache miss."""
+        self.assertIsNone(self.cache.load('missing'))
+    
+    def test_least_recently_used_evicted(self):
+        """Test that only max_entries entries are kept."""
+        for i, key in enumerate(('a', 'b', 'c')):
+            self.cache.store(key, self.board_image, self.squares, self.results, self.fen)
+            npz_path = Path(self.temp_dir.name) / f'{key}.npz'
+            os.utime(npz_path, (i, i))
+        
+        self.cache._evict()
+        
+        self.assertIsNone(self.cache.load('a'))
+        self.assertIsNotNone(self.cache.load('c'))
+    
+    def test_clear(self):
+        """Test that clearing removes every entry."""
+        self.cache.store('key', self.board_image, self.squares, self.results, self.fen)
+        self.cache.clear()
+        
+        self.assertIsNone(self.cache.load('key'))
+        self.assertEqual(list(Path(self.temp_dir.name).iterdir()), [])
+    
+    def test_digest_depends_on_content(self):
+        """Test that the file digest changes with the file contents."""
+        path = Path(self.temp_dir.name) / 'image.bin'
+        path.write_bytes(b'first')
+        first = PipelineResultCache.digest_file(str(path))
+        path.write_bytes(b'second')
+        
+        self.assertNotEqual(first, PipelineResultCache.digest_file(str(path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the pipeline visualization widget.
+
+Tests the pixmap conversion cache used when stages are redisplayed.
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from PySide6.QtWidgets import QApplication
+    from src.gui_pyside6.widgets.pipeline_widget import PipelineVisualizationWidget
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+@unittest.skipIf(not PYSIDE6_AVAILABLE, "PySide6 not available")
+class TestPipelinePixmapCache(unittest.TestCase):
+    """Test pixmap caching in the pipeline widget."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures."""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.widget = PipelineVisualizationWidget()
+        self.image = np.full((40, 60, 3), 128, dtype=np.uint8)
+    
+    def test_stage_converted_once(self):
+        """Test that redisplaying a stage reuses its converted pixmap."""
+        self.widget.set_raw_image(self.image)
+        stage_image = self.widget.pipeline_stages["1. Raw Image"]
+        
+        first = self.widget._numpy_to_qpixmap(stage_image, max_width=300)
+        self.widget._display_all_stages()
+        second = self.widget._numpy_to_qpixmap(stage_image, max_width=300)
+        
+        self.assertEqual(first.cacheKey(), second.cacheKey())
+    
+    def test_replaced_stage_is_pruned(self):
+        """Test that pixmaps of replaced stage images are dropped."""
+        self.widget.set_raw_image(self.image)
+        old_image = self.widget.pipeline_stages["1. Raw Image"]
+        
+        self.widget.set_raw_image(self.image)
+        
+        self.assertNotIn(id(old_image), [key[0] for key in self.widget._pixmap_cache])
+    
+    def test_bgr_colors_preserved(self):
+        """Test that BGR stage images are displayed with the right colors."""
+        image = np.zeros((40, 60, 3), dtype=np.uint8)
+        image[:, :] = (10, 20, 30)  # B, G, R
+        
+        for view in (image, image[:, 5:45]):
+            color = self.widget._numpy_to_qpixmap(view).toImage().pixelColor(2, 2)
+            self.assertEqual((color.red(), color.green(), color.blue()), (30, 20, 10))
+    
+    def test_clear_empties_cache(self):
+        """Test that clearing the widget drops all cached pixmaps."""
+        self.widget.set_raw_image(self.image)
+        self.widget.clear()
+        
+        self.assertEqual(self.widget._pixmap_cache, {})
+    
+    def test_batch_defers_selector_update(self):
+        """Test that stages set inside a batch reach the selector at its end."""
+        self.widget.begin_batch()
+        self.widget.set_raw_image(self.image)
+        self.widget.set_board_region(self.image)
+        
+        self.assertFalse(self.widget.updatesEnabled())
+        self.assertEqual(self.widget.stage_selector.count(), 1)
+        
+        self.widget.end_batch()
+        self.widget.end_batch()  # Outside a batch this does nothing
+        
+        self.assertTrue(self.widget.updatesEnabled())
+        self.assertEqual(self.widget.stage_selector.count(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit tests for the PySide6 pipeline worker.
+
+Runs the worker synchronously and checks the stage signals it emits.
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from PySide6.QtWidgets import QApplication
+    from src.gui_pyside6.pipeline_worker import PipelineWorker
+    from src.computer_vision.board_detector import BoardDetector
+    from src.computer_vision.piece_recognizer import PieceRecognizer
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+@unittest.skipIf(not PYSIDE6_AVAILABLE, "PySide6 not available")
+class TestPipelineWorker(unittest.TestCase):
+    """Test the pipeline worker signals."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures."""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.worker = PipelineWorker(BoardDetector(), PieceRecognizer())
+        self.emitted = []
+        for name in ('preprocessed', 'contours_ready', 'board_ready',
+                     'recognized', 'fen_ready', 'failed'):
+            getattr(self.worker, name).connect(
+                lambda generation, *args, name=name: self.emitted.append((name, args))
+            )
+    
+    def _checkerboard(self, size: int = 400) -> np.ndarray:
+        """Create a plain 8x8 checkerboard BGR image."""
+        square = size // 8
+        board = np.zeros((size, size, 3), dtype=np.uint8)
+        for row in range(8):
+            for col in range(8):
+                if (row + col) % 2 == 0:
+                    board[row * square:(row + 1) * square,
+                          col * square:(col + 1) * square] = 220
+        return board
+    
+    def test_run_emits_every_stage(self):
+        """Test that a full run reports each stage and ends with a FEN."""
+        self.worker.run(self._checkerboard(), 'white')
+        
+        names = [name for name, _ in self.emitted]
+        self.assertEqual(
+            names,
+            ['preprocessed', 'contours_ready', 'board_ready', 'recognized', 'fen_ready']
+        )
+        
+        squares, results = self.emitted[3][1]
+        self.assertEqual(len(squares), 8)
+        self.assertEqual(len(results), 8)
+        self.assertIsInstance(self.emitted[4][1][0], str)
+    
+    def test_black_orientation_flips_results(self):
+        """Test that black-at-bottom data is normalized before it is emitted."""
+        image = self._checkerboard()
+        image[360:380, 360:380] = (0, 0, 255)  # Mark the bottom-right square
+        self.worker.run(image, 'white')
+        white_squares, white_results = dict(self.emitted)['recognized']
+        
+        self.emitted.clear()
+        self.worker.run(image, 'black')
+        black_squares, black_results = dict(self.emitted)['recognized']
+        
+        np.testing.assert_array_equal(black_squares[0][0], white_squares[7][7])
+        self.assertEqual(
+            [r.piece_type for r in black_results[0]],
+            [r.piece_type for r in reversed(white_results[7])]
+        )
+    
+    def test_rerun_reuses_cached_stages(self):
+        """Test that re-running the same image skips the cached stages."""
+        image = self._checkerboard()
+        detector = self.worker.board_detector
+        with mock.patch.object(detector, 'preprocess_image',
+                               wraps=detector.preprocess_image) as preprocess:
+            self.worker.run(image, 'white')
+            first_run_calls = preprocess.call_count
+            self.worker.run(image, 'white')
+            self.assertEqual(preprocess.call_count, first_run_calls)
+            
+            self.worker.clear_cache()
+            self.worker.run(image, 'white')
+            self.assertEqual(preprocess.call_count, 2 * first_run_calls)
+    
+    def test_known_squares_not_recognized_again(self):
+        """Test that squares seen before are served from the square cache."""
+        image = self._checkerboard()
+        self.worker.run(image, 'white')
+        first_results = dict(self.emitted)['recognized'][1]
+        
+        self.emitted.clear()
+        recognizer = self.worker.piece_recognizer
+        with mock.patch.object(recognizer, 'recognize_board_vectorized',
+                               wraps=recognizer.recognize_board_vectorized) as recognize:
+            self.worker.clear_cache()
+            self.worker.run(image.copy(), 'white')
+            self.assertEqual(recognize.call_count, 0)
+            
+            self.worker.clear_recognition_cache()
+            self.worker.run(image.copy(), 'white')
+            self.assertEqual(recognize.call_count, 1)
+        
+        self.assertEqual(
+            [[r.piece_type for r in row] for row in dict(self.emitted)['recognized'][1]],
+            [[r.piece_type for r in row] for row in first_results]
+        )
+    
+    def test_contours_detected_once_per_run(self):
+        """Test that board detection reuses the contours from stage 2."""
+        detector = self.worker.board_detector
+        with mock.patch.object(detector, 'detect_board_contours',
+                               wraps=detector.detect_board_contours) as detect_contours:
+            self.worker.run(self._checkerboard(), 'white')
+            self.assertEqual(detect_contours.call_count, 1)
+    
+    def test_full_image_fallback_in_one_detection(self):
+        """Test that a board-less image falls back to the full image in one call."""
+        detector = self.worker.board_detector
+        with mock.patch.object(detector, 'detect_board_contours', return_value=[]), \
+                mock.patch.object(detector, 'detect_board',
+                                  wraps=detector.detect_board) as detect_board:
+            self.worker.run(self._checkerboard(), 'white')
+            self.assertEqual(detect_board.call_count, 1)
+        
+        board_image, squares = dict(self.emitted)['board_ready']
+        self.assertEqual(board_image.shape[:2], (400, 400))
+        self.assertEqual(len(squares), 8)
+    
+    def test_warmup_prepares_recognizer_silently(self):
+        """Test that warmup runs the recognizer once without emitting results."""
+        recognizer = self.worker.piece_recognizer
+        with mock.patch.object(recognizer, 'warmup', wraps=recognizer.warmup) as warmup:
+            self.worker.warmup()
+            self.assertEqual(warmup.call_count, 1)
+        
+        self.assertEqual(self.emitted, [])
+    
+    def test_signals_carry_generation(self):
+        """Test that every signal of a run carries the run's generation."""
+        generations = []
+        for name in ('progress', 'preprocessed', 'contours_ready', 'board_ready',
+                     'recognized', 'fen_ready'):
+            getattr(self.worker, name).connect(
+                lambda generation, *args: generations.append(generation)
+            )
+        image = self._checkerboard()
+        self.worker.run(image, 'white', 7)
+        
+        self.assertEqual(set(generations), {7})
+        self.assertIs(dict(self.emitted)['preprocessed'][0], image)
+    
+    def test_failure_is_reported(self):
+        """Test that an exception in a stage is reported through failed."""
+        self.worker.run(None, 'auto')
+        
+        names = [name for name, _ in self.emitted]
+        self.assertEqual(names, ['failed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
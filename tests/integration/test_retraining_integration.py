@@ -37,6 +37,9 @@ class TestRetrainingIntegration(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test fixtures."""
+        # Let the background writer finish before removing its files
+        self.feedback_manager.close()
+        
         if self.temp_path.exists():
             self.temp_path.unlink()
         